@@ -13,8 +13,10 @@ from typing import Dict, Any, Optional, List
 
 from core.nlp.intent import Intent
 from core.nlp.argument_extractor import ArgumentExtractor
+from core.nlp.utterance import AnalyzedUtterance, as_utterance
 from core.context.follow_up import FollowUpContext
 from core.control.global_interrupt import GLOBAL_INTERRUPT
+from core.runtime.expiry import ExpiryService
 
 # OS execution layer
 from core.os.executor.guarded_executor import GuardedExecutor
@@ -38,10 +40,10 @@ REQUIRED_ARGS = {
 
 
 class ActionExecutor:
-    def __init__(self, config=None):
+    def __init__(self, config=None, expiry: ExpiryService | None = None):
         self.config = config
         self.argument_extractor = ArgumentExtractor(config)
-        self.follow_up_context = FollowUpContext()
+        self.follow_up_context = FollowUpContext(expiry=expiry)
         self.guarded_executor = GuardedExecutor()
 
         self.min_confidence = 0.3
@@ -59,7 +61,7 @@ class ActionExecutor:
     def execute(
         self,
         intent: Intent,
-        text: str,
+        text: str | AnalyzedUtterance,
         confidence: float,
         replay_args: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
@@ -83,12 +85,15 @@ class ActionExecutor:
             }
 
         # ---------------- ARGUMENT EXTRACTION ----------------
-        args = self.argument_extractor.extract_for_intent(text, intent.value) or {}
+        utterance = as_utterance(text)
+        args = self.argument_extractor.extract_for_intent(
+            utterance, intent.value
+        ) or {}
 
         # Single-word recovery for OPEN_APP
         if intent == Intent.OPEN_APP and not args.get("app_name"):
-            if text.strip() and len(text.split()) == 1:
-                args["app_name"] = text.strip()
+            if len(utterance.tokens) == 1:
+                args["app_name"] = utterance.raw.strip()
 
         if replay_args:
             args.update(replay_args)
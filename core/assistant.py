@@ -2,11 +2,11 @@ from loguru import logger
 
 from core.input.input_validator import InputValidator
 from core.input_controller import InputController
-from core.nlp.normalizer import normalize_text
+from core.nlp.utterance import AnalyzedUtterance
 from core.nlp.intent import Intent
 from core.context.short_term import ShortTermContext
-from core.context.long_term import save_message
-from core.intelligence.intent_scorer import score_intents, pick_best_intent
+from core.context.long_term import get_conversation_logger
+from core.intelligence.intent_scorer import get_intent_scorer
 from core.intelligence.confidence_refiner import refine_confidence
 from core.actions.action_executor import ActionExecutor
 
@@ -19,6 +19,8 @@ from core.response.final_envelope import FinalResponseEnvelope
 
 # 🧠 Knowledge bootstrap
 from core.knowledge.bootstrap import build_knowledge_engine
+from core.runtime.startup import timed_phase
+from core.runtime.expiry import get_expiry_service
 
 # 🔵 Memory
 from core.memory.short_term_memory import ShortTermMemory
@@ -70,10 +72,16 @@ class Assistant:
         self.ctx = ShortTermContext()
         self.input_validator = InputValidator()
 
-        self.action_executor = ActionExecutor()
+        # Day 91 — session TTLs fire from one timer wheel, ticked per turn
+        self.expiry = get_expiry_service()
+
+        self.action_executor = ActionExecutor(expiry=self.expiry)
+
+        # Day 94 — conversation rows are written behind the turn loop
+        self.conversation_log = get_conversation_logger()
 
         self.memory_manager = MemoryManager()
-        self.stm = ShortTermMemory()
+        self.stm = ShortTermMemory(expiry=self.expiry)
         self.memory_usage_mode = MemoryUsageMode.DISABLED
         self.memory_trace_sink = MemoryTraceSink()
         self.memory_promotion_evaluator = MemoryPromotionEvaluator()
@@ -81,7 +89,8 @@ class Assistant:
 
         # Knowledge (read-only)
         try:
-            self.knowledge = build_knowledge_engine()
+            with timed_phase("knowledge.bootstrap"):
+                self.knowledge = build_knowledge_engine()
         except Exception:
             logger.exception("Failed to bootstrap Knowledge Engine")
             self.knowledge = None
@@ -180,10 +189,18 @@ class Assistant:
     # =================================================
     def _cycle(self):
         raw_text = self.input.read()
+
+        # Evict whatever expired while waiting for input (same thread
+        # as every reader of STM / follow-up state)
+        self.expiry.tick()
+
         if not raw_text:
             return
 
-        validation = self.input_validator.validate(raw_text)
+        # One analysis per turn, shared by every stage below
+        utterance = AnalyzedUtterance.from_text(raw_text)
+
+        validation = self.input_validator.validate(utterance)
         if not validation["valid"]:
             self.respond(
                 text="Please repeat.",
@@ -192,7 +209,7 @@ class Assistant:
             return
 
         clean_text = validation["clean_text"]
-        lowered = clean_text.lower().strip()
+        lowered = utterance.text
 
         # =================================================
         # STEP 6 — EXPLAIN TOGGLE (META COMMAND)
@@ -233,9 +250,8 @@ class Assistant:
         # -------------------------------------------------
         # INTENT ROUTING
         # -------------------------------------------------
-        tokens = normalize_text(clean_text)
-        scores = score_intents(tokens)
-        intent, confidence = pick_best_intent(scores, tokens)
+        tokens = utterance.clean_tokens
+        intent, confidence = get_intent_scorer().pick(tokens)
         confidence = refine_confidence(
             confidence, tokens, intent.value, self.ctx.last_intent
         )
@@ -248,7 +264,7 @@ class Assistant:
                 ),
             )
 
-        save_message("user", clean_text, intent.value)
+        self.conversation_log.log("user", clean_text, intent.value)
 
         if intent == Intent.EXIT:
             self.respond(
@@ -258,7 +274,9 @@ class Assistant:
             self.running = False
             return
 
-        result = self.action_executor.execute(intent, clean_text, confidence)
+        result = self.action_executor.execute(
+            intent, utterance.cleaned(), confidence
+        )
         message = result.get("message", "Done.")
 
         self.respond(
@@ -266,11 +284,12 @@ class Assistant:
             explain=ExplainSurface.from_action(message),
         )
 
-        save_message("assistant", message, intent.value)
+        self.conversation_log.log("assistant", message, intent.value)
 
     def run(self):
         logger.info("Day 40 — Persona & Voice frozen")
         while self.running:
             self._cycle()
-            
+
+        self.conversation_log.flush()
         logger.info("Assistant has stopped.")
\ No newline at end of file
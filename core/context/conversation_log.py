@@ -0,0 +1,228 @@
+"""
+Day 94 — Write-behind conversation logging.
+
+The turn loop enqueues messages; a background worker writes them
+in batches (one multi-row INSERT per batch), so database latency
+never reaches the response path.
+
+Durability modes:
+- "async": write-behind (default). Queued rows are flushed on
+  close() / interpreter exit; a hard crash can lose at most the
+  rows still queued
+- "sync":  every log() writes its row before returning (old behaviour)
+
+Backpressure: when the queue is full, log() waits up to
+`put_timeout` seconds for room, then drops the row. Both events
+are counted in stats().
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (role, text, intent)
+ConversationRow = Tuple[str, str, str]
+BatchWriter = Callable[[Sequence[ConversationRow]], None]
+
+DURABILITY_ENV = "RUDRA_CONVERSATION_DURABILITY"
+
+_WAKE = object()
+
+
+class DurabilityMode(str, Enum):
+    ASYNC = "async"
+    SYNC = "sync"
+
+    @classmethod
+    def from_env(cls) -> "DurabilityMode":
+        value = os.getenv(DURABILITY_ENV, cls.ASYNC.value).strip().lower()
+        try:
+            return cls(value)
+        except ValueError:
+            logger.warning("Unknown %s=%r; using async", DURABILITY_ENV, value)
+            return cls.ASYNC
+
+
+@dataclass(frozen=True)
+class ConversationLogStats:
+    queued: int
+    max_queued: int
+    written: int
+    batches: int
+    failed: int
+    dropped: int
+    backpressure_waits: int
+
+
+class ConversationLogger:
+    def __init__(
+        self,
+        writer: BatchWriter,
+        *,
+        durability: DurabilityMode = DurabilityMode.ASYNC,
+        max_pending: int = 1024,
+        batch_size: int = 64,
+        flush_interval: float = 0.5,
+        put_timeout: float = 0.05,
+    ):
+        self._writer = writer
+        self.durability = DurabilityMode(durability)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._put_timeout = put_timeout
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._closed = threading.Event()
+        # Held across the closed check and the put, so no row can be
+        # queued once close() has marked the logger closed
+        self._put_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._max_queued = 0
+        self._written = 0
+        self._batches = 0
+        self._failed = 0
+        self._dropped = 0
+        self._waits = 0
+
+        self._thread: threading.Thread | None = None
+        if self.durability is DurabilityMode.ASYNC:
+            self._thread = threading.Thread(
+                target=self._run, name="conversation-log", daemon=True
+            )
+            self._thread.start()
+
+    # -------------------------------------------------
+    # PRODUCER (turn loop)
+    # -------------------------------------------------
+    def log(self, role: str, text: str, intent: str) -> bool:
+        """
+        Record one message; returns False if it was dropped.
+        """
+        row = (role, text, intent)
+
+        if self.durability is DurabilityMode.SYNC:
+            self._write([row])
+            return True
+
+        with self._put_lock:
+            if self._closed.is_set():
+                self._count(dropped=1)
+                return False
+
+            try:
+                self._queue.put_nowait(row)
+            except queue.Full:
+                self._count(waits=1)
+                try:
+                    self._queue.put(row, timeout=self._put_timeout)
+                except queue.Full:
+                    self._count(dropped=1)
+                    logger.warning("Conversation log queue full; message dropped")
+                    return False
+
+        depth = self._queue.qsize()
+        if depth > self._max_queued:
+            self._max_queued = depth
+        return True
+
+    def flush(self) -> None:
+        """
+        Block until every row logged so far has been handled.
+        Returns at once if the worker has already stopped.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Stop accepting rows and write out everything queued.
+        """
+        with self._put_lock:
+            if self._closed.is_set():
+                return
+            self._closed.set()
+
+        if self._thread is not None:
+            try:
+                self._queue.put_nowait(_WAKE)
+            except queue.Full:
+                pass  # worker is busy, not waiting
+            self._thread.join(timeout)
+
+    def stats(self) -> ConversationLogStats:
+        with self._stats_lock:
+            return ConversationLogStats(
+                queued=self._queue.qsize(),
+                max_queued=self._max_queued,
+                written=self._written,
+                batches=self._batches,
+                failed=self._failed,
+                dropped=self._dropped,
+                backpressure_waits=self._waits,
+            )
+
+    # -------------------------------------------------
+    # WORKER
+    # -------------------------------------------------
+    def _count(self, *, dropped: int = 0, waits: int = 0) -> None:
+        with self._stats_lock:
+            self._dropped += dropped
+            self._waits += waits
+
+    def _write(self, rows: List[ConversationRow]) -> None:
+        try:
+            self._writer(rows)
+        except Exception:
+            with self._stats_lock:
+                self._failed += len(rows)
+            logger.exception("Conversation log write failed (%d rows)", len(rows))
+            if self.durability is DurabilityMode.SYNC:
+                raise
+            return
+
+        with self._stats_lock:
+            self._written += len(rows)
+            self._batches += 1
+
+    def _next_batch(self) -> Tuple[List[ConversationRow], int]:
+        """
+        Up to batch_size rows; also returns how many queue items were taken.
+        """
+        rows: List[ConversationRow] = []
+        taken = 0
+        deadline = time.monotonic() + self._flush_interval
+
+        while len(rows) < self._batch_size:
+            timeout = 0 if self._closed.is_set() else deadline - time.monotonic()
+            try:
+                item = (
+                    self._queue.get(timeout=timeout)
+                    if timeout > 0 else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            taken += 1
+            if item is not _WAKE:
+                rows.append(item)
+            elif not rows:
+                break  # woken for close(): re-check state
+        return rows, taken
+
+    def _run(self) -> None:
+        while True:
+            rows, taken = self._next_batch()
+            if rows:
+                self._write(rows)
+            for _ in range(taken):
+                self._queue.task_done()
+            # Once closed is seen no more rows can arrive (_put_lock),
+            # so an empty queue here is final
+            if not taken and self._closed.is_set() and self._queue.empty():
+                return
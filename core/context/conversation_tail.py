@@ -0,0 +1,124 @@
+"""
+Day 98 — Write-through tail cache of recent conversation rows.
+
+The newest `capacity` rows, newest last. Once primed (from one
+database read), every successful write is appended, so reads of up
+to `capacity` rows are served from memory.
+
+Only writes made through this process are seen; the cache assumes
+it is the single writer (one assistant per database), like the rest
+of the session state.
+"""
+
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Generic, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_TAIL_SIZE = 50
+
+
+class ConversationTail(Generic[T]):
+    def __init__(self, capacity: int = DEFAULT_TAIL_SIZE):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._rows: Deque[T] = deque(maxlen=capacity)
+        self._primed = False
+        self._lock = threading.Lock()
+        # Bumped per write, so a load that raced a write is not used
+        # to prime (the write may be missing from it)
+        self._generation = 0
+        # Writes between writing() entry and their append(): a load
+        # taken meanwhile may already hold their rows
+        self._writers = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def primed(self) -> bool:
+        return self._primed
+
+    def prime(self, newest_first: Iterable[T]) -> None:
+        """
+        Load the stored tail (as read: newest first).
+        """
+        with self._lock:
+            self._prime(newest_first)
+
+    def _prime(self, newest_first: Iterable[T]) -> None:
+        self._rows.clear()
+        self._rows.extend(reversed(list(newest_first)[: self.capacity]))
+        self._primed = True
+
+    @contextmanager
+    def writing(self) -> Iterator[None]:
+        """
+        Wrap a write from before its commit to its append(), so a
+        priming read cannot see the rows and then get them appended.
+        """
+        with self._lock:
+            self._generation += 1
+            self._writers += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._writers -= 1
+
+    def append(self, rows: Iterable[T]) -> None:
+        """
+        Record committed rows (oldest first). Ignored until primed:
+        the older rows are not known yet.
+        """
+        with self._lock:
+            self._generation += 1
+            if self._primed:
+                self._rows.extend(rows)
+
+    def recent(self, limit: int) -> List[T] | None:
+        """
+        Newest-first rows, or None when the cache cannot answer
+        (not primed, or deeper than the cached tail).
+        """
+        with self._lock:
+            if not self._primed or limit > self.capacity:
+                self.misses += 1
+                return None
+            self.hits += 1
+            count = min(limit, len(self._rows))
+            return [self._rows[-1 - i] for i in range(count)]
+
+    def get_or_load(
+        self, limit: int, load: Callable[[int], List[T]]
+    ) -> List[T]:
+        """
+        Cached rows, else `load(n)` (newest first) — which also
+        primes the cache when it covers the whole tail.
+        """
+        if limit <= 0:
+            return []
+
+        rows = self.recent(limit)
+        if rows is not None:
+            return rows
+
+        with self._lock:
+            primed, generation = self._primed, self._generation
+            writing = self._writers > 0
+
+        rows = load(limit if primed else max(limit, self.capacity))
+
+        if not primed and not writing:
+            with self._lock:
+                if not self._primed and self._generation == generation:
+                    self._prime(rows)
+        return rows[:limit]
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._rows.clear()
+            self._primed = False
@@ -6,6 +6,9 @@ Day 53 adds:
 ✔ PendingAction slot filling
 ✔ yes / no handling for pending actions
 ✔ NO regression to replay safety
+
+Day 91: with an ExpiryService, expired contexts are evicted by timer;
+reads only check the newest context's age (O(1)).
 """
 
 import re
@@ -14,6 +17,8 @@ from datetime import datetime, timedelta
 from enum import Enum
 
 from core.context.pending_action import PendingAction
+from core.nlp.utterance import AnalyzedUtterance, as_utterance, lowered_text
+from core.runtime.expiry import ExpiryService, TimerHandle
 
 
 # ==========================================================
@@ -28,6 +33,11 @@ class ReferenceType(Enum):
     DEMONSTRATIVE = "demonstrative"
 
 
+# Single words that make PRONOUN / LOCATION (and therefore ACTION) match.
+# ACTION always implies PRONOUN, so only OBJECT still needs its regex.
+REFERENCE_WORDS = frozenset({"it", "that", "this", "them", "there", "here"})
+
+
 # ==========================================================
 # INTENT → ALLOWED ENTITY KEYS (STRICT)
 # ==========================================================
@@ -75,6 +85,7 @@ class FollowUpContext:
         context_timeout: int = 300,
         max_replays: int = 3,
         replay_window: int = 30,
+        expiry: Optional[ExpiryService] = None,
     ):
         self.contexts: List[Dict[str, Any]] = []
         self.max_contexts = max_contexts
@@ -84,6 +95,10 @@ class FollowUpContext:
         self.max_replays = max_replays
         self.replay_window = replay_window
 
+        # Day 91 — proactive expiry (context id -> timer)
+        self._expiry = expiry
+        self._timers: Dict[int, TimerHandle] = {}
+
         # 🟦 Day 53 — pending action (slot filling)
         self.pending_action: Optional[PendingAction] = None
 
@@ -102,7 +117,9 @@ class FollowUpContext:
     # 🟦 DAY 53 — PENDING ACTION HANDLING
     # ======================================================
 
-    def resolve_pending_action(self, text: str) -> Optional[PendingAction]:
+    def resolve_pending_action(
+        self, text: str | AnalyzedUtterance
+    ) -> Optional[PendingAction]:
         """
         Handles follow-ups like:
         - "chrome"
@@ -114,7 +131,7 @@ class FollowUpContext:
         if not self.pending_action or not self.pending_action.is_active():
             return None
 
-        reply = text.lower().strip()
+        reply = lowered_text(text)
 
         # ❌ Cancel
         if reply in self.NO:
@@ -181,7 +198,15 @@ class FollowUpContext:
         }
 
         self.contexts.insert(0, context)
-        self.contexts = self.contexts[: self.max_contexts]
+        for dropped in self.contexts[self.max_contexts:]:
+            self._cancel_timer(dropped)
+        del self.contexts[self.max_contexts:]
+
+        if self._expiry is not None:
+            self._timers[id(context)] = self._expiry.schedule(
+                self.context_timeout, lambda: self._expire_context(context)
+            )
+            return context
 
         self._cleanup_old_contexts()
         return context
@@ -190,15 +215,20 @@ class FollowUpContext:
     # CONTEXT RESOLUTION (DAY 15.4)
     # ======================================================
 
-    def resolve_reference(self, text: str) -> Tuple[Optional[Dict[str, Any]], str]:
-        self._cleanup_old_contexts()
+    def resolve_reference(
+        self, text: str | AnalyzedUtterance
+    ) -> Tuple[Optional[Dict[str, Any]], str]:
+        if self._expiry is None:
+            self._cleanup_old_contexts()
 
-        if not self.contexts:
+        # Newest first: if the newest is stale, all are (timer pending)
+        if not self.contexts or self._is_stale(self.contexts[0]):
             return None, "no_context"
 
-        text_lower = text.lower().strip()
+        utterance = as_utterance(text)
+        text_lower = utterance.text
 
-        if not any(p.search(text_lower) for p in self.reference_patterns.values()):
+        if not self._has_reference(utterance):
             return None, "no_reference"
 
         candidate = self.contexts[0]
@@ -221,6 +251,23 @@ class FollowUpContext:
         self._mark_replay(candidate)
         return candidate, "resolved"
 
+    def _has_reference(self, utterance: AnalyzedUtterance) -> bool:
+        """
+        Same result as matching every reference pattern,
+        using the utterance word set instead of four regex scans.
+        """
+        if not REFERENCE_WORDS.isdisjoint(utterance.words):
+            return True
+
+        if "the" in utterance.words:
+            return bool(
+                self.reference_patterns[ReferenceType.OBJECT].search(
+                    utterance.text
+                )
+            )
+
+        return False
+
     # ======================================================
     # REPLAY CONTROL
     # ======================================================
@@ -266,6 +313,10 @@ class FollowUpContext:
     # CLEANUP
     # ======================================================
 
+    def _is_stale(self, ctx: Dict[str, Any]) -> bool:
+        age = datetime.now() - ctx["timestamp"]
+        return age >= timedelta(seconds=self.context_timeout)
+
     def _cleanup_old_contexts(self):
         now = datetime.now()
         self.contexts = [
@@ -274,6 +325,18 @@ class FollowUpContext:
             if now - ctx["timestamp"] < timedelta(seconds=self.context_timeout)
         ]
 
+    def _expire_context(self, context: Dict[str, Any]):
+        self._timers.pop(id(context), None)
+        self.contexts = [ctx for ctx in self.contexts if ctx is not context]
+
+    def _cancel_timer(self, context: Dict[str, Any]):
+        timer = self._timers.pop(id(context), None)
+        if timer is not None:
+            timer.cancel()
+
     def clear_context(self):
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
         self.contexts.clear()
         self.pending_action = None
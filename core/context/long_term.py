@@ -1,23 +1,155 @@
-from typing import List
-from sqlalchemy import select
-from core.storage.mysql import get_session, get_engine
-from core.storage.models import Base, Conversation
+import atexit
+import threading
+from datetime import datetime
+from typing import List, Sequence
+from sqlalchemy import insert, select, tuple_
+from core.context.conversation_log import (
+    ConversationLogger,
+    ConversationRow,
+    DurabilityMode,
+)
+from core.context.conversation_tail import ConversationTail
+from core.storage.archive import CompactionReport, compact_conversations
+from core.storage.mysql import get_session
+from core.storage.models import Conversation
 
-# Ensure tables exist (run once on import)
-engine = get_engine()
-Base.metadata.create_all(bind=engine)
+# Tables are created on first use (core.storage.mysql.ensure_schema)
+
+# Day 98 — newest rows, fed by the writes below. Cached rows carry
+# the id and created_at the database assigned, read back in the
+# write transaction, so they match what _load_recent returns.
+_TAIL: ConversationTail[Conversation] = ConversationTail()
+
+
+def _insert(session, rows: Sequence[ConversationRow]) -> List[Conversation]:
+    """
+    One multi-row INSERT; returns detached copies of the stored rows
+    (oldest first).
+    """
+    values = [
+        {"role": role, "text": text, "intent": intent}
+        for role, text, intent in rows
+    ]
+    stmt = insert(Conversation)
+
+    if session.get_bind().dialect.insert_executemany_returning:
+        stored = session.execute(
+            stmt.returning(
+                Conversation.id,
+                Conversation.created_at,
+                sort_by_parameter_order=True,
+            ),
+            values,
+        ).all()
+    else:
+        # MySQL: no RETURNING. A multi-row INSERT gets consecutive
+        # ids and reports the first one as lastrowid
+        first = session.execute(stmt.values(values)).lastrowid
+        stored = session.execute(
+            select(Conversation.id, Conversation.created_at)
+            .where(Conversation.id.between(first, first + len(values) - 1))
+            .order_by(Conversation.id)
+        ).all()
+
+    return [
+        Conversation(id=row_id, created_at=created_at, **value)
+        for (row_id, created_at), value in zip(stored, values)
+    ]
 
 def save_message(role: str, text: str, intent: str):
-    with get_session() as session:
-        session.add(
-            Conversation(role=role, text=text, intent=intent)
-        )
+    save_messages([(role, text, intent)])
 
-def recent_messages(limit: int = 5) -> List[Conversation]:
-    with get_session() as session:
+def save_messages(rows: Sequence[ConversationRow]) -> None:
+    """
+    Day 94 — one transaction, one multi-row INSERT.
+    """
+    if not rows:
+        return
+    with _TAIL.writing():
+        with get_session() as session:
+            stored = _insert(session, rows)
+        _TAIL.append(stored)
+
+def _load_recent(limit: int) -> List[Conversation]:
+    with get_session(readonly=True) as session:
         stmt = (
             select(Conversation)
-            .order_by(Conversation.created_at.desc())
+            .order_by(Conversation.created_at.desc(), Conversation.id.desc())
             .limit(limit)
         )
         return list(session.scalars(stmt))
+
+def messages_before(message_id: int, limit: int = 5) -> List[Conversation]:
+    """
+    Newest-first rows older than message `message_id`: a keyset read
+    on ix_conversations_created_at, so its cost depends on `limit`,
+    not on how deep into the history it starts.
+    """
+    if limit <= 0:
+        return []
+
+    # The anchor's own stored created_at, compared like with like
+    anchor = (
+        select(Conversation.created_at)
+        .where(Conversation.id == message_id)
+        .scalar_subquery()
+    )
+    stmt = (
+        select(Conversation)
+        .where(
+            tuple_(Conversation.created_at, Conversation.id)
+            < tuple_(anchor, message_id)
+        )
+        .order_by(Conversation.created_at.desc(), Conversation.id.desc())
+        .limit(limit)
+    )
+    with get_session(readonly=True) as session:
+        return list(session.scalars(stmt))
+
+def recent_messages(limit: int = 5) -> List[Conversation]:
+    """
+    Newest first. Up to the tail size this is served from memory
+    (after one priming read); older rows are read with
+    messages_before(), starting after the oldest cached row.
+    """
+    if limit <= _TAIL.capacity:
+        return _TAIL.get_or_load(limit, _load_recent)
+
+    rows = _TAIL.get_or_load(_TAIL.capacity, _load_recent)
+    if len(rows) < _TAIL.capacity:
+        return rows  # the whole history
+    return rows + messages_before(rows[-1].id, limit - len(rows))
+
+def compact_history(cutoff: datetime, **options) -> CompactionReport:
+    """
+    Day 99 — archive rows older than `cutoff` (core.storage.archive).
+    """
+    try:
+        return compact_conversations(cutoff, **options)
+    finally:
+        # Archived rows may have been in the cached tail
+        _TAIL.invalidate()
+
+
+# -------------------------------------------------
+# Day 94 — write-behind logger (turn loop entry point)
+# -------------------------------------------------
+_LOGGER: ConversationLogger | None = None
+_LOGGER_LOCK = threading.Lock()
+
+
+def get_conversation_logger() -> ConversationLogger:
+    """
+    Process-wide logger; flushed and closed at interpreter exit.
+    Durability comes from RUDRA_CONVERSATION_DURABILITY (async | sync).
+    """
+    global _LOGGER
+
+    if _LOGGER is None:
+        with _LOGGER_LOCK:
+            if _LOGGER is None:
+                _LOGGER = ConversationLogger(
+                    save_messages, durability=DurabilityMode.from_env()
+                )
+                atexit.register(_LOGGER.close)
+    return _LOGGER
@@ -8,8 +8,9 @@ class GlobalInterruptState(Enum):
     HARD = auto()
 
 
-# Backward compatibility alias
+# Backward compatibility aliases
 GlobalInterrupt = GlobalInterruptState
+InterruptType = GlobalInterruptState
 
 
 class GlobalInterruptController:
@@ -3,6 +3,8 @@ Global interrupt vocabulary.
 These phrases bypass intent, NLP, and slot logic.
 """
 
+from core.nlp.phrase_matcher import PhraseMatcher
+
 INTERRUPT_KEYWORDS = {
     "stop",
     "cancel",
@@ -12,3 +14,21 @@ INTERRUPT_KEYWORDS = {
     "ruk ja",
     "band karo"
 }
+
+# Whole-word hits only: "stop" must not fire on "stopwatch"
+_INTERRUPT_MATCHER = PhraseMatcher(INTERRUPT_KEYWORDS, whole_words=True)
+
+
+def find_interrupt_keyword(text: str) -> str | None:
+    """
+    First interrupt phrase present in the text, if any.
+    """
+    if not text:
+        return None
+
+    match = _INTERRUPT_MATCHER.first(text)
+    return match.phrase if match else None
+
+
+def contains_interrupt_keyword(text: str) -> bool:
+    return find_interrupt_keyword(text) is not None
@@ -1,5 +1,6 @@
 from core.dialogue.dialogue_turn import DialogueTurn, Speaker
 from core.dialogue.dialogue_types import DialogueIntent
+from core.nlp.utterance import AnalyzedUtterance, lowered_text
 
 
 class DialogueEngine:
@@ -14,7 +15,9 @@ class DialogueEngine:
     - Deterministic resolution only
     """
 
-    def resolve(self, text: str, context: dict) -> DialogueTurn:
+    def resolve(
+        self, text: str | AnalyzedUtterance, context: dict
+    ) -> DialogueTurn:
         intent = self._extract_intent(text)
         response_plan = self._plan_response(intent)
 
@@ -29,12 +32,14 @@ class DialogueEngine:
     # Internal helpers (pure functions)
     # -------------------------------
 
-    def _extract_intent(self, text: str) -> DialogueIntent:
+    def _extract_intent(
+        self, text: str | AnalyzedUtterance
+    ) -> DialogueIntent:
         """
         Meaning extraction only.
         No guessing, no ML, no side effects.
         """
-        normalized = text.lower().strip()
+        normalized = lowered_text(text)
 
         if "how are you" in normalized:
             return DialogueIntent.EMOTIONAL_CHECK
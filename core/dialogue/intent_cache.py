@@ -3,6 +3,8 @@
 import time
 from typing import Optional
 
+from core.runtime.expiry import ExpiryService, TimerHandle
+
 
 class IntentCache:
     """
@@ -11,17 +13,31 @@ class IntentCache:
     - In-memory only
     - Auto-expiring
     - Deterministic
+
+    Day 91 — optional ExpiryService clears the intent proactively.
     """
 
-    def __init__(self, ttl_sec: float = 10.0):
+    def __init__(self, ttl_sec: float = 10.0, expiry: Optional[ExpiryService] = None):
         self._ttl = ttl_sec
         self._intent: Optional[str] = None
         self._timestamp: float = 0.0
 
+        self._expiry = expiry
+        self._timer: Optional[TimerHandle] = None
+
     def set(self, intent: str) -> None:
         self._intent = intent
         self._timestamp = time.time()
 
+        if self._expiry is not None:
+            self._timer = self._expiry.reschedule(
+                self._timer, self._ttl, self._expire
+            )
+
+    def _expire(self) -> None:
+        self._timer = None
+        self._intent = None
+
     def get(self) -> Optional[str]:
         if not self._intent:
             return None
@@ -4,6 +4,8 @@ import time
 from dataclasses import dataclass, field
 from typing import Optional
 
+from core.runtime.expiry import ExpiryService, TimerHandle
+
 
 @dataclass
 class SessionDialogueState:
@@ -15,18 +17,45 @@ class SessionDialogueState:
     - No persistence
     - No persona access
     - Auto-expiring
+
+    Day 91 — with an ExpiryService, the reset happens proactively when
+    the TTL elapses (ttl_sec changes are honoured when the timer fires).
     """
 
     topic: Optional[str] = None
     last_intent: Optional[str] = None
     last_updated: float = field(default_factory=time.time)
     ttl_sec: float = 120.0  # default context lifetime
+    expiry: Optional[ExpiryService] = field(
+        default=None, repr=False, compare=False
+    )
+    _timer: Optional[TimerHandle] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def update(self, *, topic: Optional[str], intent: Optional[str]) -> None:
         self.topic = topic or self.topic
         self.last_intent = intent or self.last_intent
         self.last_updated = time.time()
 
+        if self.expiry is not None:
+            self._timer = self.expiry.reschedule(
+                self._timer, self.ttl_sec, self._on_timer
+            )
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        remaining = self.last_updated + self.ttl_sec - time.time()
+
+        if remaining > 0:
+            # TTL was extended after the timer was set
+            self._timer = self.expiry.schedule(remaining, self._on_timer)
+            return
+
+        self.topic = None
+        self.last_intent = None
+        self.last_updated = time.time()
+
     def is_expired(self) -> bool:
         return (time.time() - self.last_updated) > self.ttl_sec
 
@@ -1,6 +1,9 @@
 # core/dialogue/silence_detector.py
 
 import time
+from typing import Callable, Optional
+
+from core.runtime.expiry import ExpiryService, TimerHandle
 
 
 class SilenceDetector:
@@ -9,14 +12,40 @@ class SilenceDetector:
 
     Determines whether enough time has passed
     to consider the conversation paused/reset.
+
+    Day 91 — with an ExpiryService, `on_silence` is called once the
+    threshold passes without activity (no polling of is_silent()).
     """
 
-    def __init__(self, silence_threshold_sec: float = 5.0):
+    def __init__(
+        self,
+        silence_threshold_sec: float = 5.0,
+        *,
+        expiry: Optional[ExpiryService] = None,
+        on_silence: Optional[Callable[[], None]] = None,
+    ):
         self._threshold = max(0.0, silence_threshold_sec)
         self._last_activity = time.time()
 
+        self._expiry = expiry
+        self._on_silence = on_silence
+        self._timer: Optional[TimerHandle] = None
+        self._arm()
+
+    def _arm(self) -> None:
+        if self._expiry is None or self._on_silence is None:
+            return
+        self._timer = self._expiry.reschedule(
+            self._timer, self._threshold, self._fire
+        )
+
+    def _fire(self) -> None:
+        self._timer = None
+        self._on_silence()
+
     def mark_activity(self) -> None:
         self._last_activity = time.time()
+        self._arm()
 
     def is_silent(self) -> bool:
         return (time.time() - self._last_activity) >= self._threshold
@@ -1,22 +1,22 @@
 from typing import List
+
+from core.nlp.phrase_matcher import PhraseMatcher
 from .dependency_signals import DependencySignals
 
 
 class SafetyDetector:
     """
     Deterministic signal detector.
+
+    Signals are compiled once into a phrase automaton;
+    detection is a single pass over the text.
     """
 
+    _matcher = PhraseMatcher(DependencySignals.all_signals())
+
     @staticmethod
     def detect(text: str) -> List[str]:
         if not isinstance(text, str):
             return []
 
-        lowered = text.lower()
-        hits = []
-
-        for signal in DependencySignals.all_signals():
-            if signal in lowered:
-                hits.append(signal)
-
-        return hits
+        return SafetyDetector._matcher.matched_phrases(text)
@@ -1,5 +1,7 @@
 from typing import Dict
 
+from core.nlp.utterance import AnalyzedUtterance, as_utterance
+
 
 EXPLAIN_COMMANDS = {
     "explain",
@@ -19,7 +21,9 @@ class InputValidator:
     def _is_explain_request(self, text: str) -> bool:
         return text in EXPLAIN_COMMANDS
 
-    def validate(self, raw_text: str) -> Dict[str, str | bool]:
+    def validate(
+        self, raw_text: str | AnalyzedUtterance
+    ) -> Dict[str, str | bool]:
         if not raw_text:
             self._last_result = "rejected"
             return {
@@ -30,7 +34,8 @@ class InputValidator:
             }
 
         # Basic string cleanup ONLY (no NLP here)
-        clean_text = raw_text.strip().lower()
+        utterance = as_utterance(raw_text)
+        clean_text = utterance.text
 
         if not clean_text:
             self._last_result = "rejected"
@@ -53,7 +58,7 @@ class InputValidator:
                 "is_explain_request": False,
             }
 
-        words = clean_text.split()
+        words = utterance.tokens
 
         # Too few words — EXCEPT explain commands
         if not is_explain_request and len(words) < 1:
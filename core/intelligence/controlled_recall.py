@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from datetime import datetime
 
 from core.memory.usage_mode import MemoryUsageMode
@@ -16,24 +16,7 @@ from core.memory.recall.recall_manager import MemoryRecallManager
 from core.memory.trace import MemoryUsageTrace
 
 
-def controlled_recall(
-    *,
-    system_mode: MemoryUsageMode,
-    permit: Optional[MemoryPermit],
-    query: RecallQuery,
-    trace_sink,  # MemoryTraceSink (duck-typed)
-) -> List[RecallResult]:
-    """
-    The ONLY authorized entry point for memory recall.
-
-    Guarantees:
-    - explicit opt-in
-    - read-only recall
-    - no intent / confidence mutation
-    - safe degradation
-    - auditable (trace recorded)
-    """
-
+def _authorize(system_mode: MemoryUsageMode, permit: Optional[MemoryPermit]) -> None:
     # 1️⃣ Global memory switch
     ensure_memory_allowed(system_mode)
 
@@ -51,8 +34,10 @@ def controlled_recall(
     if permit.is_expired():
         raise PermissionError("Memory permit has expired")
 
+
+def _scope(query: RecallQuery, permit: MemoryPermit) -> RecallQuery:
     # 5️⃣ Scoped, immutable query
-    scoped_query = RecallQuery(
+    return RecallQuery(
         text=query.text,
         match_mode=query.match_mode,
         category=query.category,
@@ -60,25 +45,81 @@ def controlled_recall(
         limit=permit.max_results or query.limit,
     )
 
+
+def _trace(permit: MemoryPermit, query: RecallQuery, results) -> MemoryUsageTrace:
+    # 🧾 Day 25.5 — Emit trace (session-owned, ephemeral)
+    return MemoryUsageTrace(
+        permit_mode=permit.mode,
+        query_text=query.text,
+        query_category=query.category,
+        result_ids=[r.memory_id for r in results],
+        timestamp=datetime.utcnow(),
+        consumer="intelligence",
+    )
+
+
+def controlled_recall(
+    *,
+    system_mode: MemoryUsageMode,
+    permit: Optional[MemoryPermit],
+    query: RecallQuery,
+    trace_sink,  # MemoryTraceSink (duck-typed)
+    manager: Optional[MemoryRecallManager] = None,
+) -> List[RecallResult]:
+    """
+    The ONLY authorized entry point for memory recall.
+
+    Guarantees:
+    - explicit opt-in
+    - read-only recall
+    - no intent / confidence mutation
+    - safe degradation
+    - auditable (trace recorded)
+    """
+
+    _authorize(system_mode, permit)
+    scoped_query = _scope(query, permit)
+
     # 6️⃣ Safe recall execution
     try:
-        manager = MemoryRecallManager()
+        manager = manager or MemoryRecallManager()
         results = manager.recall(scoped_query)
 
-        # 🧾 Day 25.5 — Emit trace (session-owned, ephemeral)
-        trace = MemoryUsageTrace(
-            permit_mode=permit.mode,
-            query_text=query.text,
-            query_category=query.category,
-            result_ids=[r.memory_id for r in results],
-            timestamp=datetime.utcnow(),
-            consumer="intelligence",
-        )
-
-        trace_sink.record(trace)
+        trace_sink.record(_trace(permit, query, results))
 
         return results
 
     except Exception:
         # 🔒 Never leak recall failures upward
         return []
+
+
+def controlled_recall_many(
+    *,
+    system_mode: MemoryUsageMode,
+    permit: Optional[MemoryPermit],
+    queries: Sequence[RecallQuery],
+    trace_sink,  # MemoryTraceSink (duck-typed)
+    manager: Optional[MemoryRecallManager] = None,
+) -> List[List[RecallResult]]:
+    """
+    Day 90 — several recalls under one permit check, served in one
+    batched manager call. Same guarantees as controlled_recall();
+    one trace per query.
+    """
+
+    _authorize(system_mode, permit)
+    scoped = [_scope(q, permit) for q in queries]
+
+    try:
+        manager = manager or MemoryRecallManager()
+        batches = manager.recall_many(scoped)
+
+        for query, results in zip(queries, batches):
+            trace_sink.record(_trace(permit, query, results))
+
+        return batches
+
+    except Exception:
+        # 🔒 Never leak recall failures upward
+        return [[] for _ in queries]
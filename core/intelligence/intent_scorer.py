@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, Iterable, List, Tuple
 from core.nlp.intent import Intent
 
 # -------------------------------------------------
@@ -88,28 +88,176 @@ INTENT_KEYWORDS: Dict[Intent, List[str]] = {
 }
 
 # -------------------------------------------------
-# SCORING
+# EVIDENCE WEIGHTS
 # -------------------------------------------------
-def score_intents(tokens: List[str]) -> Dict[Intent, int]:
-    scores: Dict[Intent, int] = {i: 0 for i in Intent}
+HARD_GUARD_WEIGHT = 3
+KEYWORD_WEIGHT = 1
+VERB_ALIAS_WEIGHT = 1
+
+
+# -------------------------------------------------
+# COMPILED SCORER
+# -------------------------------------------------
+class CompiledIntentScorer:
+    """
+    Inverted-index intent scorer.
+
+    - Folds HARD_GUARDS, INTENT_KEYWORDS and VERB_ALIASES into
+      one token -> ((intent, weight), ...) index at construction
+    - Scores an utterance in a single pass over its tokens
+    - Results are identical to the table-walking scorer
+    - Tables are read once; call recompile() after mutating them
+    """
+
+    def __init__(
+        self,
+        *,
+        hard_guards: Dict[str, Intent] | None = None,
+        intent_keywords: Dict[Intent, List[str]] | None = None,
+        verb_aliases: Dict[str, Intent] | None = None,
+        intent_priority: Dict[Intent, int] | None = None,
+    ):
+        self._hard_guards = HARD_GUARDS if hard_guards is None else hard_guards
+        self._intent_keywords = (
+            INTENT_KEYWORDS if intent_keywords is None else intent_keywords
+        )
+        self._verb_aliases = (
+            VERB_ALIASES if verb_aliases is None else verb_aliases
+        )
+        self._intent_priority = (
+            INTENT_PRIORITY if intent_priority is None else intent_priority
+        )
+
+        self._index: Dict[str, Tuple[Tuple[Intent, int], ...]] = {}
+        self._rank: Dict[Intent, Tuple[int, int]] = {}
+        self.recompile()
 
-    # 1) Hard guards (highest impact)
-    for t in tokens:
-        if t in HARD_GUARDS:
-            scores[HARD_GUARDS[t]] += 3
+    # -------------------------------------------------
+    # BUILD
+    # -------------------------------------------------
+    def recompile(self) -> None:
+        """
+        Rebuild the token index from the source tables.
+        """
+        merged: Dict[str, Dict[Intent, int]] = {}
+
+        def add(token: str, intent: Intent, weight: int) -> None:
+            bucket = merged.setdefault(token, {})
+            bucket[intent] = bucket.get(intent, 0) + weight
+
+        for token, intent in self._hard_guards.items():
+            add(token, intent, HARD_GUARD_WEIGHT)
+
+        for intent, keywords in self._intent_keywords.items():
+            # membership semantics: a duplicated keyword counts once
+            for token in dict.fromkeys(keywords):
+                add(token, intent, KEYWORD_WEIGHT)
+
+        for token, intent in self._verb_aliases.items():
+            add(token, intent, VERB_ALIAS_WEIGHT)
+
+        self._index = {
+            token: tuple(bucket.items())
+            for token, bucket in merged.items()
+        }
+
+        # Tie-break key: priority first, then declaration order
+        # (earlier Intent members win, matching dict iteration order)
+        self._rank = {
+            intent: (self._intent_priority.get(intent, 0), -ordinal)
+            for ordinal, intent in enumerate(Intent)
+        }
+
+    # -------------------------------------------------
+    # SCORING
+    # -------------------------------------------------
+    def score_sparse(self, tokens: Iterable[str]) -> Dict[Intent, int]:
+        """
+        Scores for intents with evidence only (no zero slots).
+        """
+        scores: Dict[Intent, int] = {}
+        index = self._index
 
-    # 2) Keyword evidence
-    for intent, keywords in INTENT_KEYWORDS.items():
         for t in tokens:
-            if t in keywords:
-                scores[intent] += 1
+            hits = index.get(t)
+            if hits is None:
+                continue
+            for intent, weight in hits:
+                scores[intent] = scores.get(intent, 0) + weight
+
+        return scores
+
+    def score(self, tokens: Iterable[str]) -> Dict[Intent, int]:
+        """
+        Dense scores (every Intent present), same shape as score_intents.
+        """
+        scores: Dict[Intent, int] = dict.fromkeys(Intent, 0)
+        scores.update(self.score_sparse(tokens))
+        return scores
+
+    def pick(self, tokens: List[str]) -> Tuple[Intent, float]:
+        """
+        Best intent and confidence, identical to
+        pick_best_intent(score_intents(tokens), tokens).
+        """
+        scores = self.score_sparse(tokens)
+        if not scores:
+            return Intent.UNKNOWN, 0.0
+
+        best_score = max(scores.values())
+        if best_score <= 0:
+            return Intent.UNKNOWN, 0.0
+
+        rank = self._rank
+        best_intent = max(
+            (i for i, s in scores.items() if s == best_score),
+            key=rank.__getitem__,
+        )
+
+        if best_intent == Intent.EXIT:
+            return best_intent, 1.0
+
+        confidence = min(
+            1.0,
+            (best_score + rank[best_intent][0]) / (len(tokens) + 2)
+        )
+
+        return best_intent, confidence
+
+    def score_batch(
+        self, batch: Iterable[List[str]]
+    ) -> List[Dict[Intent, int]]:
+        return [self.score(tokens) for tokens in batch]
+
+    def pick_batch(
+        self, batch: Iterable[List[str]]
+    ) -> List[Tuple[Intent, float]]:
+        pick = self.pick
+        return [pick(tokens) for tokens in batch]
+
+
+_SCORER = CompiledIntentScorer()
+
+
+def get_intent_scorer() -> CompiledIntentScorer:
+    return _SCORER
+
+
+# -------------------------------------------------
+# SCORING
+# -------------------------------------------------
+def score_intents(tokens: List[str]) -> Dict[Intent, int]:
+    return _SCORER.score(tokens)
 
-    # 3) Verb aliases
-    for t in tokens:
-        if t in VERB_ALIASES:
-            scores[VERB_ALIASES[t]] += 1
 
-    return scores
+def score_intents_batch(
+    batch: Iterable[List[str]],
+) -> List[Dict[Intent, int]]:
+    """
+    Score many token lists against the shared compiled index.
+    Intended for offline replay of conversation logs.
+    """
+    return _SCORER.score_batch(batch)
 
 
 def pick_best_intent(scores: Dict[Intent, int], tokens: List[str]):
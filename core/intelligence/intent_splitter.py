@@ -1,6 +1,8 @@
 import re
 from typing import List
 
+from core.nlp.utterance import AnalyzedUtterance, lowered_text
+
 CONNECTORS = [
     r"\band then\b",
     r"\bthen\b",
@@ -9,11 +11,13 @@ CONNECTORS = [
     r"\bnext\b",
 ]
 
+_CONNECTOR_PATTERN = re.compile("|".join(CONNECTORS))
+
+
 class IntentSplitter:
-    def split(self, text: str) -> List[str]:
-        normalized = text.lower().strip()
+    def split(self, text: str | AnalyzedUtterance) -> List[str]:
+        normalized = lowered_text(text)
 
-        pattern = "|".join(CONNECTORS)
-        parts = re.split(pattern, normalized)
+        parts = _CONNECTOR_PATTERN.split(normalized)
 
         return [p.strip() for p in parts if p.strip()]
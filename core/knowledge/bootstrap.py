@@ -1,9 +1,154 @@
 # core/knowledge/bootstrap.py
 
+import logging
 from pathlib import Path
+from typing import Dict, List, Tuple
 
-from core.knowledge.loader import load_dharma_csv
+from core.knowledge.csv_format import CsvFormat
+from core.knowledge.loader import DHARMA_FORMAT
+from core.knowledge.gita_loader import GITA_FORMAT
+from core.knowledge.upanishad_loader import UPANISHAD_FORMAT
+from core.knowledge.yoga_loader import YOGA_FORMAT
 from core.knowledge.engine import KnowledgeEngine
+from core.knowledge.ingest import ingest_corpora, ingest_csv
+from core.knowledge.retrieval import BM25Index
+from core.knowledge.snapshot import (
+    default_snapshot_path,
+    read_snapshot,
+    read_snapshot_header,
+    source_hash,
+    write_snapshot,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# corpus name -> (CSV file, validation contract of its loader)
+SCRIPTURE_CORPORA: Dict[str, Tuple[str, CsvFormat]] = {
+    "dharma_base": ("dharma_base.csv", DHARMA_FORMAT),
+    "gita": ("gita.csv", GITA_FORMAT),
+    "upanishads": ("upanishads.csv", UPANISHAD_FORMAT),
+    "yoga_sutras": ("yoga_sutras.csv", YOGA_FORMAT),
+}
+
+
+def dharma_data_dir() -> Path:
+    project_root = Path(__file__).resolve().parents[2]
+    return project_root / "data" / "dharma"
+
+
+def corpus_source(corpus: str, data_dir: Path | None = None) -> Path:
+    data_dir = Path(data_dir) if data_dir else dharma_data_dir()
+    filename, _ = SCRIPTURE_CORPORA[corpus]
+
+    csv_path = data_dir / filename
+    if not csv_path.exists():
+        raise FileNotFoundError(f"Scripture CSV not found at {csv_path}")
+    return csv_path
+
+
+def load_corpus(
+    corpus: str,
+    data_dir: Path | None = None,
+    *,
+    use_snapshot: bool = True,
+    write: bool = True,
+) -> List:
+    """
+    Validated rows for one scripture corpus.
+
+    - Snapshot hit: one file read, no CSV parsing / validation
+    - Miss or stale: CSV is ingested + validated, snapshot rewritten
+      (large files are validated in parallel chunks)
+    """
+
+    data_dir = Path(data_dir) if data_dir else dharma_data_dir()
+    csv_path = corpus_source(corpus, data_dir)
+    snapshot_path = default_snapshot_path(data_dir, corpus)
+
+    if use_snapshot:
+        rows = read_snapshot(snapshot_path, [csv_path])
+        if rows is not None:
+            return rows
+
+    content_hash = source_hash([csv_path])
+    _, fmt = SCRIPTURE_CORPORA[corpus]
+    rows = ingest_csv(csv_path, fmt)
+
+    if write:
+        _write_snapshot_safely(snapshot_path, rows, csv_path, content_hash)
+
+    return rows
+
+
+def _write_snapshot_safely(snapshot_path, rows, csv_path, content_hash=None):
+    try:
+        write_snapshot(snapshot_path, rows, [csv_path], content_hash)
+    except OSError:
+        logger.warning("Could not write knowledge snapshot", exc_info=True)
+
+
+def corpus_topics(corpus: str, data_dir: Path | None = None) -> List[str] | None:
+    """
+    Normalized topics of a corpus from its snapshot header only
+    (None when no valid snapshot exists yet).
+    """
+    data_dir = Path(data_dir) if data_dir else dharma_data_dir()
+    header = read_snapshot_header(
+        default_snapshot_path(data_dir, corpus),
+        [corpus_source(corpus, data_dir)],
+    )
+    return header["topics"] if header else None
+
+
+def corpus_version(corpus: str, data_dir: Path | None = None) -> str:
+    """
+    Content hash of a corpus CSV (from the snapshot header when valid,
+    so usually no file hashing).
+    """
+    data_dir = Path(data_dir) if data_dir else dharma_data_dir()
+    csv_path = corpus_source(corpus, data_dir)
+    header = read_snapshot_header(
+        default_snapshot_path(data_dir, corpus), [csv_path]
+    )
+    return header["hash"] if header else source_hash([csv_path])
+
+
+def load_corpora(
+    data_dir: Path | None = None,
+    *,
+    use_snapshot: bool = True,
+    write: bool = True,
+) -> Dict[str, List]:
+    """
+    Validated rows for every scripture corpus, in declaration order.
+    Corpora without a valid snapshot are ingested concurrently.
+    """
+    data_dir = Path(data_dir) if data_dir else dharma_data_dir()
+
+    corpora: Dict[str, List | None] = {}
+    pending: Dict[str, Tuple[Path, CsvFormat]] = {}
+
+    for corpus, (_, fmt) in SCRIPTURE_CORPORA.items():
+        csv_path = corpus_source(corpus, data_dir)
+        rows = None
+        if use_snapshot:
+            rows = read_snapshot(
+                default_snapshot_path(data_dir, corpus), [csv_path]
+            )
+        corpora[corpus] = rows
+        if rows is None:
+            pending[corpus] = (csv_path, fmt)
+
+    for corpus, rows in ingest_corpora(pending).items():
+        corpora[corpus] = rows
+        if write:
+            csv_path, _ = pending[corpus]
+            _write_snapshot_safely(
+                default_snapshot_path(data_dir, corpus), rows, csv_path
+            )
+
+    return corpora
 
 
 def build_knowledge_engine() -> KnowledgeEngine:
@@ -12,14 +157,35 @@ def build_knowledge_engine() -> KnowledgeEngine:
     Called ONCE at startup.
     """
 
-    project_root = Path(__file__).resolve().parents[2]
-    dharma_dir = project_root / "data" / "dharma"
-    csv_path = dharma_dir / "dharma_base.csv"
+    csv_path = dharma_data_dir() / "dharma_base.csv"
 
     if not csv_path.exists():
         raise FileNotFoundError(f"Dharma CSV not found at {csv_path}")
 
-    # load_dharma_csv RETURNS List[DharmaRow]
-    rows = load_dharma_csv(path=str(csv_path))
+    from core.knowledge.registry import get_knowledge_registry
+
+    # Shared with every other front end in this process
+    return get_knowledge_registry().engine("dharma_base")
+
+
+def build_scripture_index(data_dir: Path | None = None) -> BM25Index:
+    """
+    Full-text BM25 index over every scripture corpus.
+    Each CSV goes through its own validating loader (or the snapshot).
+    """
+
+    from core.knowledge.registry import (
+        KnowledgeRegistry,
+        get_knowledge_registry,
+    )
+
+    registry = (
+        KnowledgeRegistry(data_dir) if data_dir else get_knowledge_registry()
+    )
+    index = BM25Index()
+
+    for corpus in registry.corpora:
+        index.add(corpus, registry.rows(corpus))
 
-    return KnowledgeEngine(rows)
+    index.optimize()
+    return index
@@ -0,0 +1,45 @@
+import csv
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, List
+
+from core.knowledge.exceptions import KnowledgeValidationError
+
+
+@dataclass(frozen=True)
+class CsvFormat:
+    """
+    Validation contract of one corpus CSV.
+
+    parse_row(record, i) builds a row from one DictReader record
+    (i = 1-based record number) and raises on invalid data.
+    Must be a module-level function (picklable for worker processes).
+    """
+
+    required: FrozenSet[str]
+    parse_row: Callable[[Dict[str, str], int], object]
+    schema_error: str
+    empty_error: str
+
+
+def check_header(fieldnames, fmt: CsvFormat) -> None:
+    if not fmt.required.issubset(fieldnames or []):
+        raise KnowledgeValidationError(fmt.schema_error)
+
+
+def read_csv(path: str, fmt: CsvFormat) -> List:
+    """
+    Sequential load: parse + validate every record in file order.
+    """
+    rows: List = []
+
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        check_header(reader.fieldnames, fmt)
+
+        for i, r in enumerate(reader, start=1):
+            rows.append(fmt.parse_row(r, i))
+
+    if not rows:
+        raise KnowledgeValidationError(fmt.empty_error)
+
+    return rows
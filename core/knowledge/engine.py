@@ -1,5 +1,6 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from core.knowledge.schema import DharmaRow
+from core.knowledge.verse_index import VerseIndex, parse_verse_reference
 
 
 class KnowledgeEngine:
@@ -10,11 +11,53 @@ class KnowledgeEngine:
     - NO generation
     - NO guessing
     - NO inference beyond stored rows
+
+    Rows are indexed once at construction:
+    - normalized question -> first matching row
+    - normalized topic    -> rows (in load order)
+    - normalized topic    -> pre-aggregated answer block
+    - (work, chapter, verse) from citations -> rows (sorted, bisect)
     """
 
     def __init__(self, rows: List[DharmaRow]):
         self._rows = rows
 
+        self._by_question: Dict[str, DharmaRow] = {}
+        self._by_topic: Dict[str, Tuple[DharmaRow, ...]] = {}
+        self._topic_blocks: Dict[str, str] = {}
+        self._verses = VerseIndex()
+
+        self._build_indexes()
+
+    # -------------------------------------------------
+    # INDEX BUILD (ONCE)
+    # -------------------------------------------------
+    def _build_indexes(self) -> None:
+        by_topic: Dict[str, List[DharmaRow]] = {}
+
+        for r in self._rows:
+            # First row wins, same as the original linear scan
+            self._by_question.setdefault(r.question.lower(), r)
+            by_topic.setdefault(r.topic.lower(), []).append(r)
+
+        self._by_topic = {t: tuple(rs) for t, rs in by_topic.items()}
+        self._topic_blocks = {
+            t: self._aggregate(rs) for t, rs in self._by_topic.items()
+        }
+        self._verses = VerseIndex(self._rows)
+
+    @staticmethod
+    def _aggregate(rows: Tuple[DharmaRow, ...]) -> str:
+        # Deterministic aggregation
+        parts = []
+        for r in rows:
+            parts.append(f"- {r.answer}")
+
+            if r.citation:
+                parts.append(f"  ({r.citation})")
+
+        return "\n".join(parts)
+
     # -------------------------------------------------
     # EXACT QUESTION MATCH (STRICT)
     # -------------------------------------------------
@@ -23,17 +66,16 @@ class KnowledgeEngine:
         Exact question lookup.
         Returns a single answer only if the question matches exactly.
         """
-        q = query.lower().strip()
+        r = self._by_question.get(query.lower().strip())
 
-        for r in self._rows:
-            if q == r.question.lower():
-                return {
-                    "answer": r.answer,
-                    "citation": r.citation,
-                    "topic": r.topic,
-                }
+        if r is None:
+            return None  # explicit miss (no guessing)
 
-        return None  # explicit miss (no guessing)
+        return {
+            "answer": r.answer,
+            "citation": r.citation,
+            "topic": r.topic,
+        }
 
     # -------------------------------------------------
     # TOPIC QUERY (SAFE AGGREGATION)
@@ -44,19 +86,27 @@ class KnowledgeEngine:
         Aggregates known answers for a topic.
         No inference, no generation.
         """
-        t = topic.lower().strip()
-
-        matches = [r for r in self._rows if r.topic.lower() == t]
-
-        if not matches:
-            return None
+        return self._topic_blocks.get(topic.lower().strip())
 
-        # Deterministic aggregation
-        parts = []
-        for r in matches:
-            parts.append(f"- {r.answer}")
+    def rows_for_topic(self, topic: str) -> Tuple[DharmaRow, ...]:
+        """
+        Stored rows for a topic, in load order (read-only).
+        """
+        return self._by_topic.get(topic.lower().strip(), ())
 
-            if r.citation:
-                parts.append(f"  ({r.citation})")
+    # -------------------------------------------------
+    # CHAPTER / VERSE LOOKUP
+    # -------------------------------------------------
+    @property
+    def verse_index(self) -> VerseIndex:
+        return self._verses
 
-        return "\n".join(parts)
+    def verses(self, reference: str) -> Tuple[DharmaRow, ...]:
+        """
+        Rows cited by a verse reference ("Gita 2.47", "Gita 2.47-2.50",
+        "all of chapter 3"). Empty on malformed or unknown references.
+        """
+        ref = parse_verse_reference(reference)
+        if ref is None:
+            return ()
+        return self._verses.lookup(ref)
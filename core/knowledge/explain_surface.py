@@ -1,6 +1,7 @@
-from typing import Optional, Dict
+from typing import List, Optional, Dict
 from core.knowledge.engine import KnowledgeEngine
 from core.knowledge.explain_policy import MISS_MESSAGE
+from core.knowledge.retrieval import BM25Index
 
 
 class KnowledgeExplainSurface:
@@ -10,14 +11,36 @@ class KnowledgeExplainSurface:
     Returns a uniform envelope:
     - On hit: answer + citation + topic
     - On miss: explicit, safe message
+
+    Day 80 — optional BM25 fallback:
+    - Exact question match always wins
+    - Otherwise the best-ranked stored row is returned verbatim
+
+    Day 84 — verse references ("Gita 2.47", "Gita 2.47-2.50"):
+    - Checked after exact match, before BM25
+    - Ranges return every cited row, in verse order
     """
 
-    def __init__(self, engine: KnowledgeEngine):
+    def __init__(
+        self,
+        engine: KnowledgeEngine,
+        retriever: BM25Index | None = None,
+        min_score: float = 0.0,
+    ):
         self._engine = engine
+        self._retriever = retriever
+        self._min_score = min_score
 
     def respond(self, query: str) -> Dict[str, str]:
         result: Optional[dict] = self._engine.answer(query)
 
+        if not result:
+            result = self._merge(self.verses(query))
+
+        if not result and self._retriever is not None:
+            hits = self.search(query, k=1)
+            result = hits[0] if hits else None
+
         if not result:
             return {
                 "answer": MISS_MESSAGE,
@@ -30,3 +53,39 @@ class KnowledgeExplainSurface:
             "citation": result["citation"],
             "topic": result["topic"],
         }
+
+    def search(self, query: str, k: int = 5) -> List[Dict[str, str]]:
+        """
+        Top-k cited rows for a free-text query (empty without retriever).
+        """
+        if self._retriever is None:
+            return []
+
+        return [
+            hit.to_dict()
+            for hit in self._retriever.search(query, k)
+            if hit.score > self._min_score
+        ]
+
+    def verses(self, reference: str) -> List[Dict[str, str]]:
+        """
+        Cited rows for a chapter/verse reference, in verse order.
+        """
+        return [
+            {"answer": r.answer, "citation": r.citation, "topic": r.topic}
+            for r in self._engine.verses(reference)
+        ]
+
+    @staticmethod
+    def _merge(results: List[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        if not results:
+            return None
+        if len(results) == 1:
+            return results[0]
+
+        citations = list(dict.fromkeys(r["citation"] for r in results))
+        return {
+            "answer": "\n".join(f"- {r['answer']}" for r in results),
+            "citation": "; ".join(citations),
+            "topic": results[0]["topic"],
+        }
@@ -0,0 +1,240 @@
+"""
+Day 83 — Parallel streaming CSV ingestion.
+
+Large corpus CSVs are cut into byte-range chunks on record boundaries
+and validated in a process pool.
+
+- Rows come back in file order
+- KnowledgeValidationError row numbers are identical to the
+  sequential loaders (failing records are re-validated in order
+  with their global record number)
+- Several corpora can share one pool
+- Small files skip the pool entirely
+
+Chunk boundaries are newlines preceded by an even number of quote
+characters, i.e. standard CSV quoting (quotes only inside quoted
+fields, escaped by doubling).
+"""
+
+import csv
+import io
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from core.knowledge.csv_format import CsvFormat, check_header, read_csv
+from core.knowledge.exceptions import KnowledgeValidationError
+
+DEFAULT_CHUNK_BYTES = 8 << 20
+
+
+# -------------------------------------------------
+# RECORD-ALIGNED CHUNKING
+# -------------------------------------------------
+def _last_record_boundary(data: bytes) -> int:
+    """
+    Offset just past the last newline that ends a record (0 if none).
+    `data` must start on a record boundary.
+    """
+    pos = len(data)
+    quotes_before = data.count(b'"')
+
+    while True:
+        nl = data.rfind(b"\n", 0, pos)
+        if nl < 0:
+            return 0
+        quotes_before -= data.count(b'"', nl, pos)
+        if quotes_before % 2 == 0:
+            return nl + 1
+        pos = nl
+
+
+def _first_record_boundary(data: bytes) -> int:
+    """
+    Offset just past the first newline that ends a record (0 if none).
+    """
+    pos = 0
+    quotes_before = 0
+
+    while True:
+        nl = data.find(b"\n", pos)
+        if nl < 0:
+            return 0
+        quotes_before += data.count(b'"', pos, nl)
+        if quotes_before % 2 == 0:
+            return nl + 1
+        pos = nl + 1
+
+
+def iter_record_chunks(path: str, chunk_bytes: int) -> Iterator[bytes]:
+    """
+    Stream the file as chunks that each hold whole records.
+    """
+    carry = b""
+
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_bytes), b""):
+            data = carry + block if carry else block
+            cut = _last_record_boundary(data)
+            if cut == 0:
+                carry = data
+                continue
+            yield data[:cut]
+            carry = data[cut:]
+
+    if carry:
+        yield carry
+
+
+def _split_header(chunk: bytes) -> Tuple[List[str] | None, bytes]:
+    cut = _first_record_boundary(chunk) or len(chunk)
+    text = io.StringIO(chunk[:cut].decode("utf-8"), newline="")
+    return next(csv.reader(text), None), chunk[cut:]
+
+
+# -------------------------------------------------
+# WORKER (runs in a child process)
+# -------------------------------------------------
+def _parse_chunk(
+    fmt: CsvFormat, fieldnames: Sequence[str], data: bytes
+) -> Tuple[List, int, Dict[str, str] | None]:
+    """
+    (rows, record_count, failed_record).
+
+    On the first invalid record, returns the rows before it, its
+    1-based local index and the raw record, so the parent can re-raise
+    with the global record number.
+    """
+    reader = csv.DictReader(
+        io.StringIO(data.decode("utf-8"), newline=""), fieldnames=fieldnames
+    )
+
+    rows = []
+    for j, record in enumerate(reader, start=1):
+        try:
+            rows.append(fmt.parse_row(record, j))
+        except Exception:
+            return rows, j, record
+    return rows, len(rows), None
+
+
+# -------------------------------------------------
+# PUBLIC API
+# -------------------------------------------------
+def iter_csv_rows(
+    path: str,
+    fmt: CsvFormat,
+    executor: Executor,
+    *,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    max_in_flight: int | None = None,
+) -> Iterator[List]:
+    """
+    Yield validated row batches in file order.
+    At most `max_in_flight` chunks are buffered at once.
+    """
+    max_in_flight = max_in_flight or 2 * (os.cpu_count() or 2)
+
+    chunks = iter_record_chunks(str(path), chunk_bytes)
+    first = next(chunks, b"")
+    fieldnames, first = _split_header(first)
+    check_header(fieldnames, fmt)
+
+    pending = deque()
+    seen = 0
+    produced = 0
+
+    def collect():
+        nonlocal seen, produced
+        rows, count, failed = pending.popleft().result()
+        if failed is not None:
+            for future in pending:
+                future.cancel()
+            # Same parser, global record number -> identical error
+            fmt.parse_row(failed, seen + count)
+            raise KnowledgeValidationError(f"Row {seen + count} invalid")
+        seen += count
+        produced += len(rows)
+        return rows
+
+    def feed():
+        if first:
+            yield first
+        yield from chunks
+
+    for chunk in feed():
+        pending.append(executor.submit(_parse_chunk, fmt, fieldnames, chunk))
+        if len(pending) >= max_in_flight:
+            yield collect()
+
+    while pending:
+        yield collect()
+
+    if not produced:
+        raise KnowledgeValidationError(fmt.empty_error)
+
+
+def ingest_csv(
+    path: str,
+    fmt: CsvFormat,
+    *,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> List:
+    """
+    Validated rows of one CSV. Files no larger than one chunk are
+    parsed sequentially in the calling thread.
+    """
+    if os.path.getsize(path) <= chunk_bytes:
+        return read_csv(str(path), fmt)
+
+    if executor is not None:
+        return [
+            row
+            for batch in iter_csv_rows(path, fmt, executor, chunk_bytes=chunk_bytes)
+            for row in batch
+        ]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return ingest_csv(
+            path, fmt, executor=pool, chunk_bytes=chunk_bytes
+        )
+
+
+def ingest_corpora(
+    sources: Dict[str, Tuple[Path, CsvFormat]],
+    *,
+    max_workers: int | None = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> Dict[str, List]:
+    """
+    Ingest several corpora concurrently over one shared process pool.
+    Result keeps the order of `sources`; the first failing corpus
+    (in that order) raises.
+    """
+    if not sources:
+        return {}
+
+    needs_pool = any(
+        os.path.getsize(path) > chunk_bytes for path, _ in sources.values()
+    )
+
+    def run(pool):
+        with ThreadPoolExecutor(max_workers=len(sources)) as drivers:
+            futures = {
+                corpus: drivers.submit(
+                    ingest_csv, path, fmt,
+                    executor=pool, chunk_bytes=chunk_bytes,
+                )
+                for corpus, (path, fmt) in sources.items()
+            }
+            return {corpus: f.result() for corpus, f in futures.items()}
+
+    if not needs_pool:
+        return run(None)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return run(pool)
@@ -1,37 +1,36 @@
-import csv
-from typing import List
+from typing import Dict, List
 from core.knowledge.schema import DharmaRow
 from core.knowledge.exceptions import KnowledgeValidationError
+from core.knowledge.csv_format import CsvFormat, read_csv
 
 
 REQUIRED_COLUMNS = {"topic", "question", "answer", "citation"}
 
 
-def load_dharma_csv(path: str) -> List[DharmaRow]:
-    rows: List[DharmaRow] = []
+def parse_dharma_row(r: Dict[str, str], i: int) -> DharmaRow:
+    try:
+        row = DharmaRow(
+            topic=r["topic"].strip(),
+            question=r["question"].strip(),
+            answer=r["answer"].strip(),
+            citation=r["citation"].strip(),
+        )
+    except Exception as e:
+        raise KnowledgeValidationError(f"Row {i} invalid: {e}")
 
-    with open(path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        if not REQUIRED_COLUMNS.issubset(reader.fieldnames or []):
-            raise KnowledgeValidationError("Invalid CSV schema")
+    if not all([row.topic, row.question, row.answer, row.citation]):
+        raise KnowledgeValidationError(f"Row {i} has empty fields")
 
-        for i, r in enumerate(reader, start=1):
-            try:
-                row = DharmaRow(
-                    topic=r["topic"].strip(),
-                    question=r["question"].strip(),
-                    answer=r["answer"].strip(),
-                    citation=r["citation"].strip(),
-                )
-            except Exception as e:
-                raise KnowledgeValidationError(f"Row {i} invalid: {e}")
+    return row
 
-            if not all([row.topic, row.question, row.answer, row.citation]):
-                raise KnowledgeValidationError(f"Row {i} has empty fields")
 
-            rows.append(row)
+DHARMA_FORMAT = CsvFormat(
+    required=frozenset(REQUIRED_COLUMNS),
+    parse_row=parse_dharma_row,
+    schema_error="Invalid CSV schema",
+    empty_error="CSV has no data",
+)
 
-    if not rows:
-        raise KnowledgeValidationError("CSV has no data")
 
-    return rows
+def load_dharma_csv(path: str) -> List[DharmaRow]:
+    return read_csv(path, DHARMA_FORMAT)
@@ -0,0 +1,100 @@
+"""
+Day 85 — Bounded LRU cache for knowledge results.
+
+Callers pass a `valid` check (e.g. corpus versions recorded with
+the result), so a result can never outlive the data it was computed
+from. Misses (None) are cached too: unknown questions are asked as
+often as known ones.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Optional
+
+DEFAULT_QUERY_CACHE_SIZE = 1024
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class QueryCacheStats:
+    """
+    Observability only.
+    """
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class QueryCache:
+    """
+    Thread-safe LRU map: key -> computed result.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_QUERY_CACHE_SIZE):
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+
+        self._maxsize = maxsize
+        self._data: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], object],
+        valid: Optional[Callable[[object], bool]] = None,
+    ):
+        """
+        Cached value for `key`, computing (outside the lock) on a miss.
+        A cached value rejected by `valid` counts as a miss.
+        """
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is not _MISSING and (valid is None or valid(value)):
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+
+        value = compute()
+
+        if self._maxsize:
+            with self._lock:
+                self._data[key] = value
+                self._data.move_to_end(key)
+                while len(self._data) > self._maxsize:
+                    self._data.popitem(last=False)
+
+        return value
+
+    def invalidate(self) -> int:
+        """
+        Drop every entry; returns how many were dropped.
+        """
+        with self._lock:
+            dropped = len(self._data)
+            self._data.clear()
+            return dropped
+
+    def stats(self) -> QueryCacheStats:
+        return QueryCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self._data),
+            maxsize=self._maxsize,
+        )
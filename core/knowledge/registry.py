@@ -0,0 +1,288 @@
+"""
+Day 82 — Process-wide knowledge registry.
+
+- Each corpus is loaded at most ONCE per process, on first use
+- Topic queries only load corpora that contain the topic
+  (topics come from snapshot headers, not rows)
+- Engines built here share the same immutable row objects
+- Load time and approximate memory are recorded per corpus
+
+Day 85 — answer()/query() results are served from a bounded LRU
+keyed on the normalized query. Each entry records the versions of
+the corpora it was computed from (only those), and is recomputed
+when one of them changes; reload() invalidates it.
+"""
+
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Optional, Sequence, Tuple
+
+from core.knowledge.bootstrap import (
+    SCRIPTURE_CORPORA,
+    corpus_topics,
+    corpus_version,
+    dharma_data_dir,
+    load_corpus,
+)
+from core.knowledge.engine import KnowledgeEngine
+from core.knowledge.query_cache import (
+    DEFAULT_QUERY_CACHE_SIZE,
+    QueryCache,
+    QueryCacheStats,
+)
+
+
+@dataclass(frozen=True)
+class CorpusLoadStats:
+    """
+    Observability only.
+    """
+
+    corpus: str
+    rows: int
+    load_seconds: float
+    approx_bytes: int
+
+
+def _approx_row_bytes(rows: Tuple) -> int:
+    total = sys.getsizeof(rows)
+    for r in rows:
+        total += sys.getsizeof(r)
+        for value in vars(r).values():
+            total += sys.getsizeof(value)
+    return total
+
+
+class KnowledgeRegistry:
+    """
+    Lazy, shared access to every scripture corpus.
+
+    Exposes the same answer()/query() contract as KnowledgeEngine,
+    as if all corpora were one engine in declaration order.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path | None = None,
+        corpora: Sequence[str] | None = None,
+        cache_size: int = DEFAULT_QUERY_CACHE_SIZE,
+    ):
+        self._data_dir = Path(data_dir) if data_dir else dharma_data_dir()
+        self._order: Tuple[str, ...] = tuple(corpora or SCRIPTURE_CORPORA)
+
+        self._rows: Dict[str, Tuple] = {}
+        self._topics: Dict[str, FrozenSet[str]] = {}
+        self._engines: Dict[Tuple[str, ...], KnowledgeEngine] = {}
+        self._stats: Dict[str, CorpusLoadStats] = {}
+
+        self._versions: Dict[str, str] = {}
+        self._cache = QueryCache(cache_size)
+
+        self._lock = threading.RLock()
+
+    # -------------------------------------------------
+    # LOADING
+    # -------------------------------------------------
+    @property
+    def corpora(self) -> Tuple[str, ...]:
+        return self._order
+
+    def is_loaded(self, corpus: str) -> bool:
+        return corpus in self._rows
+
+    def rows(self, corpus: str) -> Tuple:
+        """
+        Immutable rows of one corpus (loaded on first call).
+        """
+        rows = self._rows.get(corpus)
+        if rows is not None:
+            return rows
+
+        with self._lock:
+            rows = self._rows.get(corpus)
+            if rows is not None:
+                return rows
+
+            start = time.perf_counter()
+            rows = tuple(load_corpus(corpus, self._data_dir))
+            elapsed = time.perf_counter() - start
+
+            self._stats[corpus] = CorpusLoadStats(
+                corpus=corpus,
+                rows=len(rows),
+                load_seconds=elapsed,
+                approx_bytes=_approx_row_bytes(rows),
+            )
+            self._topics[corpus] = frozenset(r.topic.lower() for r in rows)
+            self._rows[corpus] = rows
+
+            # Version of the data actually loaded (snapshot just written)
+            self._versions[corpus] = corpus_version(corpus, self._data_dir)
+            return rows
+
+    def topics(self, corpus: str) -> FrozenSet[str]:
+        """
+        Normalized topics of a corpus, without loading rows if a
+        snapshot header is available.
+        """
+        topics = self._topics.get(corpus)
+        if topics is not None:
+            return topics
+
+        with self._lock:
+            header_topics = corpus_topics(corpus, self._data_dir)
+            if header_topics is None:
+                self.rows(corpus)  # builds the snapshot as a side effect
+                return self._topics[corpus]
+
+            topics = frozenset(header_topics)
+            self._topics[corpus] = topics
+            return topics
+
+    def engine(self, *corpora: str) -> KnowledgeEngine:
+        """
+        Engine over the given corpora (all when none given).
+        Cached per corpus combination; rows are shared, not copied.
+        """
+        key = corpora or self._order
+
+        engine = self._engines.get(key)
+        if engine is not None:
+            return engine
+
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is None:
+                if len(key) == 1:
+                    rows = self.rows(key[0])
+                else:
+                    rows = tuple(r for c in key for r in self.rows(c))
+                engine = KnowledgeEngine(rows)
+                self._engines[key] = engine
+            return engine
+
+    def version(self, corpus: str) -> str:
+        """
+        Content hash of a corpus (memoized until reload).
+        """
+        version = self._versions.get(corpus)
+        if version is None:
+            with self._lock:
+                version = self._versions.get(corpus)
+                if version is None:
+                    version = corpus_version(corpus, self._data_dir)
+                    self._versions[corpus] = version
+        return version
+
+    def reload(self, corpus: str | None = None) -> None:
+        """
+        Forget loaded rows (one corpus or all); next use reloads.
+        Cached results are dropped as well.
+        """
+        with self._lock:
+            targets = (corpus,) if corpus else tuple(
+                set(self._rows) | set(self._versions)
+            )
+            for c in targets:
+                self._rows.pop(c, None)
+                self._topics.pop(c, None)
+                self._stats.pop(c, None)
+                self._versions.pop(c, None)
+
+            self._cache.invalidate()
+
+            self._engines = {
+                key: engine for key, engine in self._engines.items()
+                if not set(key) & set(targets)
+            }
+
+    # -------------------------------------------------
+    # QUERIES (KnowledgeEngine contract)
+    # -------------------------------------------------
+    # Cache entries: (result, ((corpus, version), ...)) for the
+    # corpora the result was computed from
+    def _cached(self, key: Tuple[str, str], compute: Callable):
+        result, _ = self._cache.get_or_compute(key, compute, self._current)
+        return result
+
+    def _current(self, entry) -> bool:
+        return all(self.version(c) == v for c, v in entry[1])
+
+    def _versions_of(self, corpora) -> Tuple[Tuple[str, str], ...]:
+        return tuple((c, self.version(c)) for c in corpora)
+
+    def answer(self, query: str) -> Optional[dict]:
+        """
+        Exact question lookup; corpora are loaded in order until a hit.
+        """
+        q = query.lower().strip()
+        result = self._cached(("answer", q), lambda: self._answer(q))
+        # Callers may mutate the dict; the cached one stays pristine
+        return dict(result) if result else None
+
+    def _answer(self, query: str):
+        consulted = []
+        for corpus in self._order:
+            consulted.append(corpus)
+            result = self.engine(corpus).answer(query)
+            if result:
+                return result, self._versions_of(consulted)
+        return None, self._versions_of(consulted)
+
+    def query(self, topic: str) -> Optional[str]:
+        """
+        Topic aggregation over every corpus that holds the topic.
+        """
+        t = topic.lower().strip()
+        return self._cached(("query", t), lambda: self._query(t))
+
+    def _query(self, t: str):
+        holding = [c for c in self._order if t in self.topics(c)]
+        blocks = [self.engine(c).query(t) for c in holding]
+        blocks = [b for b in blocks if b]
+
+        result = "\n".join(blocks) if blocks else None
+        return result, self._versions_of(holding)
+
+    # -------------------------------------------------
+    # METRICS
+    # -------------------------------------------------
+    def stats(self) -> Dict[str, CorpusLoadStats]:
+        return dict(self._stats)
+
+    def metrics(self) -> Dict[str, float | int]:
+        stats = self._stats.values()
+        return {
+            "corpora_loaded": len(self._stats),
+            "corpora_total": len(self._order),
+            "rows": sum(s.rows for s in stats),
+            "load_seconds": sum(s.load_seconds for s in stats),
+            "approx_bytes": sum(s.approx_bytes for s in stats),
+            "engines": len(self._engines),
+            "cache_hits": self._cache.hits,
+            "cache_misses": self._cache.misses,
+            "cache_size": len(self._cache),
+        }
+
+    def cache_stats(self) -> QueryCacheStats:
+        return self._cache.stats()
+
+
+_REGISTRY: KnowledgeRegistry | None = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_knowledge_registry() -> KnowledgeRegistry:
+    """
+    Process-wide registry shared by every front end.
+    """
+    global _REGISTRY
+
+    if _REGISTRY is None:
+        with _REGISTRY_LOCK:
+            if _REGISTRY is None:
+                _REGISTRY = KnowledgeRegistry()
+    return _REGISTRY
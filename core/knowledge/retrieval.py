@@ -0,0 +1,330 @@
+"""
+Day 80 — Offline BM25 retrieval over stored scripture rows.
+
+Rules (same as KnowledgeEngine):
+- NO generation: hits are stored rows, returned verbatim
+- Every hit carries its citation
+- Ranking only decides WHICH stored row is returned
+"""
+
+import heapq
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+from core.knowledge.schema import DharmaRow
+
+_TERM = re.compile(r"\w+")
+
+RETRIEVAL_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "do", "does",
+    "for", "from", "how", "i", "in", "is", "it", "me", "of", "on",
+    "or", "tell", "that", "the", "this", "to", "was", "what", "when",
+    "where", "which", "who", "why", "with", "about", "explain",
+})
+
+
+def retrieval_terms(text: str) -> List[str]:
+    """
+    Lowercased word terms with stopwords removed.
+    """
+    return [
+        t for t in _TERM.findall(text.lower())
+        if t not in RETRIEVAL_STOPWORDS
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class RetrievalHit:
+    """
+    One ranked stored row.
+    """
+
+    row: DharmaRow
+    corpus: str
+    score: float
+
+    def to_dict(self) -> Dict[str, str]:
+        return {
+            "answer": self.row.answer,
+            "citation": self.row.citation,
+            "topic": self.row.topic,
+        }
+
+
+class BM25Index:
+    """
+    Inverted index with Okapi BM25 ranking.
+
+    - Documents are grouped by corpus name
+    - A corpus can be added, removed or replaced without
+      touching the others (incremental rebuild)
+    - Removed rows leave tombstones; ids are compacted once
+      tombstones outnumber live rows (load order is kept)
+    - Indexed text: topic + question + answer
+    """
+
+    # Tombstones tolerated before ids are compacted
+    COMPACT_MIN_TOMBSTONES = 256
+
+    def __init__(self, *, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+        # term -> {doc_id: term frequency}
+        self._postings: Dict[str, Dict[int, int]] = {}
+
+        # doc_id -> (row, corpus, length, distinct terms); None = removed
+        self._docs: List[Tuple[DharmaRow, str, int, Tuple[str, ...]] | None] = []
+        self._corpus_docs: Dict[str, List[int]] = {}
+
+        self._live = 0
+        self._total_length = 0
+
+        # Per-document length normalization, recomputed lazily
+        self._norms: List[float] = []
+        self._norms_stale = False
+
+        # term -> (impacts desc, doc_ids); valid until the next mutation
+        self._impacts: Dict[str, Tuple[List[float], List[int]]] = {}
+
+    # -------------------------------------------------
+    # BUILD / INCREMENTAL UPDATE
+    # -------------------------------------------------
+    def add(self, corpus: str, rows: Iterable[DharmaRow]) -> int:
+        """
+        Index rows under `corpus`. Returns number of rows added.
+        """
+        doc_ids = self._corpus_docs.setdefault(corpus, [])
+        added = 0
+
+        for row in rows:
+            terms = retrieval_terms(f"{row.topic} {row.question} {row.answer}")
+
+            freqs: Dict[str, int] = {}
+            for t in terms:
+                freqs[t] = freqs.get(t, 0) + 1
+
+            doc_id = len(self._docs)
+            self._docs.append((row, corpus, len(terms), tuple(freqs)))
+            doc_ids.append(doc_id)
+
+            for t, tf in freqs.items():
+                posting = self._postings.get(t)
+                if posting is None:
+                    posting = self._postings[t] = {}
+                posting[doc_id] = tf
+
+            self._live += 1
+            self._total_length += len(terms)
+            added += 1
+
+        if added:
+            self._norms_stale = True
+        return added
+
+    def remove_corpus(self, corpus: str) -> int:
+        """
+        Drop every row of `corpus`. Returns number of rows removed.
+        """
+        doc_ids = self._corpus_docs.pop(corpus, [])
+
+        for doc_id in doc_ids:
+            doc = self._docs[doc_id]
+            if doc is None:
+                continue
+
+            _, _, length, terms = doc
+            for t in terms:
+                posting = self._postings[t]
+                del posting[doc_id]
+                if not posting:
+                    del self._postings[t]
+
+            self._docs[doc_id] = None
+            self._live -= 1
+            self._total_length -= length
+
+        if doc_ids:
+            self._norms_stale = True
+
+        tombstones = len(self._docs) - self._live
+        if tombstones > max(self.COMPACT_MIN_TOMBSTONES, self._live):
+            self._compact()
+        return len(doc_ids)
+
+    def _compact(self) -> None:
+        """
+        Renumber live rows densely, in load order.
+        """
+        remap: Dict[int, int] = {}
+        docs = []
+        for old_id, doc in enumerate(self._docs):
+            if doc is not None:
+                remap[old_id] = len(docs)
+                docs.append(doc)
+
+        self._docs = docs
+        self._corpus_docs = {
+            corpus: [remap[d] for d in doc_ids if d in remap]
+            for corpus, doc_ids in self._corpus_docs.items()
+        }
+        self._postings = {
+            term: {remap[d]: tf for d, tf in posting.items()}
+            for term, posting in self._postings.items()
+        }
+        self._norms = []
+        self._norms_stale = True
+        self._impacts.clear()
+
+    def replace_corpus(self, corpus: str, rows: Iterable[DharmaRow]) -> int:
+        """
+        Re-index a single corpus (e.g. after its CSV changed).
+        """
+        self.remove_corpus(corpus)
+        return self.add(corpus, rows)
+
+    def _refresh_norms(self) -> None:
+        avgdl = (self._total_length / self._live) if self._live else 0.0
+        k1, b = self.k1, self.b
+
+        norms = []
+        for doc in self._docs:
+            if doc is None or not avgdl:
+                norms.append(k1)
+            else:
+                norms.append(k1 * (1.0 - b + b * doc[2] / avgdl))
+
+        self._norms = norms
+        self._norms_stale = False
+        self._impacts.clear()
+
+    def _impact_list(self, term: str) -> Tuple[List[float], List[int]]:
+        """
+        Postings of `term` ordered by BM25 term impact (idf excluded),
+        highest first, ties in load order. Built on first use.
+        """
+        cached = self._impacts.get(term)
+        if cached is not None:
+            return cached
+
+        k1_plus_1 = self.k1 + 1.0
+        norms = self._norms
+        ordered = sorted(
+            (
+                (tf * k1_plus_1 / (tf + norms[doc_id]), doc_id)
+                for doc_id, tf in self._postings[term].items()
+            ),
+            key=lambda item: (-item[0], item[1]),
+        )
+
+        cached = ([i for i, _ in ordered], [d for _, d in ordered])
+        self._impacts[term] = cached
+        return cached
+
+    def optimize(self) -> None:
+        """
+        Precompute every impact list (otherwise built lazily per term).
+        """
+        if self._norms_stale:
+            self._refresh_norms()
+        for term in self._postings:
+            self._impact_list(term)
+
+    # -------------------------------------------------
+    # QUERY
+    # -------------------------------------------------
+    def search(self, query: str, k: int = 5) -> List[RetrievalHit]:
+        """
+        Top-k stored rows by BM25 score (ties: load order).
+
+        Threshold algorithm over impact-ordered postings: lists are
+        walked in parallel and stop as soon as no unseen row can beat
+        the current k-th score, so frequent terms do not force a full
+        posting scan.
+        """
+        if k <= 0 or not self._live:
+            return []
+
+        terms = [
+            t for t in dict.fromkeys(retrieval_terms(query))
+            if t in self._postings
+        ]
+        if not terms:
+            return []
+
+        if self._norms_stale:
+            self._refresh_norms()
+
+        n = self._live
+        k1_plus_1 = self.k1 + 1.0
+        norms = self._norms
+
+        lists = []
+        for t in terms:
+            posting = self._postings[t]
+            df = len(posting)
+            idf = math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+            impacts, doc_ids = self._impact_list(t)
+            lists.append((idf, impacts, doc_ids, posting))
+
+        top: List[Tuple[float, int]] = []  # min-heap of (score, -doc_id)
+        seen = set()
+        depth = 0
+
+        while True:
+            bound = 0.0
+            active = False
+
+            for idf, impacts, doc_ids, _ in lists:
+                if depth >= len(impacts):
+                    continue
+                active = True
+                bound += idf * impacts[depth]
+
+                doc_id = doc_ids[depth]
+                if doc_id in seen:
+                    continue
+                seen.add(doc_id)
+
+                score = 0.0
+                norm = norms[doc_id]
+                for idf2, _, _, posting2 in lists:
+                    tf = posting2.get(doc_id)
+                    if tf:
+                        score += idf2 * (tf * k1_plus_1 / (tf + norm))
+
+                entry = (score, -doc_id)
+                if len(top) < k:
+                    heapq.heappush(top, entry)
+                elif entry > top[0]:
+                    heapq.heapreplace(top, entry)
+
+            if not active:
+                break
+            # Strict: an unseen row scoring exactly `bound` could
+            # still win the tie on load order
+            if len(top) == k and top[0][0] > bound:
+                break
+            depth += 1
+
+        hits = []
+        for score, neg_doc_id in sorted(top, reverse=True):
+            row, corpus, _, _ = self._docs[-neg_doc_id]
+            hits.append(RetrievalHit(row=row, corpus=corpus, score=score))
+        return hits
+
+    # -------------------------------------------------
+    # STATS
+    # -------------------------------------------------
+    def __len__(self) -> int:
+        return self._live
+
+    @property
+    def corpora(self) -> Tuple[str, ...]:
+        return tuple(self._corpus_docs)
+
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self._postings)
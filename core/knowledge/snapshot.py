@@ -0,0 +1,204 @@
+"""
+Day 81 — Precompiled knowledge snapshot.
+
+Validated corpora are pickled (protocol 5) into versioned files,
+one per corpus, keyed by a content hash of the source CSV.
+
+- Startup reads snapshot files instead of parsing + validating CSVs
+- Any CSV change (content hash) invalidates its snapshot
+- A cheap size/mtime fingerprint skips hashing when nothing moved;
+  a hash hit with a stale fingerprint (checkout, touch, copy)
+  rewrites the fingerprint so the next start is stat-only again
+- Snapshot problems are never fatal: callers fall back to CSV
+
+File layout: MAGIC, pickled header (version, hash, fingerprint,
+topics), pickled rows. The header can be read without the rows.
+
+Build explicitly with:
+    python -m core.knowledge.snapshot
+"""
+
+import hashlib
+import io
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"RUDRA-KNOWLEDGE"
+SNAPSHOT_VERSION = 2
+SNAPSHOT_DIRNAME = ".snapshot"
+
+
+# -------------------------------------------------
+# FINGERPRINTS
+# -------------------------------------------------
+def source_fingerprint(paths: Sequence[Path]) -> Tuple[Tuple[str, int, int], ...]:
+    """
+    (name, size, mtime_ns) per source file. Cheap, stat-only.
+    """
+    out = []
+    for p in paths:
+        st = os.stat(p)
+        out.append((Path(p).name, st.st_size, st.st_mtime_ns))
+    return tuple(out)
+
+
+def source_hash(paths: Sequence[Path]) -> str:
+    """
+    SHA-256 over file names and contents, in the given order.
+    """
+    digest = hashlib.sha256()
+    for p in paths:
+        digest.update(Path(p).name.encode("utf-8"))
+        digest.update(b"\0")
+        with open(p, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def default_snapshot_path(data_dir: Path, corpus: str) -> Path:
+    return (
+        Path(data_dir) / SNAPSHOT_DIRNAME
+        / f"{corpus}.v{SNAPSHOT_VERSION}.pkl"
+    )
+
+
+# -------------------------------------------------
+# WRITE
+# -------------------------------------------------
+def write_snapshot(
+    path: Path,
+    rows: List,
+    sources: Sequence[Path],
+    content_hash: str | None = None,
+) -> None:
+    """
+    Atomically write a snapshot for `rows` built from `sources`.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "hash": content_hash or source_hash(sources),
+        "fingerprint": source_fingerprint(sources),
+        "rows": len(rows),
+        "topics": sorted({r.topic.lower() for r in rows}),
+    }
+
+    _write_atomic(path, header, pickle.dumps(rows, protocol=5))
+
+
+def _write_atomic(path: Path, header: dict, rows_payload: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            pickle.dump(header, f, protocol=5)
+            f.write(rows_payload)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+# -------------------------------------------------
+# READ
+# -------------------------------------------------
+def _open_valid(path: Path, sources: Sequence[Path]):
+    """
+    (open file positioned after the header, header) or None.
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+
+    f = open(path, "rb")
+    try:
+        if f.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+            f.close()
+            return None
+        header = pickle.load(f)
+    except Exception:
+        f.close()
+        logger.warning("Unreadable knowledge snapshot at %s", path)
+        return None
+
+    if not isinstance(header, dict) or header.get("version") != SNAPSHOT_VERSION:
+        f.close()
+        return None
+
+    # Fast path: nothing touched since the snapshot was written
+    fingerprint = source_fingerprint(sources)
+    if header.get("fingerprint") == fingerprint:
+        return f, header
+
+    # Files touched: trust content, not timestamps
+    if header.get("hash") != source_hash(sources):
+        f.close()
+        return None
+
+    with f:
+        rows_payload = f.read()
+    header = dict(header, fingerprint=fingerprint)
+    try:
+        _write_atomic(path, header, rows_payload)
+    except OSError:
+        logger.warning("Could not refresh knowledge snapshot at %s", path)
+
+    return io.BytesIO(rows_payload), header
+
+
+def read_snapshot_header(path: Path, sources: Sequence[Path]) -> dict | None:
+    """
+    Header of a valid snapshot (topics, row count) without loading rows.
+    """
+    opened = _open_valid(path, sources)
+    if opened is None:
+        return None
+
+    f, header = opened
+    f.close()
+    return header
+
+
+def read_snapshot(path: Path, sources: Sequence[Path]) -> List | None:
+    """
+    Rows from the snapshot, or None if missing / stale / unreadable.
+    """
+    opened = _open_valid(path, sources)
+    if opened is None:
+        return None
+
+    f, _ = opened
+    try:
+        with f:
+            return pickle.load(f)
+    except Exception:
+        logger.warning("Unreadable knowledge snapshot at %s", path)
+        return None
+
+
+def main() -> int:
+    from core.knowledge.bootstrap import dharma_data_dir, load_corpora
+
+    data_dir = dharma_data_dir()
+    corpora = load_corpora(data_dir, use_snapshot=False, write=True)
+    for corpus, rows in corpora.items():
+        print(
+            f"Knowledge snapshot written: "
+            f"{default_snapshot_path(data_dir, corpus)} ({len(rows)} rows)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,230 @@
+"""
+Day 84 — Chapter / verse index.
+
+Every stored row carries a citation such as "Bhagavad Gita 2.47",
+"Yoga Sutra 1.2" or "Isha Upanishad 1". Rows are grouped per work
+and kept sorted by (chapter, verse), so point and range lookups are
+two bisections + a slice.
+
+- "Gita 2.47"            -> one verse
+- "Gita 2.47-2.50"       -> verse range (may cross chapters)
+- "Gita 2.47-50"         -> verse range within chapter 2
+- "all of chapter 3"     -> whole chapter (every work)
+- "chapter 2 verse 47"   -> same as "2.47" ("verses 47 to 50" too)
+- "Isha Upanishad 1"     -> single-number citations are chapter-level
+
+Rows with the same position keep load order. No fuzzy matching:
+unknown works or malformed references are an explicit miss.
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# -------------------------------------------------
+# REFERENCES
+# -------------------------------------------------
+@dataclass(frozen=True)
+class VerseRange:
+    """
+    Inclusive position range inside one work (or every work when
+    `work` is None). A None verse means "whole chapter".
+    """
+
+    work: Optional[str]
+    start_chapter: int
+    start_verse: Optional[int]
+    end_chapter: int
+    end_verse: Optional[int]
+
+
+# "Bhagavad Gita 2.47" / "Isha Upanishad 1"
+_CITATION = re.compile(r"^(?P<work>.*?)\s+(?P<chapter>\d+)(?:\.(?P<verse>\d+))?$")
+
+_REFERENCE = re.compile(
+    r"^(?:all\s+of\s+)?(?P<work>.*?)\s*(?:\bchapters?\s+)?"
+    r"(?P<c1>\d+)(?:\.(?P<v1>\d+))?"
+    r"(?:\s*(?:-|–|—|\bto\b)\s*(?P<e1>\d+)(?:\.(?P<e2>\d+))?)?$"
+)
+
+# "chapter 2 verse 47" -> "chapter 2.47"; "to verse 50" -> "to 50"
+_CHAPTER_VERSE = re.compile(
+    r"\bchapter\s+(\d+)\s*,?\s*(?:verses?|sutras?)\s+(\d+)"
+)
+_RANGE_VERSE = re.compile(
+    r"(-|–|—|\bto\b)\s*(?:chapter|verses?|sutras?)\s+(?=\d)"
+)
+
+# Common short names -> work name as it appears in citations
+WORK_ALIASES: Dict[str, str] = {
+    "bg": "bhagavad gita",
+    "gita": "bhagavad gita",
+    "bhagavad gita": "bhagavad gita",
+    "bhagavadgita": "bhagavad gita",
+    "ys": "yoga sutra",
+    "yoga sutras": "yoga sutra",
+    "yoga sutra": "yoga sutra",
+}
+
+
+def normalize_work(work: str) -> str:
+    work = " ".join(work.lower().replace(",", " ").split())
+    if work.startswith("the "):
+        work = work[4:]
+    return WORK_ALIASES.get(work, work)
+
+
+def parse_citation(citation: str) -> Optional[Tuple[str, int, int]]:
+    """
+    (work, chapter, verse) of a stored citation, or None.
+    Single-number citations map to (work, n, 0).
+    """
+    m = _CITATION.match(citation.strip())
+    if not m or not m.group("work"):
+        return None
+
+    verse = m.group("verse")
+    return (
+        normalize_work(m.group("work")),
+        int(m.group("chapter")),
+        int(verse) if verse else 0,
+    )
+
+
+def parse_verse_reference(text: str) -> Optional[VerseRange]:
+    """
+    Parse a user reference ("Gita 2.47", "gita 2.47 to 2.50",
+    "chapter 3"). Returns None for anything else, including
+    ranges that end before they start.
+    """
+    t = " ".join(text.lower().strip().rstrip("?.!").split())
+    t = _CHAPTER_VERSE.sub(r"chapter \1.\2", t)
+    t = _RANGE_VERSE.sub(r"\1 ", t)
+    m = _REFERENCE.match(t)
+    if not m:
+        return None
+
+    work = re.sub(r"\bchapters?$", "", m.group("work")).strip(" ,:")
+    has_chapter_word = re.search(r"\bchapters?\s+\d", t) is not None
+
+    # A bare number is not a reference
+    if not work and not has_chapter_word:
+        return None
+
+    c1 = int(m.group("c1"))
+    v1 = int(m.group("v1")) if m.group("v1") else None
+    e1, e2 = m.group("e1"), m.group("e2")
+
+    if e1 is None:
+        end_chapter, end_verse = c1, v1
+    elif e2 is not None:
+        end_chapter, end_verse = int(e1), int(e2)
+    elif v1 is not None:
+        end_chapter, end_verse = c1, int(e1)  # "2.47-50"
+    else:
+        end_chapter, end_verse = int(e1), None  # "chapters 2-3"
+
+    start_key = (c1, v1 if v1 is not None else 0)
+    end_key = (end_chapter, end_verse if end_verse is not None else 0)
+    if end_key < start_key:
+        return None
+
+    return VerseRange(
+        work=normalize_work(work) if work else None,
+        start_chapter=c1,
+        start_verse=v1,
+        end_chapter=end_chapter,
+        end_verse=end_verse,
+    )
+
+
+# -------------------------------------------------
+# INDEX
+# -------------------------------------------------
+class VerseIndex:
+    """
+    Per-work sorted (chapter, verse) keys with parallel row lists.
+    Built once; lookups are O(log n + k).
+    """
+
+    def __init__(self, rows: Iterable = ()):
+        positioned: Dict[str, List[Tuple[Tuple[int, int], object]]] = {}
+
+        for r in rows:
+            parsed = parse_citation(getattr(r, "citation", "") or "")
+            if parsed is None:
+                continue
+            work, chapter, verse = parsed
+            positioned.setdefault(work, []).append(((chapter, verse), r))
+
+        self._keys: Dict[str, List[Tuple[int, int]]] = {}
+        self._rows: Dict[str, Tuple] = {}
+
+        for work, entries in positioned.items():
+            # Stable sort: same position keeps load order
+            entries.sort(key=lambda e: e[0])
+            self._keys[work] = [k for k, _ in entries]
+            self._rows[work] = tuple(r for _, r in entries)
+
+    @property
+    def works(self) -> Tuple[str, ...]:
+        return tuple(self._keys)
+
+    def resolve_work(self, work: str) -> Optional[str]:
+        """
+        Indexed work name for a user-supplied one: exact/alias match,
+        else the single indexed work containing it as whole words.
+        """
+        name = normalize_work(work)
+        if name in self._keys:
+            return name
+
+        padded = f" {name} "
+        candidates = [w for w in self._keys if padded in f" {w} "]
+        return candidates[0] if len(candidates) == 1 else None
+
+    def _slice(self, work, lo_key, hi_key, hi_inclusive) -> Tuple:
+        keys = self._keys[work]
+        lo = bisect_left(keys, lo_key)
+        if hi_inclusive:
+            hi = bisect_right(keys, hi_key)
+        else:
+            hi = bisect_left(keys, hi_key)
+        return self._rows[work][lo:hi]
+
+    def _range_in(self, work: str, ref: VerseRange) -> Tuple:
+        lo_key = (ref.start_chapter, ref.start_verse or 0)
+        if ref.end_verse is None:
+            return self._slice(work, lo_key, (ref.end_chapter + 1, 0), False)
+        return self._slice(work, lo_key, (ref.end_chapter, ref.end_verse), True)
+
+    # -------------------------------------------------
+    # LOOKUPS
+    # -------------------------------------------------
+    def lookup(self, ref: VerseRange) -> Tuple:
+        """
+        Rows inside the range, ordered by work then position.
+        """
+        if ref.work is None:
+            return tuple(r for w in self._keys for r in self._range_in(w, ref))
+
+        work = self.resolve_work(ref.work)
+        if work is None:
+            return ()
+        return self._range_in(work, ref)
+
+    def verse(self, work: str, chapter: int, verse: int) -> Tuple:
+        return self.lookup(VerseRange(work, chapter, verse, chapter, verse))
+
+    def verse_range(
+        self,
+        work: str,
+        start: Tuple[int, int],
+        end: Tuple[int, int],
+    ) -> Tuple:
+        return self.lookup(VerseRange(work, start[0], start[1], end[0], end[1]))
+
+    def chapter(self, work: str | None, chapter: int) -> Tuple:
+        return self.lookup(VerseRange(work, chapter, None, chapter, None))
@@ -3,11 +3,14 @@ load_dotenv()
 
 from loguru import logger
 from core.assistant import Assistant
+from core.runtime.startup import format_startup_report, timed_phase
 
 
 def main():
     logger.info("Starting Rudra Assistant (Day 18.1 – Global Interrupt Enabled)")
-    assistant = Assistant()
+    with timed_phase("assistant.init"):
+        assistant = Assistant()
+    logger.info(format_startup_report())
     assistant.run()
 
 
@@ -3,33 +3,106 @@ Context Pack Builder
 
 Builds a safe, minimal context object
 from STM and LTM for decision support.
+
+Day 92 — versioned packs:
+- Builders read the live STM / LTM they are given (no private copies)
+- Each section is memoized against its store's write `version`;
+  only sections whose store changed are re-queried
+- STM entries also age out by TTL without a write, so that section
+  is additionally valid only until its oldest entry expires
+- The pack itself is reused until a section or the intent changes
+
+Every build() returns its own copy (entries included), so callers
+may mutate it without touching the memoized sections.
 """
 
-from core.memory.short_term_memory import ShortTermMemory
+from typing import Any, Callable, Dict, Tuple
+
 from core.memory.long_term_memory import LongTermMemory
+from core.memory.short_term_memory import ShortTermMemory
+
+
+RECENT_LIMIT = 5
 
 
 class ContextPackBuilder:
-    def __init__(self):
-        self.stm = ShortTermMemory()
-        self.ltm = LongTermMemory()
+    def __init__(self, *, stm: ShortTermMemory, ltm: LongTermMemory):
+        self.stm = stm
+        self.ltm = ltm
+
+        # section -> (store version, value)
+        self._sections: Dict[str, Tuple[int, Any]] = {}
+        # STM section stays valid until this time (STM clock)
+        self._recent_valid_until = float("-inf")
+
+        self._pack: dict | None = None
+        self._pack_intent: str | None = None
+        self._stale = True
 
+    # -------------------------------------------------
+    # SECTIONS
+    # -------------------------------------------------
+    def _section(self, name: str, store, fetch: Callable[[], Any]):
+        cached = self._sections.get(name)
+        if cached is not None and cached[0] == store.version:
+            return cached[1]
+
+        value = fetch()
+        # Version after the read: reads may evict expired entries
+        self._sections[name] = (store.version, value)
+        self._stale = True
+        return value
+
+    def _recent_conversation(self) -> list:
+        if self.stm.now() > self._recent_valid_until:
+            self._sections.pop("recent_conversation", None)
+
+        recent = self._section(
+            "recent_conversation",
+            self.stm,
+            lambda: self.stm.fetch_recent(limit=RECENT_LIMIT),
+        )
+
+        if self._stale:
+            self._recent_valid_until = (
+                min(e["timestamp"] for e in recent) + ShortTermMemory.TTL_SECONDS
+                if recent else float("inf")
+            )
+        return recent
+
+    # -------------------------------------------------
+    # PUBLIC
+    # -------------------------------------------------
     def build(self, *, intent: str | None = None) -> dict:
         """
         Build context pack for current interaction.
         """
 
-        context = {
-            "recent_conversation": [],
-            "user_facts": [],
-            "user_preferences": [],
-        }
-
         # STM — last few turns
-        context["recent_conversation"] = self.stm.fetch_recent(limit=5)
+        recent = self._recent_conversation()
 
         # LTM — selective, rule-based
-        context["user_facts"] = self.ltm.fetch_by_type("user_fact")
-        context["user_preferences"] = self.ltm.fetch_by_type("user_preference")
+        facts = self._section(
+            "user_facts",
+            self.ltm,
+            lambda: self.ltm.fetch_by_type("user_fact"),
+        )
+        preferences = self._section(
+            "user_preferences",
+            self.ltm,
+            lambda: self.ltm.fetch_by_type("user_preference"),
+        )
 
-        return context
+        if self._stale or self._pack is None or intent != self._pack_intent:
+            self._pack = {
+                "recent_conversation": recent,
+                "user_facts": facts,
+                "user_preferences": preferences,
+            }
+            self._pack_intent = intent
+            self._stale = False
+
+        return {
+            name: [dict(entry) for entry in entries]
+            for name, entries in self._pack.items()
+        }
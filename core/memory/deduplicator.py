@@ -1,41 +1,129 @@
 # core/memory/deduplicator.py
 
 import re
+from typing import Dict, Hashable, Tuple
+
+
+_NON_WORD = re.compile(r"[^\w\s]")
+_SPACES = re.compile(r"\s+")
 
 
 class MemoryDeduplicator:
+    """
+    Day 23.3 — duplicate / conflict-candidate detection.
+
+    Day 89 — canonical keys:
+    - exact key: normalized content
+    - core key:  exact key without preference verbs
+    Both are computed once per stored entry and indexed per memory
+    type, so classify() is a dictionary lookup.
+    """
+
     PREFERENCE_VERBS = [
         "like", "love", "prefer", "enjoy", "dislike", "hate"
     ]
 
+    _VERBS = re.compile(
+        r"\b(?:" + "|".join(map(re.escape, PREFERENCE_VERBS)) + r")\b"
+    )
+
+    def __init__(self):
+        # entry id -> (type, exact key, core key)
+        self._keys: Dict[str, Tuple[Hashable, str, str]] = {}
+        # (type, core key) -> {entry id: exact key}, in store order
+        self._by_core: Dict[Tuple[Hashable, str], Dict[str, str]] = {}
+        # (type, exact key) -> {entry id: None}, in store order
+        self._by_exact: Dict[Tuple[Hashable, str], Dict[str, None]] = {}
+
+    # -------------------------------------------------
+    # CANONICAL KEYS
+    # -------------------------------------------------
     def _normalize(self, text: str) -> str:
         text = text.lower()
-        text = re.sub(r"[^\w\s]", "", text)
-        text = re.sub(r"\s+", " ", text)
+        text = _NON_WORD.sub("", text)
+        text = _SPACES.sub(" ", text)
         return text.strip()
 
     def _remove_preference_verbs(self, text: str) -> str:
-        for verb in self.PREFERENCE_VERBS:
-            text = re.sub(rf"\b{verb}\b", "", text)
-        return re.sub(r"\s+", " ", text).strip()
+        text = self._VERBS.sub("", text)
+        return _SPACES.sub(" ", text).strip()
+
+    def canonical_keys(self, content: str) -> Tuple[str, str]:
+        """
+        (exact key, core key) of a memory's content.
+        """
+        exact = self._normalize(content)
+        return exact, self._remove_preference_verbs(exact)
+
+    # -------------------------------------------------
+    # INDEX (kept in step with the LTM store)
+    # -------------------------------------------------
+    def add(self, entry) -> None:
+        if entry.id in self._keys:
+            self.remove(entry.id)
+
+        exact, core = self.canonical_keys(entry.content)
+        self._keys[entry.id] = (entry.type, exact, core)
+        self._by_core.setdefault((entry.type, core), {})[entry.id] = exact
+        self._by_exact.setdefault((entry.type, exact), {})[entry.id] = None
 
+    def remove(self, entry_id: str) -> bool:
+        keys = self._keys.pop(entry_id, None)
+        if keys is None:
+            return False
+
+        memory_type, exact, core = keys
+        for index, key in (
+            (self._by_core, (memory_type, core)),
+            (self._by_exact, (memory_type, exact)),
+        ):
+            bucket = index[key]
+            del bucket[entry_id]
+            if not bucket:
+                del index[key]
+        return True
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._by_core.clear()
+        self._by_exact.clear()
+
+    def classify(self, new_entry) -> str:
+        """
+        Same result as check(new_entry, <indexed entries in store order>).
+        """
+        exact, core = self.canonical_keys(new_entry.content)
+
+        if core:
+            # First same-type entry sharing the core decides:
+            # identical exact key -> duplicate, otherwise conflict
+            bucket = self._by_core.get((new_entry.type, core))
+            if bucket:
+                first_exact = next(iter(bucket.values()))
+                return "duplicate" if first_exact == exact else "conflict_candidate"
+            return "unique"
+
+        if (new_entry.type, exact) in self._by_exact:
+            return "duplicate"
+        return "unique"
+
+    # -------------------------------------------------
+    # LIST SCAN (no index)
+    # -------------------------------------------------
     def check(self, new_entry, existing_entries) -> str:
-        new_norm = self._normalize(new_entry.content)
+        new_norm, new_core = self.canonical_keys(new_entry.content)
 
         for entry in existing_entries:
             if entry.type != new_entry.type:
                 continue
 
-            existing_norm = self._normalize(entry.content)
+            existing_norm, existing_core = self.canonical_keys(entry.content)
 
             # Exact duplicate
             if existing_norm == new_norm:
                 return "duplicate"
 
             # Near duplicate (same core meaning)
-            new_core = self._remove_preference_verbs(new_norm)
-            existing_core = self._remove_preference_verbs(existing_norm)
-
             if new_core and new_core == existing_core:
                 return "conflict_candidate"
 
@@ -14,10 +14,7 @@ def explain_last(trace_sink: MemoryTraceSink) -> Optional[MemoryUsageTrace]:
     Returns:
         MemoryUsageTrace if available, else None
     """
-    traces = trace_sink.fetch_all()
-    if not traces:
-        return None
-    return traces[-1]
+    return trace_sink.fetch_last()
 
 
 def explain_all(trace_sink: MemoryTraceSink) -> List[MemoryUsageTrace]:
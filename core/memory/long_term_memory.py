@@ -7,12 +7,17 @@ Purpose:
 """
 
 class LongTermMemory:
+    def __init__(self):
+        # Day 92 — write counter (see ContextPackBuilder)
+        self.version = 0
+
     def store(self, *, content: str, memory_type: str, confidence: float):
         """
         Store a long-term memory entry.
         DB write will be added later.
         """
         # skeleton — no-op
+        self.version += 1
         return
 
     def fetch_by_type(self, memory_type: str):
@@ -0,0 +1,185 @@
+from bisect import bisect_right, insort
+from heapq import merge
+from itertools import islice
+from typing import Dict, Iterator, List, Tuple
+
+from core.memory.ltm.entry import LongTermMemoryEntry, MemoryType
+from core.memory.ltm.store import LongTermMemoryStore
+
+
+# (-confidence, save sequence, id): best first, ties in save order
+_RankKey = Tuple[float, int, str]
+
+QUERY_FILTERS = frozenset({"type", "min_confidence", "source", "limit"})
+
+
+class IndexedLongTermMemoryStore(LongTermMemoryStore):
+    """
+    Day 87 — Indexed in-memory Long-Term Memory store.
+
+    Indexes (maintained on every write):
+    - id -> entry                    (O(1) lookup / delete)
+    - type -> {id -> entry}          (save order, O(1) delete)
+    - confidence-ordered keys, global and per type (bisect)
+
+    Entries are stored exactly as provided (no mutation, no inference).
+    The confidence index uses the value at save time; save the entry
+    again to re-rank it.
+
+    `version` is bumped on every write (save / delete / clear).
+    """
+
+    def __init__(self):
+        self._by_id: Dict[str, LongTermMemoryEntry] = {}
+        self._by_type: Dict[MemoryType, Dict[str, LongTermMemoryEntry]] = {}
+
+        self._rank: List[_RankKey] = []
+        self._rank_by_type: Dict[MemoryType, List[_RankKey]] = {}
+        self._rank_key: Dict[str, _RankKey] = {}
+
+        self._seq = 0
+        self.version = 0
+
+    # -------------------------------------------------
+    # WRITE
+    # -------------------------------------------------
+    def save(self, entry: LongTermMemoryEntry) -> None:
+        """
+        Store an entry; saving an existing id replaces it.
+        """
+        if entry.id in self._by_id:
+            self.delete(entry.id)
+
+        key = (-entry.confidence, self._seq, entry.id)
+        self._seq += 1
+
+        self._by_id[entry.id] = entry
+        self._by_type.setdefault(entry.type, {})[entry.id] = entry
+        self._rank_key[entry.id] = key
+        insort(self._rank, key)
+        insort(self._rank_by_type.setdefault(entry.type, []), key)
+        self.version += 1
+
+    def delete(self, entry_id: str) -> bool:
+        """
+        Delete a memory entry by ID.
+
+        Returns:
+            True if deletion occurred, False otherwise
+        """
+        entry = self._by_id.pop(entry_id, None)
+        if entry is None:
+            return False
+
+        bucket = self._by_type[entry.type]
+        del bucket[entry_id]
+        if not bucket:
+            del self._by_type[entry.type]
+
+        key = self._rank_key.pop(entry_id)
+        self._remove_key(self._rank, key)
+        ranked = self._rank_by_type[entry.type]
+        self._remove_key(ranked, key)
+        if not ranked:
+            del self._rank_by_type[entry.type]
+
+        self.version += 1
+        return True
+
+    @staticmethod
+    def _remove_key(keys: List[_RankKey], key: _RankKey) -> None:
+        # Keys are unique (save sequence), so bisect finds the exact slot
+        del keys[bisect_right(keys, key) - 1]
+
+    def clear(self) -> None:
+        """
+        Remove all stored memories (useful for tests).
+        """
+        self._by_id.clear()
+        self._by_type.clear()
+        self._rank.clear()
+        self._rank_by_type.clear()
+        self._rank_key.clear()
+        self.version += 1
+
+    # -------------------------------------------------
+    # READ
+    # -------------------------------------------------
+    def get(self, entry_id: str) -> LongTermMemoryEntry | None:
+        return self._by_id.get(entry_id)
+
+    def list_all(self) -> List[LongTermMemoryEntry]:
+        """
+        Return all stored LTM entries (save order).
+        """
+        return list(self._by_id.values())
+
+    def list_by_type(self, memory_type: MemoryType) -> List[LongTermMemoryEntry]:
+        """
+        Entries of one type, in save order.
+        """
+        return list(self._by_type.get(memory_type, {}).values())
+
+    def query(self, filters: dict | None = None) -> List[LongTermMemoryEntry]:
+        """
+        Filtered entries, highest confidence first (ties: save order).
+
+        Filters (all optional):
+        - type:           MemoryType, its value, or an iterable of either
+        - min_confidence: inclusive floor
+        - source:         exact match
+        - limit:          max entries returned
+        """
+        filters = dict(filters or {})
+        unknown = set(filters) - QUERY_FILTERS
+        if unknown:
+            raise ValueError(f"Unknown LTM query filters: {sorted(unknown)}")
+
+        limit = filters.get("limit")
+        if limit is not None and limit <= 0:
+            return []
+
+        source = filters.get("source")
+        min_confidence = filters.get("min_confidence")
+
+        matches: List[LongTermMemoryEntry] = []
+        for key in self._ranked(filters.get("type"), min_confidence):
+            entry = self._by_id[key[2]]
+            if source is not None and entry.source != source:
+                continue
+            matches.append(entry)
+            if limit is not None and len(matches) == limit:
+                break
+
+        return matches
+
+    def _ranked(self, types, min_confidence) -> Iterator[_RankKey]:
+        if types is None:
+            lists = [self._rank]
+        else:
+            lists = [
+                self._rank_by_type[t]
+                for t in self._resolve_types(types)
+                if t in self._rank_by_type
+            ]
+
+        if min_confidence is not None:
+            # Keys with -confidence <= -min_confidence, i.e. a prefix
+            bound = (-min_confidence, float("inf"), "")
+            walks = [islice(keys, bisect_right(keys, bound)) for keys in lists]
+        else:
+            walks = [iter(keys) for keys in lists]
+
+        if len(walks) == 1:
+            return walks[0]
+        return merge(*walks)
+
+    @staticmethod
+    def _resolve_types(types) -> List[MemoryType]:
+        if isinstance(types, (MemoryType, str)):
+            types = [types]
+
+        resolved = []
+        for t in types:
+            resolved.append(t if isinstance(t, MemoryType) else MemoryType(t))
+        return list(dict.fromkeys(resolved))
@@ -0,0 +1,345 @@
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Sequence
+
+from core.memory.ltm.entry import LongTermMemoryEntry, MemoryType
+from core.memory.ltm.store import LongTermMemoryStore
+
+
+def default_ltm_path() -> Path:
+    project_root = Path(__file__).resolve().parents[3]
+    return project_root / "data" / "memory" / "ltm.sqlite3"
+
+
+# -------------------------------------------------
+# SCHEMA
+# -------------------------------------------------
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ltm_entries (
+    rowid              INTEGER PRIMARY KEY,
+    id                 TEXT NOT NULL UNIQUE,
+    type               TEXT NOT NULL,
+    content            TEXT NOT NULL,
+    content_norm       TEXT NOT NULL,
+    confidence         REAL NOT NULL,
+    source             TEXT NOT NULL,
+    created_at         TEXT NOT NULL,
+    last_reinforced_at TEXT,
+    updated_at         TEXT NOT NULL,
+    explain_reason     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_ltm_rank
+    ON ltm_entries (confidence DESC, updated_at DESC);
+CREATE INDEX IF NOT EXISTS ix_ltm_type_rank
+    ON ltm_entries (type, confidence DESC, updated_at DESC);
+CREATE INDEX IF NOT EXISTS ix_ltm_norm
+    ON ltm_entries (content_norm);
+"""
+
+# Trigram FTS5 = indexed substring search (CONTAINS)
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS ltm_fts USING fts5(
+    content_norm, content='ltm_entries', content_rowid='rowid',
+    tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS ltm_fts_ai AFTER INSERT ON ltm_entries BEGIN
+    INSERT INTO ltm_fts (rowid, content_norm)
+    VALUES (new.rowid, new.content_norm);
+END;
+CREATE TRIGGER IF NOT EXISTS ltm_fts_ad AFTER DELETE ON ltm_entries BEGIN
+    INSERT INTO ltm_fts (ltm_fts, rowid, content_norm)
+    VALUES ('delete', old.rowid, old.content_norm);
+END;
+"""
+
+# Shortest query the trigram index can answer
+_FTS_MIN_CHARS = 3
+
+_COLUMNS = (
+    "e.id, e.type, e.content, e.confidence, e.source, "
+    "e.created_at, e.last_reinforced_at, e.explain_reason"
+)
+
+_INSERT = (
+    "INSERT INTO ltm_entries (id, type, content, content_norm, confidence, "
+    "source, created_at, last_reinforced_at, updated_at, explain_reason) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_DELETE = "DELETE FROM ltm_entries WHERE id = ?"
+_SELECT = f"SELECT {_COLUMNS} FROM ltm_entries e"
+# FTS drives the join (CROSS JOIN keeps SQLite from reordering it)
+_SELECT_FTS = (
+    f"SELECT {_COLUMNS} FROM ltm_fts "
+    "CROSS JOIN ltm_entries e ON e.rowid = ltm_fts.rowid"
+)
+_ORDER = " ORDER BY e.confidence DESC, e.updated_at DESC, e.rowid"
+
+
+def normalize_content(text: str) -> str:
+    """
+    Same normalization as recall comparison.
+    """
+    return text.strip().lower()
+
+
+def _fts_phrase(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+class SQLiteLongTermMemoryStore(LongTermMemoryStore):
+    """
+    Day 88 — Persistent Long-Term Memory on local SQLite.
+
+    - WAL journal: readers never block the writer
+    - Parameterized statements only (sqlite3 caches them per connection)
+    - save_many(): one transaction for a batch of entries
+    - Trigram FTS5 index over normalized content for substring recall
+      (plain instr() scan if this SQLite build lacks FTS5 trigram)
+
+    Fully offline; one file, no server.
+
+    `version` counts writes made through this instance.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        if path is None:
+            path = default_ltm_path()
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(
+            str(path), check_same_thread=False, isolation_level=None
+        )
+        self._lock = threading.RLock()
+        self.version = 0
+
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._fts = self._init_fts()
+
+    def _init_fts(self) -> bool:
+        try:
+            self._conn.executescript(_FTS_SCHEMA)
+        except sqlite3.OperationalError:
+            return False
+        return True
+
+    @property
+    def has_fts(self) -> bool:
+        return self._fts
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # -------------------------------------------------
+    # WRITE
+    # -------------------------------------------------
+    @staticmethod
+    def _params(entry: LongTermMemoryEntry) -> tuple:
+        reinforced = entry.last_reinforced_at
+        return (
+            entry.id,
+            entry.type.value,
+            entry.content,
+            normalize_content(entry.content),
+            entry.confidence,
+            entry.source,
+            entry.created_at.isoformat(),
+            reinforced.isoformat() if reinforced else None,
+            (reinforced or entry.created_at).isoformat(),
+            entry.explain_reason,
+        )
+
+    def save(self, entry: LongTermMemoryEntry) -> None:
+        """
+        Store one entry; saving an existing id replaces it.
+        """
+        self.save_many([entry])
+
+    def save_many(self, entries: Iterable[LongTermMemoryEntry]) -> int:
+        """
+        Store a batch in a single transaction; returns entries written.
+        """
+        params = [self._params(e) for e in entries]
+        if not params:
+            return 0
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                # Replace = delete + insert, so FTS triggers stay simple
+                # and a re-saved entry ranks as newest among equals
+                self._conn.executemany(_DELETE, [(p[0],) for p in params])
+                self._conn.executemany(_INSERT, params)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            self.version += 1
+
+        return len(params)
+
+    def delete(self, entry_id: str) -> bool:
+        """
+        Delete a memory entry by ID.
+
+        Returns:
+            True if deletion occurred, False otherwise
+        """
+        with self._lock:
+            cur = self._conn.execute(_DELETE, (entry_id,))
+            if cur.rowcount > 0:
+                self.version += 1
+        return cur.rowcount > 0
+
+    def clear(self) -> None:
+        """
+        Remove all stored memories (useful for tests).
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM ltm_entries")
+            self.version += 1
+
+    # -------------------------------------------------
+    # READ
+    # -------------------------------------------------
+    @staticmethod
+    def _entry(row: Sequence) -> LongTermMemoryEntry:
+        (entry_id, type_, content, confidence, source,
+         created_at, reinforced, reason) = row
+        return LongTermMemoryEntry(
+            id=entry_id,
+            type=MemoryType(type_),
+            content=content,
+            confidence=confidence,
+            source=source,
+            created_at=datetime.fromisoformat(created_at),
+            last_reinforced_at=(
+                datetime.fromisoformat(reinforced) if reinforced else None
+            ),
+            explain_reason=reason,
+        )
+
+    def _fetch(self, sql: str, params: Sequence = ()) -> List[LongTermMemoryEntry]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._entry(r) for r in rows]
+
+    def get(self, entry_id: str) -> LongTermMemoryEntry | None:
+        found = self._fetch(_SELECT + " WHERE e.id = ?", (entry_id,))
+        return found[0] if found else None
+
+    def list_all(self) -> List[LongTermMemoryEntry]:
+        """
+        Return all stored LTM entries (save order).
+        """
+        return self._fetch(_SELECT + " ORDER BY e.rowid")
+
+    def list_by_type(self, memory_type: MemoryType) -> List[LongTermMemoryEntry]:
+        """
+        Entries of one type, in save order.
+        """
+        return self._fetch(
+            _SELECT + " WHERE e.type = ? ORDER BY e.rowid", (memory_type.value,)
+        )
+
+    def query(self, filters: dict | None = None) -> List[LongTermMemoryEntry]:
+        """
+        Filtered entries, highest confidence first (ties: save order).
+
+        Filters (all optional): type, min_confidence, source, limit —
+        same contract as IndexedLongTermMemoryStore.query().
+        """
+        filters = dict(filters or {})
+        unknown = set(filters) - {"type", "min_confidence", "source", "limit"}
+        if unknown:
+            raise ValueError(f"Unknown LTM query filters: {sorted(unknown)}")
+
+        limit = filters.get("limit")
+        if limit is not None and limit <= 0:
+            return []
+
+        where, params = [], []
+
+        types = filters.get("type")
+        if types is not None:
+            if isinstance(types, (MemoryType, str)):
+                types = [types]
+            values = sorted({MemoryType(t).value for t in types})
+            where.append(f"e.type IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+
+        if filters.get("min_confidence") is not None:
+            where.append("e.confidence >= ?")
+            params.append(filters["min_confidence"])
+
+        if filters.get("source") is not None:
+            where.append("e.source = ?")
+            params.append(filters["source"])
+
+        return self._fetch(
+            self._compose(_SELECT, where, " ORDER BY e.confidence DESC, e.rowid"),
+            self._with_limit(params, limit),
+        )
+
+    def search(
+        self,
+        *,
+        memory_type: MemoryType | None = None,
+        text: str | None = None,
+        exact: bool = False,
+        min_confidence: float = 0.0,
+        limit: int | None = None,
+    ) -> List[LongTermMemoryEntry]:
+        """
+        Recall push-down: type / confidence / text filters and
+        (confidence desc, last update desc) ordering run in SQL.
+
+        Text matching uses normalize_content() on both sides:
+        - exact:    normalized equality (B-tree index)
+        - contains: normalized substring (trigram FTS5, then verified)
+        """
+        select = _SELECT
+        where, params = [], []
+
+        needle = normalize_content(text) if text else ""
+        if needle and not exact and self._fts and len(needle) >= _FTS_MIN_CHARS:
+            select = _SELECT_FTS
+            where.append("ltm_fts MATCH ?")
+            params.append(_fts_phrase(needle))
+
+        where.append("e.confidence >= ?")
+        params.append(min_confidence)
+
+        if memory_type is not None:
+            where.append("e.type = ?")
+            params.append(memory_type.value)
+
+        if needle:
+            if exact:
+                where.append("e.content_norm = ?")
+            else:
+                # Exact substring semantics (FTS case folding is broader)
+                where.append("instr(e.content_norm, ?) > 0")
+            params.append(needle)
+
+        return self._fetch(
+            self._compose(select, where, _ORDER),
+            self._with_limit(params, limit),
+        )
+
+    @staticmethod
+    def _compose(select: str, where: List[str], order: str) -> str:
+        sql = select
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        return sql + order + " LIMIT ?"
+
+    @staticmethod
+    def _with_limit(params: List, limit: int | None) -> List:
+        # LIMIT -1 = no limit
+        return params + [limit if limit is not None else -1]
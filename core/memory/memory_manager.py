@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from loguru import logger
 
-from core.memory.ltm.in_memory_store import InMemoryLongTermMemoryStore
+from core.memory.ltm.indexed_store import IndexedLongTermMemoryStore
 from core.memory.ltm.entry import LongTermMemoryEntry
 from core.memory.deduplicator import MemoryDeduplicator
 
@@ -23,7 +23,8 @@ class MemoryManager:
         # (do NOT remove or refactor existing logic)
 
         # 🔵 Day 22.6 — Long-Term Memory store (explicit only)
-        self.ltm_store = InMemoryLongTermMemoryStore()
+        # 🔵 Day 87 — indexed by id / type / confidence
+        self.ltm_store = IndexedLongTermMemoryStore()
 
         # 🔵 Day 23.3 — Deduplication / conflict detection
         self._deduplicator = MemoryDeduplicator()
@@ -81,6 +82,7 @@ class MemoryManager:
         )
 
         self.ltm_store.save(entry)
+        self._deduplicator.add(entry)
 
         logger.info(
             f"LTM STORED | id={entry.id} | content='{entry.content}'"
@@ -98,13 +100,13 @@ class MemoryManager:
         Returns:
             Conflicting LongTermMemoryEntry if found, else None
         """
-        existing_entries = self.ltm_store.list_all()
-        result = self._deduplicator.check(new_entry, existing_entries)
+        # Canonical-key lookup; no scan unless there is a conflict
+        result = self._deduplicator.classify(new_entry)
 
         if result == "conflict_candidate":
-            for entry in existing_entries:
-                if entry.type == new_entry.type:
-                    return entry
+            same_type = self.ltm_store.list_by_type(new_entry.type)
+            if same_type:
+                return same_type[0]
 
         return None
 
@@ -125,7 +127,9 @@ class MemoryManager:
         """
 
         self.ltm_store.delete(old_entry.id)
+        self._deduplicator.remove(old_entry.id)
         self.ltm_store.save(new_entry)
+        self._deduplicator.add(new_entry)
 
         logger.info(
             f"LTM REPLACED | old_id={old_entry.id} | new_id={new_entry.id}"
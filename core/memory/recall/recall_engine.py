@@ -0,0 +1,220 @@
+import heapq
+from bisect import bisect_left, insort
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Sequence
+
+from core.memory.types import MemoryCategory
+
+from .recall_query import RecallQuery, MatchMode
+from .recall_result import RecallResult
+
+
+def normalize_recall_text(text: str) -> str:
+    """
+    Deterministic normalization for recall comparison only.
+    """
+    return text.strip().lower()
+
+
+class _Desc:
+    """
+    Reverses ordering of a comparable value (datetimes can't be negated).
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other: "_Desc") -> bool:
+        return self.value > other.value
+
+    def __eq__(self, other) -> bool:
+        return self.value == other.value
+
+
+class _RecallRecord:
+    """
+    One indexed entry: content normalized once, rank key precomputed.
+    """
+
+    __slots__ = ("result", "norm", "rank")
+
+    def __init__(self, result: RecallResult, seq: int):
+        self.result = result
+        self.norm = normalize_recall_text(result.content)
+        # Ascending rank == (confidence, last_updated) descending,
+        # ties in insertion order (same as a stable reverse sort)
+        self.rank = (-result.confidence, _Desc(result.last_updated), seq)
+
+
+def _as_result(entry) -> RecallResult:
+    """
+    Recall-shaped entries (category / last_updated) pass through;
+    LTM entries (type / last_reinforced_at) are mapped.
+    """
+    if isinstance(entry, RecallResult):
+        return entry
+
+    if hasattr(entry, "category"):
+        category, last_updated = entry.category, entry.last_updated
+    else:
+        category = MemoryCategory(entry.type.value)
+        last_updated = entry.last_reinforced_at or entry.created_at
+
+    return RecallResult(
+        memory_id=entry.id,
+        category=category,
+        content=entry.content,
+        confidence=entry.confidence,
+        created_at=entry.created_at,
+        last_updated=last_updated,
+    )
+
+
+class RecallEngine:
+    """
+    Day 90 — Indexed, read-only recall over a fixed entry set.
+
+    - Content normalized once per entry, query text once per query
+    - Rank index per category: records sorted by (confidence,
+      last_updated) descending, updated in place on every write
+      (bisect insert / delete, no re-sort). Unfiltered walks stop
+      at `limit` or at the confidence floor
+    - Text-filtered queries with a limit use heap top-k over the
+      matching records; exact text goes through its own index
+    - Streaming / paged iteration and batched queries
+
+    Results are identical to MemoryRecallManager's filter loop.
+    """
+
+    def __init__(self, entries: Iterable = ()):
+        self._records: Dict[str, _RecallRecord] = {}
+        self._by_text: Dict[str, Dict[str, _RecallRecord]] = {}
+        # category (None = all) -> records in rank order, kept sorted
+        self._ranked: Dict[MemoryCategory | None, List[_RecallRecord]] = {
+            None: []
+        }
+        self._seq = 0
+
+        for entry in entries:
+            self.add(entry)
+
+    # -------------------------------------------------
+    # INDEX MAINTENANCE
+    # -------------------------------------------------
+    def add(self, entry) -> None:
+        result = _as_result(entry)
+        self.remove(result.memory_id)
+
+        record = _RecallRecord(result, self._seq)
+        self._seq += 1
+
+        self._records[result.memory_id] = record
+        self._by_text.setdefault(record.norm, {})[result.memory_id] = record
+
+        for key in (None, result.category):
+            insort(self._ranked.setdefault(key, []), record, key=self._rank_key)
+
+    def remove(self, memory_id: str) -> bool:
+        record = self._records.pop(memory_id, None)
+        if record is None:
+            return False
+
+        bucket = self._by_text[record.norm]
+        del bucket[memory_id]
+        if not bucket:
+            del self._by_text[record.norm]
+
+        # Ranks are unique (seq), so bisect lands on the record itself
+        for key in (None, record.result.category):
+            ranked = self._ranked[key]
+            del ranked[bisect_left(ranked, record.rank, key=self._rank_key)]
+        return True
+
+    def _rank_index(self, category: MemoryCategory | None) -> List[_RecallRecord]:
+        return self._ranked.get(category, [])
+
+    @staticmethod
+    def _rank_key(record: _RecallRecord):
+        return record.rank
+
+    # -------------------------------------------------
+    # QUERIES
+    # -------------------------------------------------
+    def iter_recall(self, query: RecallQuery) -> Iterator[RecallResult]:
+        """
+        Stream results in rank order; work is proportional to how
+        far the stream is consumed.
+        """
+        needle = normalize_recall_text(query.text) if query.text else ""
+        floor = query.min_confidence
+        remaining = query.limit or len(self._records)
+
+        if needle and query.match_mode == MatchMode.EXACT:
+            heap = [
+                (r.rank, r.result)
+                for r in self._by_text.get(needle, {}).values()
+                if r.result.confidence >= floor
+                and (not query.category or r.result.category == query.category)
+            ]
+            heapq.heapify(heap)
+            while heap and remaining:
+                yield heapq.heappop(heap)[1]
+                remaining -= 1
+            return
+
+        if needle and query.limit:
+            # Matches are scattered through rank order: bounded heap
+            # top-k over the unordered records
+            top = heapq.nsmallest(
+                query.limit,
+                (
+                    r for r in self._records.values()
+                    if r.result.confidence >= floor
+                    and needle in r.norm
+                    and (
+                        not query.category
+                        or r.result.category == query.category
+                    )
+                ),
+                key=self._rank_key,
+            )
+            for r in top:
+                yield r.result
+            return
+
+        for r in self._rank_index(query.category or None):
+            if r.result.confidence < floor:
+                return  # rank order: everything after is below the floor
+            if needle and needle not in r.norm:
+                continue
+            yield r.result
+            remaining -= 1
+            if not remaining:
+                return
+
+    def recall(self, query: RecallQuery) -> List[RecallResult]:
+        return list(self.iter_recall(query))
+
+    def recall_pages(
+        self, query: RecallQuery, page_size: int
+    ) -> Iterator[List[RecallResult]]:
+        """
+        Rank-ordered results in pages of `page_size`.
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+
+        stream = self.iter_recall(query)
+        while True:
+            page = list(islice(stream, page_size))
+            if not page:
+                return
+            yield page
+
+    def recall_many(self, queries: Sequence[RecallQuery]) -> List[List[RecallResult]]:
+        """
+        Serve several queries in one call; each runs as recall(q).
+        """
+        return [self.recall(q) for q in queries]
@@ -1,5 +1,9 @@
 from loguru import logger
 
+from core.memory.ltm.entry import MemoryType
+from core.memory.types import MemoryCategory
+
+from .recall_engine import RecallEngine, normalize_recall_text
 from .recall_query import RecallQuery, MatchMode
 from .recall_result import RecallResult
 from .exceptions import RecallAccessViolation
@@ -12,8 +16,19 @@ class MemoryRecallManager:
     """
     Read-only memory recall boundary.
     No writes, no mutation, no inference.
+
+    Day 88 — an indexed LTM store (one exposing `search`, e.g. the
+    SQLite backend) receives every filter, the ordering and the limit;
+    without one, entries are filtered here in Python.
+
+    Day 90 — a RecallEngine (pre-normalized, indexed entries) takes
+    precedence over both.
     """
 
+    def __init__(self, store=None, engine: RecallEngine | None = None):
+        self._store = store
+        self._engine = engine
+
     def _fetch_all_ltm_entries(self):
         """
         Read-only fetch of all LTM entries.
@@ -27,7 +42,17 @@ class MemoryRecallManager:
         """
         Deterministic normalization for recall comparison only.
         """
-        return text.strip().lower()
+        return normalize_recall_text(text)
+
+    def recall_many(self, queries) -> list[list[RecallResult]]:
+        """
+        Serve several queries in one call (shared filtering with an engine).
+        """
+        if self._engine is not None:
+            if not READ_ONLY:
+                raise RecallAccessViolation("Recall layer must be read-only")
+            return self._engine.recall_many(list(queries))
+        return [self.recall(q) for q in queries]
 
     def recall(self, query: RecallQuery) -> list[RecallResult]:
         if not READ_ONLY:
@@ -41,10 +66,17 @@ class MemoryRecallManager:
             query.match_mode,
         )
 
+        if self._engine is not None:
+            return self._engine.recall(query)
+
+        if self._store is not None and hasattr(self._store, "search"):
+            return self._recall_indexed(query)
+
         # 1️⃣ Fetch all entries (read-only)
         entries = self._fetch_all_ltm_entries()
 
         # 2️⃣ Deterministic filtering
+        query_text = self._normalize(query.text) if query.text else ""
         filtered = []
         for entry in entries:
             # Category filter
@@ -58,7 +90,6 @@ class MemoryRecallManager:
             # Text matching filter
             if query.text:
                 entry_text = self._normalize(entry.content)
-                query_text = self._normalize(query.text)
 
                 if query.match_mode == MatchMode.EXACT:
                     if entry_text != query_text:
@@ -92,3 +123,29 @@ class MemoryRecallManager:
             )
             for entry in filtered
         ]
+
+    def _recall_indexed(self, query: RecallQuery) -> list[RecallResult]:
+        """
+        Same filters / ordering / limit, executed by the store.
+        """
+        entries = self._store.search(
+            memory_type=(
+                MemoryType(query.category.value) if query.category else None
+            ),
+            text=query.text,
+            exact=query.match_mode == MatchMode.EXACT,
+            min_confidence=query.min_confidence,
+            limit=query.limit,
+        )
+
+        return [
+            RecallResult(
+                memory_id=entry.id,
+                category=MemoryCategory(entry.type.value),
+                content=entry.content,
+                confidence=entry.confidence,
+                created_at=entry.created_at,
+                last_updated=entry.last_reinforced_at or entry.created_at,
+            )
+            for entry in entries
+        ]
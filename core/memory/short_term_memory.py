@@ -7,11 +7,51 @@ Purpose:
 - Fast recall
 - Automatic decay (TTL)
 - Safe, filtered read access
+
+Day 86 — storage layout:
+- Fixed-size ring of slotted records (no per-item dicts)
+- Per-role and per-intent secondary indexes (oldest -> newest)
+- Reads walk newest-first and stop after `limit` matches;
+  only the returned entries are materialized as dicts
+
+Day 91 — with an ExpiryService, TTL eviction is proactive (one
+timer per entry) and reads never run the cleanup pass; expired
+entries are skipped at the read boundary in O(1) each.
+
+Day 92 — `version` counts writes (stores and evictions), so readers
+can memoize what they fetched.
 """
 
+import heapq
 import time
 from collections import deque
-from typing import Iterable
+from typing import Deque, Dict, Iterable, Iterator, List
+
+from core.runtime.expiry import ExpiryService
+
+
+class _STMRecord:
+    __slots__ = (
+        "seq", "role", "content", "intent", "confidence", "timestamp", "timer",
+    )
+
+    def __init__(self, seq, role, content, intent, confidence, timestamp):
+        self.seq = seq
+        self.role = role
+        self.content = content
+        self.intent = intent
+        self.confidence = confidence
+        self.timestamp = timestamp
+        self.timer = None
+
+    def as_dict(self) -> dict:
+        return {
+            "role": self.role,
+            "content": self.content,
+            "intent": self.intent,
+            "confidence": self.confidence,
+            "timestamp": self.timestamp,
+        }
 
 
 class ShortTermMemory:
@@ -28,9 +68,19 @@ class ShortTermMemory:
     DEFAULT_READ_LIMIT = 5
     MIN_READ_CONFIDENCE = 0.70
 
-    def __init__(self):
-        # deque preserves insertion order (FIFO)
-        self._items = deque()
+    def __init__(self, expiry: ExpiryService | None = None):
+        self._expiry = expiry
+
+        self._capacity = self.MAX_ITEMS
+        self._ring: List[_STMRecord | None] = [None] * self._capacity
+        self._head = 0          # index of the oldest record
+        self._size = 0
+        self._seq = 0
+        self._version = 0
+
+        # Secondary indexes, insertion order (oldest on the left)
+        self._by_role: Dict[str, Deque[_STMRecord]] = {}
+        self._by_intent: Dict[str, Deque[_STMRecord]] = {}
 
     # -------------------------------
     # Internal helpers
@@ -38,19 +88,62 @@ class ShortTermMemory:
     def _now(self) -> float:
         return time.time()
 
+    def now(self) -> float:
+        """
+        Current time on the clock entry timestamps are taken from.
+        """
+        return self._now()
+
+    @property
+    def version(self) -> int:
+        """
+        Bumped on every change to the stored entries.
+        """
+        return self._version
+
+    def _oldest(self) -> _STMRecord:
+        return self._ring[self._head]
+
+    def _evict_oldest(self) -> None:
+        record = self._ring[self._head]
+        if record.timer is not None:
+            record.timer.cancel()
+        self._ring[self._head] = None
+        self._head = (self._head + 1) % self._capacity
+        self._size -= 1
+        self._version += 1
+
+        # The oldest record is also the oldest of its role / intent
+        for index, key in (
+            (self._by_role, record.role),
+            (self._by_intent, record.intent),
+        ):
+            bucket = index[key]
+            bucket.popleft()
+            if not bucket:
+                del index[key]
+
     def _cleanup(self):
         """
-        Remove expired or excess entries.
+        Remove expired entries (capacity is enforced on write).
         """
         now = self._now()
 
         # TTL-based eviction
-        while self._items and (now - self._items[0]["timestamp"] > self.TTL_SECONDS):
-            self._items.popleft()
+        while self._size and (now - self._oldest().timestamp > self.TTL_SECONDS):
+            self._evict_oldest()
 
-        # Capacity-based eviction (FIFO)
-        while len(self._items) > self.MAX_ITEMS:
-            self._items.popleft()
+    def _expire(self, record: _STMRecord) -> None:
+        """
+        Timer callback: drop `record` and anything older (same TTL).
+        """
+        record.timer = None
+        while self._size and self._oldest().seq <= record.seq:
+            self._evict_oldest()
+
+    def _newest_first(self) -> Iterator[_STMRecord]:
+        for k in range(self._size - 1, -1, -1):
+            yield self._ring[(self._head + k) % self._capacity]
 
     # -------------------------------
     # Public API — WRITE
@@ -59,13 +152,26 @@ class ShortTermMemory:
         """
         Store a short-term memory entry (in-memory only).
         """
-        self._items.append({
-            "role": role,
-            "content": content,
-            "intent": intent,
-            "confidence": confidence,
-            "timestamp": self._now(),
-        })
+        # Capacity-based eviction (FIFO)
+        if self._size == self._capacity:
+            self._evict_oldest()
+
+        record = _STMRecord(
+            self._seq, role, content, intent, confidence, self._now()
+        )
+        self._seq += 1
+
+        self._ring[(self._head + self._size) % self._capacity] = record
+        self._size += 1
+        self._version += 1
+        self._by_role.setdefault(role, deque()).append(record)
+        self._by_intent.setdefault(intent, deque()).append(record)
+
+        if self._expiry is not None:
+            record.timer = self._expiry.schedule(
+                self.TTL_SECONDS, lambda: self._expire(record)
+            )
+            return
 
         # Enforce limits immediately
         self._cleanup()
@@ -92,7 +198,8 @@ class ShortTermMemory:
         - Newest-last ordering
         """
 
-        self._cleanup()
+        if self._expiry is None:
+            self._cleanup()
 
         # ---------------------------
         # Resolve and validate limits
@@ -106,38 +213,57 @@ class ShortTermMemory:
         if min_confidence is None:
             min_confidence = self.MIN_READ_CONFIDENCE
 
-        # ---------------------------
-        # Start with all items
-        # ---------------------------
-        items = list(self._items)
-
-        # ---------------------------
-        # Role filter
-        # ---------------------------
-        if role is not None:
-            if role not in {"user", "assistant"}:
-                return []
-            items = [x for x in items if x["role"] == role]
+        if role is not None and role not in {"user", "assistant"}:
+            return []
 
         # ---------------------------
-        # Intent filter
+        # Pick the narrowest index
         # ---------------------------
         if intents is not None:
-            intents = set(intents)
-            items = [x for x in items if x["intent"] in intents]
+            buckets = [
+                self._by_intent[i] for i in set(intents) if i in self._by_intent
+            ]
+            if len(buckets) == 1:
+                candidates = reversed(buckets[0])
+            else:
+                candidates = heapq.merge(
+                    *(reversed(b) for b in buckets), key=lambda r: -r.seq
+                )
+        elif role is not None:
+            candidates = reversed(self._by_role.get(role, ()))
+            role = None  # already satisfied by the index
+        else:
+            candidates = self._newest_first()
 
         # ---------------------------
-        # Confidence filter
+        # Newest-first scan, stop at limit
         # ---------------------------
-        items = [x for x in items if x["confidence"] >= min_confidence]
+        now = self._now()
+        picked: List[_STMRecord] = []
+        for record in candidates:
+            if now - record.timestamp > self.TTL_SECONDS:
+                break  # newest-first: the rest are older still
+            if role is not None and record.role != role:
+                continue
+            if record.confidence < min_confidence:
+                continue
+            picked.append(record)
+            if len(picked) == limit:
+                break
 
-        # ---------------------------
-        # Return newest-last slice
-        # ---------------------------
-        return items[-limit:]
+        # Newest-last ordering
+        return [record.as_dict() for record in reversed(picked)]
 
     def clear(self):
         """
         Clear all STM entries.
         """
-        self._items.clear()
+        for record in self._newest_first():
+            if record.timer is not None:
+                record.timer.cancel()
+        self._ring = [None] * self._capacity
+        self._head = 0
+        self._size = 0
+        self._version += 1
+        self._by_role.clear()
+        self._by_intent.clear()
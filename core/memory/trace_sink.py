@@ -1,6 +1,11 @@
-from typing import List
-
 from core.memory.trace import MemoryUsageTrace
+from core.runtime.tracing import (
+    DEFAULT_RING_CAPACITY,
+    JsonlTraceExporter,
+    TraceEvent,
+    TraceRing,
+    make_event,
+)
 
 
 class MemoryTraceSink:
@@ -10,16 +15,50 @@ class MemoryTraceSink:
     - NOT persisted
     - NOT long-term
     - Cleared on session end
+
+    Day 93 — bounded:
+    - Usage traces and structured events (emit) live in fixed-size
+      rings; the oldest are overwritten
+    - An optional exporter receives every record (non-blocking)
     """
 
-    def __init__(self):
-        self._traces: List[MemoryUsageTrace] = []
+    def __init__(
+        self,
+        capacity: int = DEFAULT_RING_CAPACITY,
+        exporter: JsonlTraceExporter | None = None,
+    ):
+        self._traces: TraceRing[MemoryUsageTrace] = TraceRing(capacity)
+        self._events: TraceRing[TraceEvent] = TraceRing(capacity)
+        self._exporter = exporter
 
     def record(self, trace: MemoryUsageTrace) -> None:
         self._traces.append(trace)
+        if self._exporter is not None:
+            self._exporter.offer(trace)
+
+    def emit(self, kind: str, **fields) -> TraceEvent:
+        """
+        Record a structured event (e.g. influence gate decisions).
+        """
+        event = make_event(kind, **fields)
+        self._events.append(event)
+        if self._exporter is not None:
+            self._exporter.offer(event)
+        return event
 
     def fetch_all(self) -> list[MemoryUsageTrace]:
-        return list(self._traces)
+        return self._traces.snapshot()
+
+    def fetch_last(self) -> MemoryUsageTrace | None:
+        return self._traces.last()
+
+    def fetch_events(self) -> list[TraceEvent]:
+        return self._events.snapshot()
+
+    @property
+    def overwritten(self) -> int:
+        return self._traces.overwritten + self._events.overwritten
 
     def clear(self) -> None:
         self._traces.clear()
+        self._events.clear()
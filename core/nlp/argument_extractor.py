@@ -8,6 +8,8 @@ import os
 from typing import Dict, Any, Tuple
 from enum import Enum
 
+from core.nlp.utterance import AnalyzedUtterance, as_utterance
+
 
 class ArgumentType(Enum):
     URL = "url"
@@ -51,9 +53,13 @@ class ArgumentExtractor:
             )
         }
 
-    def extract_for_intent(self, text: str, intent: str) -> Dict[str, Any]:
+    def extract_for_intent(
+        self, text: str | AnalyzedUtterance, intent: str
+    ) -> Dict[str, Any]:
         intent = intent.upper()
-        text_lower = text.lower()
+        utterance = as_utterance(text)
+        text = utterance.raw
+        text_lower = utterance.text
 
         args = {
             'raw_text': text,
@@ -66,7 +72,7 @@ class ArgumentExtractor:
 
         # ---------------- DAY 50: TEMP OPEN_APP ----------------
         if intent == "OPEN_APP":
-            words = text_lower.split()
+            words = utterance.tokens
             for i, w in enumerate(words):
                 if w in ("open", "launch", "start") and i + 1 < len(words):
                     return {
@@ -80,7 +86,7 @@ class ArgumentExtractor:
             return self._extract_browser_args(text_lower)
 
         if intent == "OPEN_TERMINAL":
-            return self._extract_terminal_args(text_lower)
+            return self._extract_terminal_args(utterance.tokens)
 
         if intent == "OPEN_FILE_MANAGER":
             return self._extract_file_manager_args(text_lower)
@@ -89,7 +95,7 @@ class ArgumentExtractor:
             return self._extract_search_args(text)
 
         if intent == "OPEN_FILE":
-            return self._extract_file_args(text_lower)
+            return self._extract_file_args(utterance.tokens)
 
         if intent == "LIST_FILES":
             return self._extract_list_files_args(text_lower)
@@ -110,8 +116,7 @@ class ArgumentExtractor:
 
         return {'url': 'https://google.com', 'target': 'default'}
 
-    def _extract_terminal_args(self, text: str) -> Dict[str, Any]:
-        words = text.split()
+    def _extract_terminal_args(self, words: Tuple[str, ...]) -> Dict[str, Any]:
         for i, word in enumerate(words):
             if word in ['terminal', 'cmd', 'bash', 'powershell'] and i + 1 < len(words):
                 return {
@@ -140,8 +145,8 @@ class ArgumentExtractor:
             return {'query': match.group(1).strip(), 'target': 'web_search'}
         return {}
 
-    def _extract_file_args(self, text: str) -> Dict[str, Any]:
-        for word in text.split():
+    def _extract_file_args(self, words: Tuple[str, ...]) -> Dict[str, Any]:
+        for word in words:
             if '.' in word:
                 return {'filename': word, 'target': 'named_file'}
         return {}
@@ -1,5 +1,7 @@
 import re
 
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
 # Expanded filler words (safe to grow)
 FILLER_WORDS = {
     "um", "uh", "hmm",
@@ -32,7 +34,7 @@ def normalize_text(text: str) -> list[str]:
     text = text.lower()
 
     # remove punctuation
-    text = re.sub(r"[^\w\s]", "", text)
+    text = _PUNCTUATION.sub("", text)
 
     words = text.split()
     normalized = []
@@ -0,0 +1,172 @@
+"""
+Phrase Matcher
+Aho-Corasick multi-pattern matching for fixed vocabularies.
+
+- Compiled once per vocabulary
+- One linear pass over the text, independent of vocabulary size
+- Reports every hit with its position
+- Deterministic, no ML
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class PhraseMatch:
+    """
+    One phrase hit.
+
+    start / end index the scanned text (lowercased unless the
+    matcher is case-sensitive); text[start:end] == phrase.
+    """
+
+    start: int
+    end: int
+    phrase: str
+
+
+class PhraseMatcher:
+    """
+    Multi-phrase automaton.
+
+    case_sensitive=False : phrases and text are lowercased
+    whole_words=True     : a hit must not touch a word character
+                           on either side (same as regex \\b...\\b for
+                           phrases that start and end with word chars)
+    """
+
+    __slots__ = (
+        "_phrases",
+        "_case_sensitive",
+        "_whole_words",
+        "_goto",
+        "_fail",
+        "_out",
+    )
+
+    def __init__(
+        self,
+        phrases: Iterable[str],
+        *,
+        case_sensitive: bool = False,
+        whole_words: bool = False,
+    ):
+        self._case_sensitive = case_sensitive
+        self._whole_words = whole_words
+
+        unique: Dict[str, None] = {}
+        for phrase in phrases:
+            if not phrase:
+                continue
+            unique[phrase if case_sensitive else phrase.lower()] = None
+        self._phrases: Tuple[str, ...] = tuple(unique)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+        self._compile()
+
+    # -------------------------------------------------
+    # BUILD
+    # -------------------------------------------------
+    def _compile(self) -> None:
+        goto, fail, out = self._goto, self._fail, self._out
+
+        # 1) Trie
+        for pid, phrase in enumerate(self._phrases):
+            node = 0
+            for ch in phrase:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    fail.append(0)
+                    out.append(())
+                node = nxt
+            out[node] = out[node] + (pid,)
+
+        # 2) Failure links (BFS), outputs inherit from failure state
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[child] = target if target != child else 0
+                out[child] = out[child] + out[fail[child]]
+
+    # -------------------------------------------------
+    # PROPERTIES
+    # -------------------------------------------------
+    @property
+    def phrases(self) -> Tuple[str, ...]:
+        return self._phrases
+
+    def __len__(self) -> int:
+        return len(self._phrases)
+
+    # -------------------------------------------------
+    # MATCHING
+    # -------------------------------------------------
+    def iter_matches(self, text: str) -> Iterator[PhraseMatch]:
+        """
+        Yield hits in order of their end position.
+        """
+        if not text or not self._phrases:
+            return
+
+        if not self._case_sensitive:
+            text = text.lower()
+
+        goto, fail, out = self._goto, self._fail, self._out
+        phrases = self._phrases
+        whole_words = self._whole_words
+        last = len(text)
+
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            for pid in out[node]:
+                phrase = phrases[pid]
+                start = i + 1 - len(phrase)
+                end = i + 1
+
+                if whole_words and (
+                    (start > 0 and _is_word_char(text[start - 1]))
+                    or (end < last and _is_word_char(text[end]))
+                ):
+                    continue
+
+                yield PhraseMatch(start, end, phrase)
+
+    def find_all(self, text: str) -> List[PhraseMatch]:
+        return list(self.iter_matches(text))
+
+    def first(self, text: str) -> PhraseMatch | None:
+        return next(self.iter_matches(text), None)
+
+    def contains_any(self, text: str) -> bool:
+        return self.first(text) is not None
+
+    def matched_phrases(self, text: str) -> List[str]:
+        """
+        Distinct phrases found, in order of first hit.
+        """
+        seen: Dict[str, None] = {}
+        for match in self.iter_matches(text):
+            seen.setdefault(match.phrase, None)
+        return list(seen)
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
@@ -0,0 +1,110 @@
+"""
+Analyzed Utterance
+Single-pass text analysis shared by every stage of one turn.
+
+- Built ONCE per turn (Assistant._cycle)
+- Immutable + slotted
+- No NLP decisions here, only derived views of the same text
+"""
+
+import re
+from dataclasses import dataclass, replace
+from typing import FrozenSet, Tuple
+
+from core.nlp.normalizer import FILLER_WORDS, REFERENCE_MAP
+
+_WHITESPACE_TOKEN = re.compile(r"\S+")
+_WORD = re.compile(r"\w+")
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+@dataclass(frozen=True, slots=True)
+class AnalyzedUtterance:
+    """
+    Derived views of one user utterance.
+
+    raw          : text exactly as received
+    text         : stripped + lowercased (InputValidator clean_text)
+    tokens       : whitespace tokens of `text`
+    offsets      : (start, end) of each token inside `text`
+    token_set    : frozenset(tokens)
+    words        : \\w+ runs of `text` (word-boundary membership)
+    bare_tokens  : tokens with punctuation removed (empty ones dropped)
+    clean_tokens : bare_tokens minus fillers, references normalized
+                   (same output as normalize_text)
+    """
+
+    raw: str
+    text: str
+    tokens: Tuple[str, ...]
+    offsets: Tuple[Tuple[int, int], ...]
+    token_set: FrozenSet[str]
+    words: FrozenSet[str]
+    bare_tokens: Tuple[str, ...]
+    clean_tokens: Tuple[str, ...]
+
+    @classmethod
+    def from_text(cls, raw: str) -> "AnalyzedUtterance":
+        raw = raw or ""
+        text = raw.strip().lower()
+
+        tokens = []
+        offsets = []
+        bare_tokens = []
+        clean_tokens = []
+
+        for match in _WHITESPACE_TOKEN.finditer(text):
+            token = match.group()
+            tokens.append(token)
+            offsets.append(match.span())
+
+            bare = _PUNCTUATION.sub("", token)
+            if not bare:
+                continue
+            bare_tokens.append(bare)
+
+            if bare in FILLER_WORDS:
+                continue
+            clean_tokens.append(REFERENCE_MAP.get(bare, bare))
+
+        return cls(
+            raw=raw,
+            text=text,
+            tokens=tuple(tokens),
+            offsets=tuple(offsets),
+            token_set=frozenset(tokens),
+            words=frozenset(_WORD.findall(text)),
+            bare_tokens=tuple(bare_tokens),
+            clean_tokens=tuple(clean_tokens),
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.text)
+
+    def cleaned(self) -> "AnalyzedUtterance":
+        """
+        Same analysis with `raw` set to the cleaned text — what
+        InputValidator hands downstream (clean_text), so argument
+        extraction sees lowered input exactly as before.
+        """
+        return replace(self, raw=self.text)
+
+
+def as_utterance(value: str | AnalyzedUtterance) -> AnalyzedUtterance:
+    """
+    Accept either a raw string or an already analyzed utterance.
+    Lets stages keep their str signatures while sharing the turn object.
+    """
+    if isinstance(value, AnalyzedUtterance):
+        return value
+    return AnalyzedUtterance.from_text(value)
+
+
+def lowered_text(value: str | AnalyzedUtterance) -> str:
+    """
+    Stripped + lowercased text without running a full analysis
+    when only the lowered string is needed.
+    """
+    if isinstance(value, AnalyzedUtterance):
+        return value.text
+    return (value or "").strip().lower()
@@ -7,6 +7,7 @@ DAY 55 — Confirmation & Cancel Hooks (LOCKED)
 
 from core.context.follow_up import FollowUpContext
 from core.context.pending_action import PendingAction
+from core.control.interrupt_words import INTERRUPT_KEYWORDS
 
 from core.os.file_ops.file_executor import FileOperationExecutor
 from core.skills.system_actions import open_app as system_open_app
@@ -37,7 +38,12 @@ class CommandOrchestrator:
         # YES / NO — ONLY if pending action exists
         # --------------------------------------------------
         if self.follow_up_context.pending_action:
-            if normalized in self.follow_up_context.NO:
+            # A reply that is just an interrupt phrase ("band karo")
+            # cancels like a plain "no"; "stop.txt" is still a slot
+            if (
+                normalized in self.follow_up_context.NO
+                or normalized in INTERRUPT_KEYWORDS
+            ):
                 return self._handle_no()
 
             if normalized in self.follow_up_context.YES:
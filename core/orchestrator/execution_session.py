@@ -1,9 +1,14 @@
 from typing import List, Optional, Tuple
 import uuid
 
+from core.runtime.tracing import TraceRing
+
 from .execution_state import SessionState, StepState
 from .session_context import SessionContext
 
+# Day 93 — newest observations kept per session
+MAX_OBSERVATIONS = 256
+
 
 class ExecutionStep:
     """
@@ -60,8 +65,10 @@ class ExecutionSession:
         self.context = SessionContext(working_memory) if working_memory else None
         self.abort_requested = False
 
-        # Observation sink (read-only)
-        self._observations: List[Tuple[str, str]] = []
+        # Observation sink (read-only, bounded)
+        self._observations: TraceRing[Tuple[str, str]] = TraceRing(
+            MAX_OBSERVATIONS
+        )
 
         # -----------------------------
         # STEP 6 — Explain storage (read-only)
@@ -125,7 +132,7 @@ class ExecutionSession:
         self._observations.append((kind, value))
 
     def observations(self) -> List[Tuple[str, str]]:
-        return list(self._observations)
+        return self._observations.snapshot()
 
     # -----------------------------
     # STEP 6 — Explain surface handling
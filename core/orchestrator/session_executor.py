@@ -1,35 +1,118 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
 from core.orchestrator.execution_state import SessionState, StepState
 from core.os.executor.guarded_executor import GuardedExecutor
 from core.control.global_interrupt import InterruptType
 from core.response.final_envelope import FinalResponseEnvelope
+from core.explain.explain_surface import ExplainSurface
 from core.explain.formatter import ExplainFormatter
 
+DEFAULT_MAX_WORKERS = 4
+
+# How often a wait for running steps re-checks for an interrupt
+INTERRUPT_POLL_SEC = 0.05
+
+
+# -------------------------------------------------
+# Day 100 — dependency levels
+# -------------------------------------------------
+def topological_levels(steps) -> List[List[Any]]:
+    """
+    Group steps into levels: level 0 has no dependencies, level n
+    depends only on levels < n. Plan order is kept inside a level.
+
+    Raises ValueError on an unknown dependency or a cycle.
+    """
+    by_id = {step.step_id: step for step in steps}
+    level_of: Dict[str, int] = {}
+
+    remaining = list(steps)
+    while remaining:
+        blocked = []
+        for step in remaining:
+            for dep in step.dependencies:
+                if dep not in by_id:
+                    raise ValueError(
+                        f"Step {step.step_id} depends on unknown step {dep}"
+                    )
+            if all(dep in level_of for dep in step.dependencies):
+                level_of[step.step_id] = 1 + max(
+                    (level_of[dep] for dep in step.dependencies), default=-1
+                )
+            else:
+                blocked.append(step)
+
+        if len(blocked) == len(remaining):
+            ids = ", ".join(step.step_id for step in blocked)
+            raise ValueError(f"Dependency cycle between steps: {ids}")
+        remaining = blocked
+
+    depth = max(level_of.values(), default=-1) + 1
+    levels: List[List[Any]] = [[] for _ in range(depth)]
+    for step in steps:
+        levels[level_of[step.step_id]].append(step)
+    return levels
+
+
+@dataclass(frozen=True)
+class StepTiming:
+    step_id: str
+    action_type: str | None
+    level: int
+    state: StepState
+    started_ms: float | None  # offset from session start; None = never ran
+    elapsed_ms: float | None
+    error: str | None = None
+
 
 class SessionExecutor:
     """
     Day 60 — Guarded Session Execution
+    Day 100 — Steps run by dependency, independent ones in parallel
 
     Responsibilities:
-    - Execute a single ExecutionSession step-by-step
-    - Bridge ExecutionSession → GuardedExecutor
-    - Respect interrupts, dry-run vs live execution
-    - Populate ExplainSurface
+    - Execute a single ExecutionSession
+    - Bridge ExecutionSession → GuardedExecutor (via `step_runner`)
+    - Respect HARD interrupts and abort requests
+    - Populate ExplainSurface with per-step timings
     - STEP 6: Replay ExplainSurface on user request
+
+    A step is dispatched as soon as all of its dependencies are DONE,
+    on a pool of `max_workers` threads, so a compound command costs
+    its longest dependency chain instead of the sum of all steps.
     """
 
-    def __init__(self, session, interrupt_controller):
+    def __init__(
+        self,
+        session,
+        interrupt_controller,
+        *,
+        step_runner: Callable[[Any], Any] | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+
         self.session = session
         self.interrupt_controller = interrupt_controller
+        self.max_workers = max_workers
+
+        self.step_runner = step_runner or self._guarded_run
+        self._guarded = None if step_runner else GuardedExecutor()
+
+        self.timings: List[StepTiming] = []
 
     def execute(self, validated_input=None):
         """
-        Execute the session sequentially OR replay explain.
+        Execute the session OR replay explain.
 
         HARD RULES:
         - No permission checks here
-        - No OS calls here
-        - No parallel execution
-        - No dependency logic (Day 62+)
+        - No OS calls here (step_runner owns them)
+        - A step never starts before its dependencies are DONE
         """
 
         # -------------------------------------------------
@@ -41,98 +124,184 @@ class SessionExecutor:
             if not explain_surface:
                 return FinalResponseEnvelope(
                     final_text="There is no previous decision to explain.",
-                    persona_metadata=None,
-                    explain_surface=None,
                 )
 
             formatted = ExplainFormatter.format_for_user(explain_surface)
 
             return FinalResponseEnvelope(
                 final_text=formatted,
-                persona_metadata=None,
-                explain_surface=explain_surface,
+                explain=explain_surface,
             )
 
         # -------------------------------------------------
         # Normal execution path
         # -------------------------------------------------
-        if self.session.state != SessionState.READY:
+        if self.session.state != SessionState.PLANNED:
             raise RuntimeError(
-                f"Session must be READY, got {self.session.state.name}"
+                f"Session must be PLANNED, got {self.session.state.name}"
             )
 
+        levels = topological_levels(self.session.steps)
+        self._level_of = {
+            step.step_id: n for n, level in enumerate(levels) for step in level
+        }
+
         self.session.state = SessionState.RUNNING
+        self._t0 = time.perf_counter()
+        self._started: Dict[str, float] = {}
+        self._elapsed: Dict[str, float] = {}
 
-        for index, step in enumerate(self.session.steps):
-            # ----------------------------------
-            # HARD interrupt check (global)
-            # ----------------------------------
-            if self.interrupt_controller.is_triggered(InterruptType.HARD):
-                self._abort_session("hard_interrupt")
-                return self._finalize()
-
-            # ----------------------------------
-            # Step lifecycle: RUNNING
-            # ----------------------------------
-            step.state = StepState.RUNNING
-
-            # ----------------------------------
-            # Explain: step start
-            # ----------------------------------
-            self.session.explain_surface.add_step(
-                step_index=index,
-                action_name=step.planned_action.action_name,
-                dry_run=self.session.context.dry_run,
-            )
+        outcome = self._run(self.session.steps)
 
-            try:
-                GuardedExecutor.execute(
-                    planned_action=step.planned_action,
-                    dry_run=self.session.context.dry_run,
-                    interrupt_controller=self.interrupt_controller,
-                    explain_surface=self.session.explain_surface,
-                )
+        total_ms = (time.perf_counter() - self._t0) * 1e3
+        return self._finalize(outcome, len(levels), total_ms)
 
-                step.state = StepState.DONE
+    # -------------------------------------------------
+    # Scheduling
+    # -------------------------------------------------
 
-            except Exception as exc:
-                step.state = StepState.FAILED
-                step.error = str(exc)
+    def _guarded_run(self, step):
+        return self._guarded.execute(step.action_spec)
+
+    def _interrupted(self) -> str | None:
+        if self.interrupt_controller.current() is InterruptType.HARD:
+            return "hard_interrupt"
+        if self.session.abort_requested:
+            return "session_cancelled"
+        return None
+
+    def _run_step(self, step) -> None:
+        step.mark_running()
+        start = time.perf_counter()
+        self._started[step.step_id] = start
+        try:
+            self.step_runner(step)
+        finally:
+            self._elapsed[step.step_id] = time.perf_counter() - start
+
+    def _run(self, steps) -> str | None:
+        """
+        Returns None on success, else the reason execution stopped.
+        """
+        pending = list(steps)
+        done = set()
+        running = {}  # future -> step
+        stop = None
 
-                self.session.state = SessionState.FAILED
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="session-step"
+        ) as pool:
+            while pending or running:
+                # Dispatch everything whose dependencies are DONE
+                for step in list(pending):
+                    if not all(dep in done for dep in step.dependencies):
+                        continue
+                    stop = self._interrupted()
+                    if stop:
+                        break
+                    pending.remove(step)
+                    step.mark_ready()
+                    running[pool.submit(self._run_step, step)] = step
+                if stop:
+                    break
 
-                self.session.explain_surface.mark_failed(
-                    step_index=index,
-                    reason=str(exc),
+                finished, _ = wait(
+                    running,
+                    timeout=INTERRUPT_POLL_SEC,
+                    return_when=FIRST_COMPLETED,
                 )
+                for future in finished:
+                    step = running.pop(future)
+                    exc = future.exception()
+                    if exc is None:
+                        step.mark_done()
+                        done.add(step.step_id)
+                    else:
+                        step.mark_failed(str(exc))
+                        stop = stop or "step_failed"
+                if stop:
+                    break
+
+                stop = self._interrupted()
+                if stop:
+                    break
 
-                return self._finalize()
+            if stop:
+                # Queued steps never start; running ones are let finish
+                for future, step in list(running.items()):
+                    if future.cancel():
+                        del running[future]
+                        step.skip(stop)
+                for future, step in running.items():
+                    exc = future.exception()
+                    if exc is None:
+                        step.mark_done()
+                    else:
+                        step.mark_failed(str(exc))
+                for step in pending:
+                    step.skip(stop)
 
-        # ----------------------------------
-        # Session completed successfully
-        # ----------------------------------
-        self.session.state = SessionState.COMPLETED
-        return self._finalize()
+        return stop
 
     # -------------------------------------------------
     # Internal helpers
     # -------------------------------------------------
 
-    def _abort_session(self, reason: str):
-        self.session.state = SessionState.CANCELLED
-        self.session.explain_surface.mark_cancelled(reason)
+    def _timing(self, step) -> StepTiming:
+        started = self._started.get(step.step_id)
+        elapsed = self._elapsed.get(step.step_id)
+        return StepTiming(
+            step_id=step.step_id,
+            action_type=getattr(step.action_spec, "action_type", None),
+            level=self._level_of[step.step_id],
+            state=step.state,
+            started_ms=None if started is None else (started - self._t0) * 1e3,
+            elapsed_ms=None if elapsed is None else elapsed * 1e3,
+            error=step.error,
+        )
 
-    def _finalize(self):
+    @staticmethod
+    def _timing_line(timing: StepTiming) -> str:
+        line = (
+            f"{timing.step_id} ({timing.action_type}) "
+            f"level {timing.level}: {timing.state.name}"
+        )
+        if timing.elapsed_ms is not None:
+            line += (
+                f" in {timing.elapsed_ms:.1f} ms"
+                f" (started +{timing.started_ms:.1f} ms)"
+            )
+        if timing.error:
+            line += f" — {timing.error}"
+        return line
+
+    def _finalize(self, outcome: str | None, level_count: int, total_ms: float):
         """
         Final session summary.
         No execution, no mutation beyond this point.
         """
+        if outcome is None:
+            self.session.state = SessionState.COMPLETED
+        elif outcome == "step_failed":
+            self.session.state = SessionState.FAILED
+        else:
+            self.session.request_abort()
+
+        self.timings = [self._timing(step) for step in self.session.steps]
+
+        explain_surface = ExplainSurface.from_lines(
+            f"Session {self.session.session_id}: {self.session.state.name}",
+            f"{len(self.timings)} steps in {level_count} levels, "
+            f"up to {self.max_workers} at once: {total_ms:.1f} ms",
+            f"Stopped: {outcome}" if outcome else None,
+            *(self._timing_line(t) for t in self.timings),
+        )
 
         # STEP 6 — Store explain surface ONCE
-        self.session.set_explain_surface(self.session.explain_surface)
+        self.session.set_explain_surface(explain_surface)
 
         return FinalResponseEnvelope(
-            final_text=None,  # populated upstream (knowledge / actions)
-            persona_metadata=None,
-            explain_surface=self.session.explain_surface,
+            final_text="",  # populated upstream (knowledge / actions)
+            explain=explain_surface,
+            meta={"session": self.session.summary()},
         )
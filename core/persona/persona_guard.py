@@ -2,6 +2,9 @@ import re
 from typing import List
 
 from core.response.final_envelope import FinalResponseEnvelope
+from core.nlp.utterance import AnalyzedUtterance
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
 
 
 class PersonaViolationError(RuntimeError):
@@ -27,12 +30,15 @@ class PersonaGuard:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _normalize(text: str) -> List[str]:
+    def _normalize(text: str | AnalyzedUtterance) -> List[str]:
         """
         Normalize text for strict semantic comparison.
         """
+        if isinstance(text, AnalyzedUtterance):
+            return list(text.bare_tokens)
+
         text = text.lower()
-        text = re.sub(r"[^\w\s]", "", text)
+        text = _PUNCTUATION.sub("", text)
         return text.split()
 
     # ------------------------------------------------------------------
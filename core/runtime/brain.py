@@ -1,11 +1,8 @@
 # core/runtime/brain.py
 
-from pathlib import Path
-
 from core.response.final_envelope import FinalResponseEnvelope
 from core.os.executor.guarded_executor import GuardedExecutor
-from core.knowledge.engine import KnowledgeEngine
-from core.knowledge.loader import load_dharma_csv
+from core.knowledge.registry import get_knowledge_registry
 from core.nlp.intent import Intent
 from core.os.action_spec import ActionSpec
 from core.actions.planned_action import PlannedAction
@@ -22,17 +19,8 @@ class Brain:
     """
 
     def __init__(self):
-        # ── Knowledge wiring
-        root_dir = Path(__file__).resolve().parents[2]
-        data_dir = root_dir / "data" / "dharma"
-
-        rows = []
-        rows.extend(load_dharma_csv(data_dir / "dharma_base.csv"))
-        rows.extend(load_dharma_csv(data_dir / "gita.csv"))
-        rows.extend(load_dharma_csv(data_dir / "upanishads.csv"))
-        rows.extend(load_dharma_csv(data_dir / "yoga_sutras.csv"))
-
-        self.knowledge = KnowledgeEngine(rows)
+        # ── Knowledge wiring (shared registry, corpora load lazily)
+        self.knowledge = get_knowledge_registry()
         self.executor = GuardedExecutor()
 
         # ── Direct intent → action mapping (Enum-based, correct for now)
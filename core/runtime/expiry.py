@@ -0,0 +1,281 @@
+"""
+Day 91 — Central expiry service (hierarchical timer wheel).
+
+Session state with a TTL registers a callback here instead of
+scanning for expired entries on every read.
+
+- schedule / cancel: amortized O(1)
+- advance: O(1) per tick + O(expired); timers cascade from coarse
+  wheels to finer ones as their deadline approaches
+- Driven by tick() (e.g. once per assistant turn) or by an optional
+  background thread
+
+Callbacks run outside the lock, on the thread that ticks; a failing
+callback is logged and never stops the wheel. Session components
+are not locked themselves, so tick from their owner's thread unless
+they say otherwise.
+"""
+
+import logging
+import math
+import threading
+import time
+from typing import Callable, Dict, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TICK_SECONDS = 0.05
+# 256 x 64 x 64 x 64 ticks ≈ 38.8 days at 50 ms before overflow
+DEFAULT_WHEEL_SIZES = (256, 64, 64, 64)
+
+
+class TimerHandle:
+    """
+    A scheduled callback. cancel() is O(1) and idempotent.
+    """
+
+    __slots__ = ("deadline", "callback", "_bucket", "_service")
+
+    def __init__(self, deadline: int, callback: Callable[[], None], service):
+        self.deadline = deadline
+        self.callback = callback
+        self._bucket: Dict["TimerHandle", None] | None = None
+        self._service = service
+
+    @property
+    def active(self) -> bool:
+        return self.callback is not None
+
+    def cancel(self) -> bool:
+        return self._service._cancel(self)
+
+
+class HierarchicalTimerWheel:
+    """
+    Not thread-safe on its own; ExpiryService serializes access.
+    Time is measured in whole ticks.
+    """
+
+    def __init__(self, sizes: Sequence[int] = DEFAULT_WHEEL_SIZES, start_tick: int = 0):
+        self._sizes = tuple(sizes)
+        # span[i] = ticks covered by one slot of wheel i
+        self._spans = []
+        span = 1
+        for size in self._sizes:
+            self._spans.append(span)
+            span *= size
+        self._horizon = span
+
+        self._wheels: List[List[Dict[TimerHandle, None]]] = [
+            [{} for _ in range(size)] for size in self._sizes
+        ]
+        self._overflow: Dict[TimerHandle, None] = {}
+
+        self.now = start_tick
+        self.pending = 0
+
+    def add(self, handle: TimerHandle) -> None:
+        self._place(handle)
+        self.pending += 1
+
+    def remove(self, handle: TimerHandle) -> None:
+        del handle._bucket[handle]
+        handle._bucket = None
+        self.pending -= 1
+
+    def _place(self, handle: TimerHandle) -> None:
+        remaining = handle.deadline - self.now
+
+        for level, size in enumerate(self._sizes):
+            span = self._spans[level]
+            if remaining < span * size:
+                bucket = self._wheels[level][(handle.deadline // span) % size]
+                break
+        else:
+            bucket = self._overflow
+
+        bucket[handle] = None
+        handle._bucket = bucket
+
+    def _cascade(self) -> None:
+        # Coarse wheels first, so timers can fall through several levels
+        for level in range(len(self._sizes) - 1, 0, -1):
+            span = self._spans[level]
+            if self.now % span:
+                continue
+            slot = (self.now // span) % self._sizes[level]
+            bucket = self._wheels[level][slot]
+            if bucket:
+                moved = list(bucket)
+                bucket.clear()
+                for handle in moved:
+                    self._place(handle)
+
+        if self._overflow and self.now % self._horizon == 0:
+            moved = list(self._overflow)
+            self._overflow.clear()
+            for handle in moved:
+                self._place(handle)
+
+    def advance(self, target_tick: int) -> List[TimerHandle]:
+        """
+        Move time forward; returns handles that fell due (in order).
+        """
+        due: List[TimerHandle] = []
+
+        while self.now < target_tick:
+            if not self.pending:
+                self.now = target_tick  # idle: nothing to cascade
+                break
+
+            self.now += 1
+            self._cascade()
+
+            bucket = self._wheels[0][self.now % self._sizes[0]]
+            if bucket:
+                fired = list(bucket)
+                bucket.clear()
+                for handle in fired:
+                    handle._bucket = None
+                self.pending -= len(fired)
+                due.extend(fired)
+
+        return due
+
+
+class ExpiryService:
+    """
+    Thread-safe front end over a HierarchicalTimerWheel.
+    """
+
+    def __init__(
+        self,
+        *,
+        tick_seconds: float = DEFAULT_TICK_SECONDS,
+        sizes: Sequence[int] = DEFAULT_WHEEL_SIZES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if tick_seconds <= 0:
+            raise ValueError("tick_seconds must be > 0")
+
+        self._tick = tick_seconds
+        self._clock = clock
+        self._wheel = HierarchicalTimerWheel(sizes, self._to_tick(clock()))
+        self._lock = threading.Lock()
+
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def _to_tick(self, seconds: float) -> int:
+        return int(seconds / self._tick)
+
+    @property
+    def pending(self) -> int:
+        return self._wheel.pending
+
+    # -------------------------------------------------
+    # SCHEDULING
+    # -------------------------------------------------
+    def schedule(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        """
+        Run `callback` once, no earlier than `delay` seconds from now
+        (rounded up to the next tick).
+        """
+        ticks = max(1, math.ceil(delay / self._tick))
+        # Real time, not the wheel's (which lags until the next tick)
+        deadline = self._to_tick(self._clock()) + ticks
+
+        with self._lock:
+            handle = TimerHandle(
+                max(deadline, self._wheel.now + 1), callback, self
+            )
+            self._wheel.add(handle)
+        return handle
+
+    def reschedule(
+        self,
+        handle: TimerHandle | None,
+        delay: float,
+        callback: Callable[[], None],
+    ) -> TimerHandle:
+        """
+        Cancel `handle` (if any) and schedule again.
+        """
+        if handle is not None:
+            handle.cancel()
+        return self.schedule(delay, callback)
+
+    def _cancel(self, handle: TimerHandle) -> bool:
+        with self._lock:
+            if handle.callback is None:
+                return False
+            handle.callback = None
+            if handle._bucket is not None:
+                self._wheel.remove(handle)
+            return True
+
+    # -------------------------------------------------
+    # DRIVING
+    # -------------------------------------------------
+    def tick(self, now: float | None = None) -> int:
+        """
+        Fire every callback that is due; returns how many ran.
+        """
+        target = self._to_tick(self._clock() if now is None else now)
+
+        with self._lock:
+            due = self._wheel.advance(target)
+            callbacks = []
+            for handle in due:
+                callbacks.append(handle.callback)
+                handle.callback = None
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception("Expiry callback failed")
+
+        return len(callbacks)
+
+    def start(self) -> None:
+        """
+        Tick in a daemon thread until stop().
+        """
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(self._tick):
+                self.tick()
+
+        self._thread = threading.Thread(
+            target=run, name="expiry-service", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+
+_SERVICE: ExpiryService | None = None
+_SERVICE_LOCK = threading.Lock()
+
+
+def get_expiry_service() -> ExpiryService:
+    """
+    Process-wide expiry service (not started; callers tick it).
+    """
+    global _SERVICE
+
+    if _SERVICE is None:
+        with _SERVICE_LOCK:
+            if _SERVICE is None:
+                _SERVICE = ExpiryService()
+    return _SERVICE
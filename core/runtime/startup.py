@@ -0,0 +1,63 @@
+"""
+Day 95 — Startup timing report.
+
+Phases are timed where they happen (including lazy ones that run
+on first use) and can be listed or logged once the assistant is up.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, List
+
+_T0 = time.perf_counter()
+
+
+@dataclass(frozen=True)
+class StartupPhase:
+    name: str
+    started_at: float   # seconds since this module was imported
+    seconds: float
+    ok: bool
+
+
+_PHASES: List[StartupPhase] = []
+_LOCK = threading.Lock()
+
+
+@contextmanager
+def timed_phase(name: str) -> Iterator[None]:
+    """
+    Record how long the wrapped block took (also when it raises).
+    """
+    start = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        phase = StartupPhase(
+            name=name,
+            started_at=start - _T0,
+            seconds=time.perf_counter() - start,
+            ok=ok,
+        )
+        with _LOCK:
+            _PHASES.append(phase)
+
+
+def startup_report() -> List[StartupPhase]:
+    with _LOCK:
+        return list(_PHASES)
+
+
+def format_startup_report() -> str:
+    lines = ["Startup timing:"]
+    for phase in startup_report():
+        status = "" if phase.ok else "  (failed)"
+        lines.append(
+            f"  {phase.name:<24} {phase.seconds * 1000:8.1f} ms"
+            f"  @ {phase.started_at * 1000:8.1f} ms{status}"
+        )
+    return "\n".join(lines)
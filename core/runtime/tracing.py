@@ -0,0 +1,206 @@
+"""
+Day 93 — Bounded trace pipeline.
+
+- TraceEvent: cheap structured record (a tuple; no per-event dict copy)
+- TraceRing: fixed-capacity buffer; the oldest records are overwritten
+- JsonlTraceExporter: optional background writer; batches records
+  into gzip-compressed JSONL and counts what it had to drop
+
+The hot path is an append to a ring plus (with an exporter) a
+non-blocking queue put. Serialization, compression and file I/O
+happen on the exporter thread.
+"""
+
+import dataclasses
+import gzip
+import json
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Deque, Dict, Generic, List, NamedTuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_RING_CAPACITY = 1024
+
+_WAKE = object()  # unblocks the exporter thread on close()
+
+
+class TraceEvent(NamedTuple):
+    kind: str
+    timestamp: float
+    fields: Dict[str, Any]
+
+
+def make_event(kind: str, **fields) -> TraceEvent:
+    return TraceEvent(kind, time.time(), fields)
+
+
+# -------------------------------------------------
+# RING BUFFER
+# -------------------------------------------------
+class TraceRing(Generic[T]):
+    """
+    Fixed-capacity, append-only buffer (oldest first).
+    """
+
+    def __init__(self, capacity: int = DEFAULT_RING_CAPACITY):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._items: Deque[T] = deque(maxlen=capacity)
+        self.overwritten = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._items.maxlen
+
+    def append(self, item: T) -> None:
+        if len(self._items) == self._items.maxlen:
+            self.overwritten += 1
+        self._items.append(item)
+
+    def snapshot(self) -> List[T]:
+        return list(self._items)
+
+    def last(self) -> T | None:
+        return self._items[-1] if self._items else None
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+
+# -------------------------------------------------
+# EXPORT
+# -------------------------------------------------
+def _json_default(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return repr(value)
+
+
+def trace_record(item) -> dict:
+    """
+    JSON-ready dict for a TraceEvent or a trace dataclass.
+    """
+    if isinstance(item, TraceEvent):
+        return {"kind": item.kind, "timestamp": item.timestamp, **item.fields}
+    if dataclasses.is_dataclass(item):
+        record = {f.name: getattr(item, f.name) for f in dataclasses.fields(item)}
+        record["kind"] = type(item).__name__
+        return record
+    return {"kind": type(item).__name__, "value": item}
+
+
+class JsonlTraceExporter:
+    """
+    Background exporter: one gzip member of JSONL per batch.
+
+    offer() never blocks; when the queue is full the record is
+    dropped and counted in `dropped`.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        batch_size: int = 256,
+        flush_interval: float = 1.0,
+        max_pending: int = 8192,
+    ):
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._closed = threading.Event()
+        self.dropped = 0
+        self.exported = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._run, name="trace-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def offer(self, item) -> bool:
+        if self._closed.is_set():
+            self.dropped += 1
+            return False
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Stop accepting records and write out what is queued.
+        """
+        self._closed.set()
+        try:
+            self._queue.put_nowait(_WAKE)
+        except queue.Full:
+            pass  # the thread is not waiting on an empty queue
+        self._thread.join(timeout)
+
+    # -------------------------------------------------
+    # EXPORTER THREAD
+    # -------------------------------------------------
+    def _next_batch(self) -> List:
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if self._closed.is_set():
+                timeout = 0
+            try:
+                item = (
+                    self._queue.get(timeout=timeout)
+                    if timeout > 0 else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if item is not _WAKE:
+                batch.append(item)
+        return batch
+
+    def _write(self, batch: List) -> None:
+        lines = [
+            json.dumps(trace_record(item), default=_json_default)
+            for item in batch
+        ]
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+        with gzip.open(self.path, "ab", compresslevel=6) as fh:
+            fh.write(payload)
+        self.exported += len(batch)
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch:
+                try:
+                    self._write(batch)
+                except Exception:
+                    self.dropped += len(batch)
+                    logger.exception("Trace export failed")
+            elif self._closed.is_set() and self._queue.empty():
+                return
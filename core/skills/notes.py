@@ -1,6 +1,10 @@
-from sqlalchemy import select
+import re
+from dataclasses import dataclass
+from typing import Any, List, Tuple
+
+from sqlalchemy import String, literal, or_, select, text, tuple_, type_coerce
 from core.storage.mysql import get_session
-from core.storage.notes_models import Note
+from core.storage.notes_models import Note, has_fulltext
 
 def save_note(text: str) -> str:
     lowered = text.lower()
@@ -22,17 +26,154 @@ def save_note(text: str) -> str:
     return f"I saved this note: {content}"
 
 
+# -------------------------------------------------
+# Day 97 — keyset pages (no OFFSET scans)
+# -------------------------------------------------
+@dataclass(frozen=True)
+class NoteCursor:
+    """
+    Position after the last note of a page (newest-first order).
+    `created_at` is kept exactly as the driver returned it, so the
+    next page compares like with like (SQLite stores text).
+    """
+    created_at: Any
+    id: int
 
-def read_notes(limit: int = 5) -> str:
-    with get_session() as session:
-        stmt = select(Note.content).order_by(Note.created_at.desc()).limit(limit)
-        notes = session.execute(stmt).scalars().all()
 
-    if not notes:
-        return "You have no notes."
+@dataclass(frozen=True)
+class NotePage:
+    notes: Tuple[str, ...]
+    next_cursor: NoteCursor | None  # None = no older notes
+
+
+def list_notes(limit: int = 5, after: NoteCursor | None = None) -> NotePage:
+    """
+    Newest-first page of notes, starting after `after`.
+    Walks ix_notes_created_at; cost depends on `limit`, not on
+    how many notes came before.
+    """
+    raw_created = type_coerce(Note.created_at, String)
+
+    stmt = select(Note.id, Note.content, raw_created.label("created_at"))
+    if after is not None:
+        stmt = stmt.where(
+            tuple_(raw_created, Note.id)
+            < tuple_(literal(after.created_at, String), after.id)
+        )
+    # One extra row tells whether another page exists
+    stmt = stmt.order_by(Note.created_at.desc(), Note.id.desc()).limit(limit + 1)
+
+    with get_session(readonly=True) as session:
+        rows = session.execute(stmt).all()
+
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        last = page[-1]
+        next_cursor = NoteCursor(created_at=last.created_at, id=last.id)
+
+    return NotePage(notes=tuple(r.content for r in page), next_cursor=next_cursor)
 
-    response = "Your recent notes:\n"
+
+# "read more notes" continues from the last page read
+_read_cursor: NoteCursor | None = None
+
+
+def _format_notes(notes, header: str) -> str:
+    response = header + "\n"
     for i, content in enumerate(notes, 1):
         response += f"{i}. {content}\n"
-
     return response.strip()
+
+
+def read_notes(limit: int = 5) -> str:
+    global _read_cursor
+
+    page = list_notes(limit)
+    _read_cursor = page.next_cursor
+
+    if not page.notes:
+        return "You have no notes."
+
+    return _format_notes(page.notes, "Your recent notes:")
+
+
+def read_more_notes(limit: int = 5) -> str:
+    global _read_cursor
+
+    if _read_cursor is None:
+        return "There are no more notes."
+
+    page = list_notes(limit, after=_read_cursor)
+    _read_cursor = page.next_cursor
+
+    if not page.notes:
+        return "There are no more notes."
+
+    return _format_notes(page.notes, "More notes:")
+
+
+# -------------------------------------------------
+# Day 97 — ranked full-text search
+# -------------------------------------------------
+_WORD = re.compile(r"\w+")
+
+_SEARCH_SQL = {
+    # Natural-language mode: relevance-ranked, stopwords ignored
+    "mysql": (
+        "SELECT content FROM notes "
+        "WHERE MATCH(content) AGAINST (:q IN NATURAL LANGUAGE MODE) "
+        "ORDER BY MATCH(content) AGAINST (:q IN NATURAL LANGUAGE MODE) DESC, "
+        "id DESC LIMIT :limit"
+    ),
+    # bm25(): lower is better
+    "sqlite": (
+        "SELECT n.content FROM notes_fts "
+        "JOIN notes n ON n.id = notes_fts.rowid "
+        "WHERE notes_fts MATCH :q "
+        "ORDER BY bm25(notes_fts), n.id DESC LIMIT :limit"
+    ),
+}
+
+
+def _search_terms(query: str) -> List[str]:
+    return _WORD.findall(query.lower())
+
+
+def find_notes(query: str, limit: int = 5) -> List[str]:
+    """
+    Notes matching any word of `query`, best match first.
+    """
+    terms = _search_terms(query)
+    if not terms or limit <= 0:
+        return []
+
+    with get_session(readonly=True) as session:
+        dialect = session.get_bind().dialect.name
+        sql = _SEARCH_SQL.get(dialect) if has_fulltext() else None
+
+        if sql is None:
+            # No full-text index on this backend: substring scan
+            stmt = (
+                select(Note.content)
+                .where(or_(*(Note.content.contains(t) for t in terms)))
+                .order_by(Note.created_at.desc(), Note.id.desc())
+                .limit(limit)
+            )
+            return list(session.scalars(stmt))
+
+        if dialect == "sqlite":
+            # Quoted terms: user text is never parsed as FTS syntax
+            q = " OR ".join('"' + t.replace('"', '""') + '"' for t in terms)
+        else:
+            q = " ".join(terms)
+
+        return list(session.scalars(text(sql), {"q": q, "limit": limit}))
+
+
+def search_notes(query: str, limit: int = 5) -> str:
+    notes = find_notes(query, limit)
+    if not notes:
+        return "I found no matching notes."
+
+    return _format_notes(notes, "Matching notes:")
@@ -1,6 +1,11 @@
+from core.nlp.phrase_matcher import PhraseMatcher
+
 WAKE_WORD = "rudra"
 
+_WAKE_MATCHER = PhraseMatcher((WAKE_WORD,))
+
+
 def contains_wake_word(text: str) -> bool:
     if not text:
         return False
-    return WAKE_WORD in text.lower()
+    return _WAKE_MATCHER.contains_any(text)
@@ -0,0 +1,254 @@
+"""
+Day 99 — Conversation archive (compaction + reader).
+
+Rows older than a cutoff move out of the hot `conversations` table
+into day-partitioned, gzip-compressed JSONL files:
+
+    <archive>/2025/03/conversations-2025-03-14.jsonl.gz
+    <archive>/index.json     day -> file, rows, id / time bounds
+
+- Bounded memory: rows stream in keyset batches of `batch_size`;
+  each batch is appended (one gzip member per day touched), the
+  index is saved, then the batch is deleted from the table
+- Re-runnable: the first time a run touches a day that already has
+  a file, it reads the ids archived there (and rebuilds the index
+  entry, in case a crash skipped the index save). Rows whose id is
+  in that set are only deleted, never appended twice. Ids are not
+  assumed to follow created_at order
+- read_archive() opens only the days overlapping the range
+"""
+
+import gzip
+import json
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Set, Tuple
+
+from sqlalchemy import String, delete, literal, select, tuple_, type_coerce
+
+from core.storage.models import Conversation
+from core.storage.mysql import get_session
+
+INDEX_FILE = "index.json"
+DEFAULT_BATCH_SIZE = 1000
+
+
+def default_archive_dir() -> Path:
+    project_root = Path(__file__).resolve().parents[2]
+    return project_root / "data" / "archive" / "conversations"
+
+
+@dataclass(frozen=True)
+class CompactionReport:
+    archived: int
+    already_archived: int
+    batches: int
+    days: tuple
+
+
+# -------------------------------------------------
+# INDEX
+# -------------------------------------------------
+def _day_path(day: date) -> str:
+    return f"{day:%Y}/{day:%m}/conversations-{day.isoformat()}.jsonl.gz"
+
+
+def load_index(archive_dir: Path) -> Dict[str, dict]:
+    path = archive_dir / INDEX_FILE
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _save_index(archive_dir: Path, index: Dict[str, dict]) -> None:
+    path = archive_dir / INDEX_FILE
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(index, indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _record(row) -> dict:
+    return {
+        "id": row.id,
+        "role": row.role,
+        "text": row.text,
+        "intent": row.intent,
+        "created_at": row.created_at.isoformat(),
+    }
+
+
+def _update_entry(index: Dict[str, dict], day: date, records: List[dict]) -> None:
+    ids = [r["id"] for r in records]
+    times = [r["created_at"] for r in records]
+
+    entry = index.setdefault(day.isoformat(), {
+        "file": _day_path(day),
+        "rows": 0,
+        "min_id": min(ids),
+        "max_id": max(ids),
+        "first": min(times),
+        "last": max(times),
+    })
+    entry["rows"] += len(records)
+    entry["min_id"] = min(entry["min_id"], *ids)
+    entry["max_id"] = max(entry["max_id"], *ids)
+    entry["first"] = min(entry["first"], *times)
+    entry["last"] = max(entry["last"], *times)
+
+
+def _scan_day(archive_dir: Path, day: date) -> Tuple[dict | None, Set[int]]:
+    """
+    Index entry rebuilt from the day file (None if there is no file)
+    and the ids archived in it.
+    """
+    path = archive_dir / _day_path(day)
+    if not path.exists():
+        return None, set()
+
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        records = [json.loads(line) for line in fh]
+    if not records:
+        return None, set()
+
+    rebuilt: Dict[str, dict] = {}
+    _update_entry(rebuilt, day, records)
+    return rebuilt[day.isoformat()], {r["id"] for r in records}
+
+
+# -------------------------------------------------
+# COMPACTION
+# -------------------------------------------------
+def _append_day(archive_dir: Path, day: date, records: List[dict]) -> None:
+    path = archive_dir / _day_path(day)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    payload = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+    with gzip.open(path, "ab") as fh:
+        fh.write(payload.encode("utf-8"))
+        fh.flush()
+        os.fsync(fh.fileno())
+
+
+def compact_conversations(
+    cutoff: datetime,
+    *,
+    archive_dir: str | Path | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> CompactionReport:
+    """
+    Move every conversation row created before `cutoff` to the archive.
+    """
+    archive_dir = Path(archive_dir) if archive_dir else default_archive_dir()
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    index = load_index(archive_dir)
+
+    raw_created = type_coerce(Conversation.created_at, String)
+    cursor = None
+    archived = skipped = batches = 0
+    touched = set()
+    # Ids already in each day file, for the days this run is still on
+    archived_ids: Dict[str, Set[int]] = {}
+
+    while True:
+        stmt = select(Conversation, raw_created.label("raw_created")).where(
+            Conversation.created_at < cutoff
+        )
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(raw_created, Conversation.id)
+                > tuple_(literal(cursor[0], String), cursor[1])
+            )
+        stmt = stmt.order_by(
+            Conversation.created_at, Conversation.id
+        ).limit(batch_size)
+
+        with get_session(readonly=True) as session:
+            rows = session.execute(stmt).all()
+        if not rows:
+            break
+
+        by_day: Dict[date, List[dict]] = defaultdict(list)
+        for row, _raw in rows:
+            day = row.created_at.date()
+            key = day.isoformat()
+            if key not in archived_ids:
+                scanned, archived_ids[key] = _scan_day(archive_dir, day)
+                # Catch up with rows appended before a crash skipped
+                # the index save
+                if scanned is not None and scanned != index.get(key):
+                    index[key] = scanned
+            if row.id in archived_ids[key]:
+                skipped += 1
+                continue
+            by_day[day].append(_record(row))
+
+        for day, records in by_day.items():
+            _append_day(archive_dir, day, records)
+            _update_entry(index, day, records)
+
+            key = day.isoformat()
+            archived_ids[key].update(r["id"] for r in records)
+            archived += len(records)
+            touched.add(key)
+
+        # Archive (and its index) is durable before rows leave the table
+        _save_index(archive_dir, index)
+
+        # Only rows now present in their day file leave the table
+        ids = [
+            row.id for row, _raw in rows
+            if row.id in archived_ids[row.created_at.date().isoformat()]
+        ]
+        with get_session() as session:
+            session.execute(delete(Conversation).where(Conversation.id.in_(ids)))
+
+        last_row, last_raw = rows[-1]
+        cursor = (last_raw, last_row.id)
+        batches += 1
+
+        # Rows arrive in created_at order: earlier days are finished
+        current = last_row.created_at.date().isoformat()
+        for key in [k for k in archived_ids if k < current]:
+            del archived_ids[key]
+
+    return CompactionReport(
+        archived=archived,
+        already_archived=skipped,
+        batches=batches,
+        days=tuple(sorted(touched)),
+    )
+
+
+# -------------------------------------------------
+# READER
+# -------------------------------------------------
+def read_archive(
+    start: datetime,
+    end: datetime,
+    *,
+    archive_dir: str | Path | None = None,
+) -> Iterator[dict]:
+    """
+    Archived rows with start <= created_at < end, oldest first.
+    Streams one day file at a time.
+    """
+    archive_dir = Path(archive_dir) if archive_dir else default_archive_dir()
+    index = load_index(archive_dir)
+
+    day = start.date()
+    while day <= end.date():
+        entry = index.get(day.isoformat())
+        day += timedelta(days=1)
+        if entry is None:
+            continue
+
+        with gzip.open(archive_dir / entry["file"], "rt", encoding="utf-8") as fh:
+            for line in fh:
+                record = json.loads(line)
+                created = datetime.fromisoformat(record["created_at"])
+                if start <= created < end:
+                    record["created_at"] = created
+                    yield record
@@ -0,0 +1,116 @@
+"""
+Day 96 — Storage backends, selected by URL.
+
+- RUDRA_STORAGE_URL (any SQLAlchemy URL) wins; otherwise the
+  MYSQL_* settings build the MySQL URL used so far
+- sqlite:///<path> is the embedded mode for single-user devices:
+  WAL journal, synchronous=NORMAL, one writer connection (writes
+  queue on it instead of fighting over the file lock) and a small
+  pool of reader connections that never block the writer
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import quote_plus
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool, StaticPool
+
+STORAGE_URL_ENV = "RUDRA_STORAGE_URL"
+
+SQLITE_READERS = 4
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
+
+def mysql_url() -> str:
+    user = os.getenv("MYSQL_USER", "rudra")
+    password = quote_plus(os.getenv("MYSQL_PASSWORD", ""))
+    host = os.getenv("MYSQL_HOST", "localhost")
+    port = os.getenv("MYSQL_PORT", "3306")
+    db = os.getenv("MYSQL_DATABASE", "rudra")
+
+    return f"mysql+pymysql://{user}:{password}@{host}:{port}/{db}"
+
+
+def sqlite_url(path: str | Path | None = None) -> str:
+    if path is None:
+        project_root = Path(__file__).resolve().parents[2]
+        path = project_root / "data" / "storage" / "rudra.sqlite3"
+    return f"sqlite:///{Path(path)}"
+
+
+def default_storage_url() -> str:
+    return os.getenv(STORAGE_URL_ENV) or mysql_url()
+
+
+@dataclass(frozen=True)
+class StorageBackend:
+    """
+    writer: engine for sessions that write
+    reader: engine for read-only sessions (same engine on servers)
+    """
+
+    name: str
+    writer: Engine
+    reader: Engine
+
+    def dispose(self) -> None:
+        self.writer.dispose()
+        if self.reader is not self.writer:
+            self.reader.dispose()
+
+
+# -------------------------------------------------
+# SQLITE
+# -------------------------------------------------
+def _tune_sqlite(dbapi_conn, _record) -> None:
+    cur = dbapi_conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cur.execute("PRAGMA foreign_keys=ON")
+    cur.close()
+
+
+def _sqlite_engine(url, **pool) -> Engine:
+    engine = create_engine(
+        url, connect_args={"check_same_thread": False}, **pool
+    )
+    event.listen(engine, "connect", _tune_sqlite)
+    return engine
+
+
+def _sqlite_backend(url) -> StorageBackend:
+    database = url.database
+    if not database or database == ":memory:":
+        # One private database per connection: share a single one
+        engine = _sqlite_engine(url, poolclass=StaticPool)
+        return StorageBackend("sqlite", engine, engine)
+
+    Path(database).parent.mkdir(parents=True, exist_ok=True)
+    writer = _sqlite_engine(
+        url, poolclass=QueuePool, pool_size=1, max_overflow=0
+    )
+    reader = _sqlite_engine(
+        url, poolclass=QueuePool, pool_size=SQLITE_READERS, max_overflow=0
+    )
+    return StorageBackend("sqlite", writer, reader)
+
+
+# -------------------------------------------------
+# FACTORY
+# -------------------------------------------------
+def create_backend(url: str | None = None) -> StorageBackend:
+    """
+    Engines for `url` (default: default_storage_url()); no connection
+    is opened until the first query.
+    """
+    url = make_url(url or default_storage_url())
+
+    if url.get_backend_name() == "sqlite":
+        return _sqlite_backend(url)
+
+    engine = create_engine(url, pool_pre_ping=True)
+    return StorageBackend(url.get_backend_name(), engine, engine)
@@ -1,10 +1,14 @@
 from sqlalchemy.orm import declarative_base, Mapped, mapped_column
-from sqlalchemy import String, Integer, Text, DateTime, func
+from sqlalchemy import String, Integer, Text, DateTime, Index, func
 
 Base = declarative_base()
 
 class Conversation(Base):
     __tablename__ = "conversations"
+    __table_args__ = (
+        # Day 98 — newest-first history reads
+        Index("ix_conversations_created_at", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     role: Mapped[str] = mapped_column(String(20))   # "user" | "assistant"
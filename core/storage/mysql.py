@@ -1,42 +1,92 @@
-import os
-from urllib.parse import quote_plus
+"""
+Storage access (MySQL server or embedded SQLite).
+
+Day 95 — nothing here touches the database at import time:
+- the engine is created on first use (no connection until a query)
+- schema creation (all tables, one create_all pass) runs on the
+  first session, once per process
+
+Day 96 — the backend comes from the storage URL (see
+core.storage.backends); read-only sessions use the reader pool.
+"""
+
+import threading
 from contextlib import contextmanager
 from loguru import logger
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker
 
 from dotenv import load_dotenv   # ✅ ADD
 load_dotenv()                    # ✅ ADD (CRITICAL)
 
-_ENGINE = None
+from core.runtime.startup import timed_phase
+from core.storage.backends import StorageBackend, create_backend, default_storage_url
+from core.storage.models import Base
+from core.storage.notes_models import ensure_note_indexes  # registers Note on Base
+
+_BACKEND: StorageBackend | None = None
 _SessionLocal = None
+_ReadSessionLocal = None
+_SCHEMA_READY = False
+_INIT_LOCK = threading.Lock()
 
 
 def _database_url() -> str:
-    user = os.getenv("MYSQL_USER", "rudra")
-    password = quote_plus(os.getenv("MYSQL_PASSWORD", ""))
-    host = os.getenv("MYSQL_HOST", "localhost")
-    port = os.getenv("MYSQL_PORT", "3306")
-    db = os.getenv("MYSQL_DATABASE", "rudra")
+    return default_storage_url()
 
-    return f"mysql+pymysql://{user}:{password}@{host}:{port}/{db}"
+
+def get_backend() -> StorageBackend:
+    global _BACKEND, _SessionLocal, _ReadSessionLocal
+    if _BACKEND is None:
+        with _INIT_LOCK:
+            if _BACKEND is None:
+                with timed_phase("storage.engine"):
+                    backend = create_backend(_database_url())
+                logger.debug("Storage backend: {}", backend.name)
+                _SessionLocal = sessionmaker(
+                    bind=backend.writer, autoflush=False, autocommit=False
+                )
+                # Read results stay usable after the session closes
+                _ReadSessionLocal = sessionmaker(
+                    bind=backend.reader, autoflush=False, autocommit=False,
+                    expire_on_commit=False,
+                )
+                _BACKEND = backend
+    return _BACKEND
 
 
 def get_engine():
-    global _ENGINE, _SessionLocal
-    if _ENGINE is None:
-        url = _database_url()
-        logger.debug("Creating SQLAlchemy engine: {}", url)
-        _ENGINE = create_engine(url, pool_pre_ping=True)
-        _SessionLocal = sessionmaker(bind=_ENGINE, autoflush=False, autocommit=False)
-    return _ENGINE
+    return get_backend().writer
+
+
+def ensure_schema() -> None:
+    """
+    Create every storage table (conversations, notes) in one pass,
+    plus the notes search indexes. Runs once per process; later
+    calls return immediately.
+    """
+    global _SCHEMA_READY
+    if _SCHEMA_READY:
+        return
+
+    engine = get_engine()
+    with _INIT_LOCK:
+        if not _SCHEMA_READY:
+            with timed_phase("storage.schema"):
+                Base.metadata.create_all(bind=engine)
+                with engine.begin() as conn:
+                    # Indexes added after a table was first created
+                    for table in Base.metadata.sorted_tables:
+                        for index in table.indexes:
+                            index.create(conn, checkfirst=True)
+                    ensure_note_indexes(conn)
+            _SCHEMA_READY = True
 
 
 @contextmanager
-def get_session():
-    if _SessionLocal is None:
-        get_engine()
-    session = _SessionLocal()
+def get_session(readonly: bool = False):
+    ensure_schema()
+    session = _ReadSessionLocal() if readonly else _SessionLocal()
     try:
         yield session
         session.commit()
@@ -1,11 +1,22 @@
-from sqlalchemy.orm import declarative_base, Mapped, mapped_column
-from sqlalchemy import Integer, Text, DateTime, func
-from core.storage.mysql import get_engine
+import logging
 
-BaseNotes = declarative_base()
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, Text, DateTime, Index, func, inspect
+from sqlalchemy.exc import OperationalError
+from core.storage.models import Base
+
+logger = logging.getLogger(__name__)
+
+# Day 95 — notes share the storage metadata, so one create_all pass
+# (core.storage.mysql.ensure_schema) covers every table
+BaseNotes = Base
 
 class Note(BaseNotes):
     __tablename__ = "notes"
+    __table_args__ = (
+        # Day 97 — newest-first reads and keyset pages
+        Index("ix_notes_created_at", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     content: Mapped[str] = mapped_column(Text)
@@ -13,6 +24,68 @@ class Note(BaseNotes):
         DateTime(timezone=True), server_default=func.now()
     )
 
-# Create table
-engine = get_engine()
-BaseNotes.metadata.create_all(bind=engine)
+
+# -------------------------------------------------
+# Day 97 — full-text index (per backend)
+# -------------------------------------------------
+MYSQL_FULLTEXT_INDEX = "ix_notes_content_fulltext"
+SQLITE_FTS_TABLE = "notes_fts"
+
+_SQLITE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5("
+    "content, content='notes', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS notes_fts_ai AFTER INSERT ON notes BEGIN "
+    "INSERT INTO notes_fts (rowid, content) VALUES (new.id, new.content); END",
+    "CREATE TRIGGER IF NOT EXISTS notes_fts_ad AFTER DELETE ON notes BEGIN "
+    "INSERT INTO notes_fts (notes_fts, rowid, content) "
+    "VALUES ('delete', old.id, old.content); END",
+    "CREATE TRIGGER IF NOT EXISTS notes_fts_au AFTER UPDATE ON notes BEGIN "
+    "INSERT INTO notes_fts (notes_fts, rowid, content) "
+    "VALUES ('delete', old.id, old.content); "
+    "INSERT INTO notes_fts (rowid, content) VALUES (new.id, new.content); END",
+)
+
+
+# False when the backend cannot build it (SQLite without FTS5);
+# searches then use the substring scan
+_FULLTEXT_AVAILABLE = True
+
+
+def has_fulltext() -> bool:
+    return _FULLTEXT_AVAILABLE
+
+
+def ensure_note_indexes(conn) -> None:
+    """
+    Add the notes full-text index to tables created before it existed
+    (create_all never alters an existing table).
+    """
+    global _FULLTEXT_AVAILABLE
+    _FULLTEXT_AVAILABLE = True
+    dialect = conn.dialect.name
+
+    if dialect == "mysql":
+        existing = {ix["name"] for ix in inspect(conn).get_indexes("notes")}
+        if MYSQL_FULLTEXT_INDEX not in existing:
+            conn.exec_driver_sql(
+                f"CREATE FULLTEXT INDEX {MYSQL_FULLTEXT_INDEX} ON notes (content)"
+            )
+
+    elif dialect == "sqlite":
+        exists = conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE name = ?", (SQLITE_FTS_TABLE,)
+        ).first()
+        try:
+            for statement in _SQLITE_FTS_DDL:
+                conn.exec_driver_sql(statement)
+        except OperationalError:
+            # SQLite built without FTS5: the table (and its triggers)
+            # are never created, notes stay writable
+            logger.warning("SQLite FTS5 unavailable; note search scans")
+            _FULLTEXT_AVAILABLE = False
+            return
+        if not exists:
+            # Index notes written before the FTS table existed
+            conn.exec_driver_sql(
+                "INSERT INTO notes_fts (notes_fts) VALUES ('rebuild')"
+            )
@@ -2,6 +2,8 @@
 
 from typing import FrozenSet
 
+from core.nlp.phrase_matcher import PhraseMatcher
+
 
 # Tokens that must NEVER appear in terminal observation specs
 # Checked before any parsing or normalization
@@ -31,9 +33,12 @@ FORBIDDEN_TOKENS: FrozenSet[str] = frozenset(
 )
 
 
+_FORBIDDEN_MATCHER = PhraseMatcher(FORBIDDEN_TOKENS, case_sensitive=True)
+
+
 def contains_forbidden_token(raw_input: str) -> bool:
     """
     Returns True if any forbidden token is present in the raw input.
     Raw string check only — no parsing, no splitting.
     """
-    return any(token in raw_input for token in FORBIDDEN_TOKENS)
+    return _FORBIDDEN_MATCHER.contains_any(raw_input)
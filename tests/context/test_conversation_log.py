@@ -0,0 +1,135 @@
+import threading
+
+import pytest
+
+from core.context.conversation_log import ConversationLogger, DurabilityMode
+
+
+class RecordingWriter:
+    def __init__(self):
+        self.batches = []
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def __call__(self, rows):
+        self.gate.wait()
+        self.batches.append(list(rows))
+
+    @property
+    def rows(self):
+        return [row for batch in self.batches for row in batch]
+
+
+def test_async_rows_written_in_order_and_batched():
+    writer = RecordingWriter()
+    writer.gate.clear()  # hold the first batch so the rest pile up
+    log = ConversationLogger(writer, batch_size=10, flush_interval=0.01)
+
+    expected = [("user", str(n), "chat") for n in range(25)]
+    for row in expected:
+        assert log.log(*row)
+    writer.gate.set()
+    log.flush()
+
+    assert writer.rows == expected
+    assert len(writer.batches) < len(expected)
+    stats = log.stats()
+    assert stats.written == 25 and stats.dropped == 0 and stats.queued == 0
+    log.close()
+
+
+def test_close_drains_queue_and_rejects_later_rows():
+    writer = RecordingWriter()
+    log = ConversationLogger(writer, flush_interval=60)
+
+    log.log("user", "hi", "chat")
+    log.close()
+    assert writer.rows == [("user", "hi", "chat")]
+
+    assert log.log("user", "late", "chat") is False
+    assert log.stats().dropped == 1
+
+
+def test_rows_logged_during_close_are_written_or_counted():
+    for _ in range(20):
+        writer = RecordingWriter()
+        log = ConversationLogger(writer, flush_interval=0.001)
+        start = threading.Barrier(5)
+        accepted = []
+
+        def produce():
+            start.wait()
+            accepted.extend(log.log("user", "x", "chat") for _ in range(200))
+
+        producers = [threading.Thread(target=produce) for _ in range(4)]
+        for thread in producers:
+            thread.start()
+        start.wait()
+        log.close()
+        for thread in producers:
+            thread.join()
+
+        stats = log.stats()
+        assert len(writer.rows) == stats.written == accepted.count(True)
+        assert stats.dropped == accepted.count(False)
+
+
+def test_flush_after_close_does_not_block():
+    log = ConversationLogger(RecordingWriter())
+    log.close()
+    log._queue.put_nowait(("user", "stray", "chat"))  # never taken
+
+    flusher = threading.Thread(target=log.flush, daemon=True)
+    flusher.start()
+    flusher.join(1)
+    assert not flusher.is_alive()
+
+
+def test_full_queue_applies_backpressure_then_drops():
+    writer = RecordingWriter()
+    writer.gate.clear()
+    log = ConversationLogger(
+        writer, max_pending=2, batch_size=1, put_timeout=0.01
+    )
+
+    results = [log.log("user", str(n), "chat") for n in range(10)]
+    writer.gate.set()
+    log.close()
+
+    stats = log.stats()
+    assert stats.backpressure_waits > 0
+    assert stats.dropped == results.count(False) > 0
+    assert stats.written == results.count(True)
+
+
+def broken(rows):
+    raise RuntimeError("db down")
+
+
+def test_failed_batch_is_counted_not_raised():
+    log = ConversationLogger(broken, flush_interval=0.01)
+    log.log("user", "hi", "chat")
+    log.flush()
+    assert log.stats().failed == 1
+    log.close()
+
+
+def test_sync_mode_writes_before_returning():
+    writer = RecordingWriter()
+    log = ConversationLogger(writer, durability="sync")
+
+    log.log("assistant", "done", "chat")
+    assert writer.rows == [("assistant", "done", "chat")]
+    assert log.durability is DurabilityMode.SYNC
+
+    with pytest.raises(RuntimeError):
+        ConversationLogger(broken, durability=DurabilityMode.SYNC).log(
+            "user", "hi", "chat"
+        )
+
+
+def test_durability_from_env(monkeypatch):
+    monkeypatch.setenv("RUDRA_CONVERSATION_DURABILITY", "SYNC")
+    assert DurabilityMode.from_env() is DurabilityMode.SYNC
+    monkeypatch.setenv("RUDRA_CONVERSATION_DURABILITY", "bogus")
+    assert DurabilityMode.from_env() is DurabilityMode.ASYNC
@@ -0,0 +1,84 @@
+import pytest
+
+from core.context.conversation_tail import ConversationTail
+
+
+class FakeStore:
+    def __init__(self):
+        self.rows = []
+        self.loads = 0
+
+    def write(self, tail, *rows):
+        self.rows.extend(rows)
+        tail.append(rows)
+
+    def load(self, limit):
+        self.loads += 1
+        return list(reversed(self.rows))[:limit]
+
+
+def test_reads_within_tail_hit_memory_after_priming():
+    store, tail = FakeStore(), ConversationTail(capacity=4)
+    store.rows = [1, 2, 3]
+
+    assert tail.get_or_load(2, store.load) == [3, 2]
+    assert store.loads == 1 and tail.primed
+
+    store.write(tail, 4, 5)
+    for limit in range(1, 5):
+        assert tail.get_or_load(limit, store.load) == store.load(limit)
+    assert store.loads == 1 + 4  # only the reference reads above
+
+
+def test_deeper_reads_fall_back_to_the_store():
+    store, tail = FakeStore(), ConversationTail(capacity=2)
+    store.rows = list(range(10))
+    tail.get_or_load(1, store.load)
+
+    loads = store.loads
+    assert tail.get_or_load(5, store.load) == [9, 8, 7, 6, 5]
+    assert store.loads == loads + 1
+    assert tail.misses == 2 and tail.hits == 0
+
+
+def test_write_racing_the_priming_read_is_not_lost():
+    store, tail = FakeStore(), ConversationTail(capacity=4)
+    store.rows = [1]
+
+    def racing_load(limit):
+        rows = store.load(limit)
+        store.write(tail, 2)  # commits after the read saw the table
+        return rows
+
+    assert tail.get_or_load(2, racing_load) == [1]
+    assert not tail.primed
+    assert tail.get_or_load(2, store.load) == [2, 1]
+
+
+def test_write_committed_before_the_priming_read_is_not_doubled():
+    store, tail = FakeStore(), ConversationTail(capacity=5)
+    store.rows = [1, 2]
+
+    with tail.writing():
+        store.rows.append(3)  # committed, not yet appended
+        assert tail.get_or_load(5, store.load) == [3, 2, 1]
+        tail.append([3])
+
+    assert not tail.primed
+    assert tail.get_or_load(5, store.load) == [3, 2, 1]
+    assert tail.recent(5) == [3, 2, 1]
+
+
+def test_writes_before_priming_are_ignored_and_capacity_validated():
+    tail = ConversationTail(capacity=2)
+    tail.append([1])
+    assert tail.recent(1) is None
+
+    tail.prime([3, 2, 1])
+    assert tail.recent(5) is None and tail.recent(2) == [3, 2]
+
+    tail.invalidate()
+    assert not tail.primed
+
+    with pytest.raises(ValueError):
+        ConversationTail(capacity=0)
@@ -107,3 +107,40 @@ def test_no_never_executes_dispatcher(monkeypatch):
     orchestrator.execute(intent=None, args={"raw_text": "stop"})
 
     spy.assert_not_called()
+
+
+def test_interrupt_phrase_cancels_pending_action(monkeypatch):
+    orchestrator = CommandOrchestrator()
+
+    pending = make_confirmable_pending_action()
+    orchestrator.follow_up_context.set_pending_action(pending)
+
+    spy = MagicMock()
+    monkeypatch.setattr(orchestrator, "_dispatch_confirmed_action", spy)
+    monkeypatch.setattr(
+        orchestrator.follow_up_context,
+        "resolve_pending_action",
+        MagicMock(side_effect=AssertionError("NLP re-run detected")),
+    )
+
+    result = orchestrator.execute(intent=None, args={"raw_text": "Band karo"})
+
+    assert result["type"] == "info"
+    assert pending.status == "cancelled"
+    assert orchestrator.follow_up_context.pending_action is None
+    spy.assert_not_called()
+
+
+def test_slot_reply_containing_interrupt_word_is_not_a_cancel():
+    for reply in ("stop.txt", "delete stop notes", "quit app", "the abort log"):
+        orchestrator = CommandOrchestrator()
+
+        pending = make_confirmable_pending_action()
+        orchestrator.follow_up_context.set_pending_action(pending)
+        resolve = MagicMock(return_value=None)
+        orchestrator.follow_up_context.resolve_pending_action = resolve
+
+        orchestrator.execute(intent=None, args={"raw_text": reply})
+
+        resolve.assert_called_once_with(reply)
+        assert pending.status != "cancelled"
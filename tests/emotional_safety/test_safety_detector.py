@@ -10,3 +10,9 @@ def test_detector_finds_signal():
 def test_detector_no_signal():
     signals = SafetyDetector.detect("Hello, how are you?")
     assert signals == []
+
+
+def test_detector_reports_each_signal_once_in_text_order():
+    text = "Let me decide. You need me. Let me decide."
+    signals = SafetyDetector.detect(text)
+    assert signals == ["let me decide", "you need me"]
@@ -7,3 +7,17 @@ def test_engine_exact_match():
     res = ke.answer("q")
     assert res["answer"] == "a"
     assert res["citation"] == "c"
+
+
+def test_engine_first_row_wins_and_query_is_normalized():
+    rows = [
+        DharmaRow("Dharma", "What is dharma", "a1", "c1"),
+        DharmaRow("dharma", "what is dharma", "a2", ""),
+    ]
+    ke = KnowledgeEngine(rows)
+
+    assert ke.answer("  WHAT IS DHARMA ")["answer"] == "a1"
+    assert ke.answer("what is karma") is None
+    assert ke.query(" DHARMA ") == "- a1\n  (c1)\n- a2"
+    assert ke.query("karma") is None
+    assert ke.rows_for_topic("dharma") == tuple(rows)
@@ -0,0 +1,85 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.knowledge.exceptions import KnowledgeValidationError
+from core.knowledge.gita_loader import GITA_FORMAT, load_gita_csv
+from core.knowledge.loader import DHARMA_FORMAT, load_dharma_csv
+from core.knowledge.ingest import ingest_corpora, ingest_csv, iter_record_chunks
+
+
+HEADER = "topic,question,answer,chapter,verse,citation\n"
+
+
+def _gita_csv(tmp_path, n, bad_row=None):
+    lines = [HEADER]
+    for i in range(1, n + 1):
+        verse = i
+        citation = f"Bhagavad Gita 2.{verse}"
+        if i == bad_row:
+            citation = "Bhagavad Gita 9.9"
+        # quoted answer with an embedded newline and escaped quotes
+        lines.append(
+            f'karma,question {i},"line one\nsays ""act"" {i}",2,{verse},{citation}\n'
+        )
+    path = tmp_path / "gita.csv"
+    path.write_text("".join(lines), encoding="utf-8")
+    return path
+
+
+def test_chunks_end_on_record_boundaries(tmp_path):
+    path = _gita_csv(tmp_path, 40)
+    chunks = list(iter_record_chunks(str(path), 64))
+
+    assert len(chunks) > 5
+    assert b"".join(chunks) == path.read_bytes()
+    assert all(c.count(b'"') % 2 == 0 for c in chunks)
+
+
+def test_parallel_ingest_matches_sequential_loader(tmp_path):
+    path = _gita_csv(tmp_path, 60)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        rows = ingest_csv(path, GITA_FORMAT, executor=pool, chunk_bytes=64)
+
+    assert rows == load_gita_csv(str(path))
+    assert rows[0].answer == 'line one\nsays "act" 1'
+
+
+def test_parallel_ingest_reports_global_row_number(tmp_path):
+    path = _gita_csv(tmp_path, 60, bad_row=47)
+
+    with pytest.raises(KnowledgeValidationError) as sequential:
+        load_gita_csv(str(path))
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        with pytest.raises(KnowledgeValidationError) as parallel:
+            ingest_csv(path, GITA_FORMAT, executor=pool, chunk_bytes=64)
+
+    assert str(parallel.value) == str(sequential.value)
+    assert str(parallel.value).startswith("Row 47:")
+
+
+def test_process_pool_ingest(tmp_path):
+    path = _gita_csv(tmp_path, 30)
+
+    rows = ingest_csv(path, GITA_FORMAT, max_workers=2, chunk_bytes=256)
+
+    assert rows == load_gita_csv(str(path))
+
+
+def test_ingest_corpora_keeps_source_order():
+    from core.knowledge.bootstrap import corpus_source
+
+    sources = {
+        "gita": (corpus_source("gita"), GITA_FORMAT),
+        "dharma_base": (corpus_source("dharma_base"), DHARMA_FORMAT),
+    }
+
+    corpora = ingest_corpora(sources, max_workers=2, chunk_bytes=128)
+
+    assert list(corpora) == ["gita", "dharma_base"]
+    assert corpora["gita"] == load_gita_csv(str(sources["gita"][0]))
+    assert corpora["dharma_base"] == load_dharma_csv(
+        str(sources["dharma_base"][0])
+    )
@@ -0,0 +1,34 @@
+from core.knowledge.query_cache import QueryCache
+
+
+def test_lru_eviction_and_counters():
+    cache = QueryCache(maxsize=2)
+    calls = []
+
+    def compute(value):
+        def run():
+            calls.append(value)
+            return value
+        return run
+
+    assert cache.get_or_compute("a", compute(1)) == 1
+    assert cache.get_or_compute("b", compute(2)) == 2
+    assert cache.get_or_compute("a", compute(99)) == 1   # hit, a is MRU
+    assert cache.get_or_compute("c", compute(3)) == 3    # evicts b
+    assert cache.get_or_compute("b", compute(4)) == 4
+
+    assert calls == [1, 2, 3, 4]
+    assert (cache.hits, cache.misses, len(cache)) == (1, 4, 2)
+
+
+def test_none_results_are_cached_and_invalidate_clears():
+    cache = QueryCache()
+    calls = []
+
+    for _ in range(3):
+        cache.get_or_compute("unknown", lambda: calls.append(1))
+
+    assert len(calls) == 1
+    assert cache.invalidate() == 1
+    assert len(cache) == 0
+    assert cache.stats().hit_rate == 2 / 3
@@ -0,0 +1,137 @@
+import pytest
+
+from core.knowledge.bootstrap import load_corpora
+from core.knowledge.engine import KnowledgeEngine
+from core.knowledge.registry import KnowledgeRegistry
+
+CSVS = {
+    "dharma_base.csv": (
+        "topic,question,answer,citation\n"
+        "dharma,what is dharma,base answer,Bhagavad Gita 2.40\n"
+    ),
+    "gita.csv": (
+        "topic,question,answer,chapter,verse,citation\n"
+        "dharma,what is dharma,gita answer,2,40,Bhagavad Gita 2.40\n"
+        "karma,what is karma yoga,duty,2,47,Bhagavad Gita 2.47\n"
+    ),
+    "upanishads.csv": (
+        "topic,question,answer,text,verse,citation\n"
+        "moksha,what is moksha,liberation,Isha Upanishad,1,Isha Upanishad 1\n"
+    ),
+    "yoga_sutras.csv": (
+        "topic,question,answer,chapter,sutra,citation\n"
+        "yoga,what is yoga,stillness,1,2,Yoga Sutra 1.2\n"
+    ),
+}
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    for name, body in CSVS.items():
+        (tmp_path / name).write_text(body, encoding="utf-8")
+    return tmp_path
+
+
+def test_registry_matches_single_combined_engine(data_dir):
+    rows = [r for rs in load_corpora(data_dir).values() for r in rs]
+    combined = KnowledgeEngine(rows)
+    registry = KnowledgeRegistry(data_dir)
+
+    for topic in ["dharma", "karma", "moksha", "yoga", "unknown"]:
+        assert registry.query(topic) == combined.query(topic)
+    for q in ["what is dharma", "what is yoga", "nothing"]:
+        assert registry.answer(q) == combined.answer(q)
+
+
+def test_topic_query_loads_only_matching_corpora(data_dir):
+    load_corpora(data_dir)  # snapshots (with topic headers) exist
+    registry = KnowledgeRegistry(data_dir)
+
+    assert registry.query("moksha").startswith("- liberation")
+    assert registry.is_loaded("upanishads")
+    assert not registry.is_loaded("gita")
+    assert not registry.is_loaded("yoga_sutras")
+    assert registry.metrics()["corpora_loaded"] == 1
+
+
+def test_rows_are_loaded_once_and_shared(data_dir):
+    registry = KnowledgeRegistry(data_dir)
+
+    gita = registry.rows("gita")
+    assert registry.rows("gita") is gita
+    assert registry.engine("gita") is registry.engine("gita")
+
+    everything = registry.engine()
+    assert any(r is gita[0] for r in everything._rows)
+
+    stats = registry.stats()["gita"]
+    assert stats.rows == 2
+    assert stats.approx_bytes > 0
+    assert stats.load_seconds >= 0.0
+
+
+def test_reload_drops_rows_and_engines(data_dir):
+    registry = KnowledgeRegistry(data_dir)
+    engine = registry.engine("gita")
+
+    registry.reload("gita")
+    assert not registry.is_loaded("gita")
+    assert registry.engine("gita") is not engine
+
+
+def test_repeated_queries_are_served_from_cache(data_dir, monkeypatch):
+    registry = KnowledgeRegistry(data_dir)
+
+    block = registry.query("Dharma")
+    answer = registry.answer("what is yoga")
+
+    def boom(*args):
+        raise AssertionError("re-aggregated a cached result")
+
+    monkeypatch.setattr(registry, "_query", boom)
+    monkeypatch.setattr(registry, "_answer", boom)
+
+    assert registry.query(" dharma ") == block
+    assert registry.answer("What is Yoga") == answer
+
+    stats = registry.cache_stats()
+    assert (stats.hits, stats.misses) == (2, 2)
+    assert registry.metrics()["cache_hits"] == 2
+
+
+def test_reload_invalidates_cached_results(data_dir):
+    registry = KnowledgeRegistry(data_dir)
+    assert registry.query("yoga") == "- stillness\n  (Yoga Sutra 1.2)"
+    old_version = registry.version("yoga_sutras")
+
+    (data_dir / "yoga_sutras.csv").write_text(
+        "topic,question,answer,chapter,sutra,citation\n"
+        "yoga,what is yoga,restraint,1,2,Yoga Sutra 1.2\n",
+        encoding="utf-8",
+    )
+    registry.reload("yoga_sutras")
+
+    assert registry.query("yoga") == "- restraint\n  (Yoga Sutra 1.2)"
+    assert registry.version("yoga_sutras") != old_version
+    assert registry.cache_stats().misses == 2
+
+
+def test_cache_only_versions_the_corpora_a_result_used(data_dir, monkeypatch):
+    from core.knowledge import registry as registry_module
+
+    versioned = []
+    real_version = registry_module.corpus_version
+
+    def spy(corpus, data_dir=None):
+        versioned.append(corpus)
+        return real_version(corpus, data_dir)
+
+    monkeypatch.setattr(registry_module, "corpus_version", spy)
+    registry = KnowledgeRegistry(data_dir)
+
+    assert registry.answer("what is dharma")["answer"] == "base answer"
+    assert registry.answer("what is dharma")["answer"] == "base answer"
+
+    assert versioned == ["dharma_base"]
+    assert not registry.is_loaded("gita")
+    assert registry.cache_stats().hits == 1
@@ -0,0 +1,150 @@
+from core.knowledge.engine import KnowledgeEngine
+from core.knowledge.explain_surface import KnowledgeExplainSurface
+from core.knowledge.gita_schema import GitaRow
+from core.knowledge.retrieval import BM25Index, retrieval_terms
+from core.knowledge.schema import DharmaRow
+from core.knowledge.bootstrap import build_scripture_index
+
+
+def _index():
+    index = BM25Index()
+    index.add("gita", [
+        GitaRow("karma", "what is karma yoga",
+                "Perform your duty without attachment to results",
+                2, 47, "Bhagavad Gita 2.47"),
+        GitaRow("jnana", "what is true knowledge",
+                "True knowledge is understanding the imperishable self",
+                2, 16, "Bhagavad Gita 2.16"),
+    ])
+    index.add("yoga", [
+        DharmaRow("yoga", "what is yoga",
+                  "Yoga is the cessation of fluctuations of the mind",
+                  "Yoga Sutra 1.2"),
+    ])
+    return index
+
+
+def test_terms_drop_stopwords():
+    assert retrieval_terms("What is the Self?") == ["self"]
+
+
+def test_search_ranks_and_returns_verbatim_rows():
+    hits = _index().search("duty without attachment", k=2)
+    assert hits[0].row.citation == "Bhagavad Gita 2.47"
+    assert hits[0].to_dict()["answer"] == (
+        "Perform your duty without attachment to results"
+    )
+    assert len(hits) == 1  # no other row shares a term
+
+
+def test_search_empty_and_stopword_queries():
+    index = _index()
+    assert index.search("what is the", k=3) == []
+    assert BM25Index().search("karma") == []
+
+
+def test_replace_corpus_is_incremental():
+    index = _index()
+    assert len(index) == 3
+
+    index.replace_corpus("yoga", [
+        DharmaRow("yoga", "what is samadhi", "Samadhi is absorption",
+                  "Yoga Sutra 3.3"),
+    ])
+    assert len(index) == 3
+    assert index.search("fluctuations") == []
+    assert index.search("samadhi")[0].row.citation == "Yoga Sutra 3.3"
+
+    assert index.remove_corpus("gita") == 2
+    assert index.search("karma") == []
+    assert index.corpora == ("yoga",)
+
+
+def test_explain_surface_prefers_exact_then_retrieval():
+    rows = [DharmaRow("dharma", "what is dharma", "exact", "c")]
+    surface = KnowledgeExplainSurface(KnowledgeEngine(rows), retriever=_index())
+
+    assert surface.respond("what is dharma")["answer"] == "exact"
+
+    res = surface.respond("tell me about the imperishable self")
+    assert res["citation"] == "Bhagavad Gita 2.16"
+
+    res = surface.respond("quantum physics")
+    assert res["topic"] == "unknown"
+
+
+def test_scripture_index_loads_all_corpora():
+    index = build_scripture_index()
+    assert set(index.corpora) == {
+        "dharma_base", "gita", "upanishads", "yoga_sutras"
+    }
+    assert index.search("moksha")[0].row.citation == "Isha Upanishad 1"
+
+
+def test_early_termination_matches_exhaustive_bm25():
+    import math
+    import random
+
+    rng = random.Random(9)
+    words = [f"w{i}" for i in range(30)]
+    rows = [
+        DharmaRow(
+            "t",
+            " ".join(rng.choice(words[:5]) for _ in range(3)),
+            " ".join(rng.choice(words) for _ in range(rng.randint(1, 10))),
+            f"c{i}",
+        )
+        for i in range(300)
+    ]
+    index = BM25Index()
+    index.add("x", rows)
+
+    docs = [retrieval_terms(f"{r.topic} {r.question} {r.answer}") for r in rows]
+    avgdl = sum(map(len, docs)) / len(docs)
+
+    def brute(query, k):
+        scores = []
+        for i, d in enumerate(docs):
+            s = 0.0
+            for t in dict.fromkeys(retrieval_terms(query)):
+                tf = d.count(t)
+                if not tf:
+                    continue
+                df = sum(1 for e in docs if t in e)
+                idf = math.log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+                s += idf * tf * 2.2 / (tf + 1.2 * (0.25 + 0.75 * len(d) / avgdl))
+            if s:
+                scores.append((round(s, 9), -i))
+        return [(s, -i) for s, i in sorted(scores, reverse=True)[:k]]
+
+    for _ in range(50):
+        query = " ".join(rng.choice(words) for _ in range(rng.randint(1, 3)))
+        got = [
+            (round(h.score, 9), rows.index(h.row))
+            for h in index.search(query, k=5)
+        ]
+        assert [s for s, _ in got] == [s for s, _ in brute(query, 5)]
+
+
+def test_early_termination_keeps_load_order_on_ties():
+    docs = ["c", "b c c a", "a c b c", "b a a", "b a b c", "b c c c"]
+    index = BM25Index()
+    index.add("x", [DharmaRow("", d, "", f"c{i}") for i, d in enumerate(docs)])
+
+    # c1, c2 and c4 tie; c2 must not be skipped for c4
+    assert [h.row.citation for h in index.search("a b c", k=2)] == ["c1", "c2"]
+
+
+def test_repeated_replace_compacts_tombstones():
+    index = _index()
+    rounds = 2 * BM25Index.COMPACT_MIN_TOMBSTONES
+    for n in range(rounds):
+        index.replace_corpus("yoga", [
+            DharmaRow("yoga", "what is yoga", f"Yoga answer {n}", "Yoga Sutra 1.2"),
+        ])
+
+    assert len(index) == 3
+    # Bounded by the compaction threshold, not by the number of replaces
+    assert len(index._docs) <= BM25Index.COMPACT_MIN_TOMBSTONES + len(index)
+    assert index.search("karma")[0].row.citation == "Bhagavad Gita 2.47"
+    assert index.search("yoga")[0].row.answer == f"Yoga answer {rounds - 1}"
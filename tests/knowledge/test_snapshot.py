@@ -0,0 +1,109 @@
+import dataclasses
+import os
+
+import pytest
+
+from core.knowledge import bootstrap, snapshot
+from core.knowledge.bootstrap import (
+    SCRIPTURE_CORPORA,
+    corpus_topics,
+    load_corpora,
+)
+from core.knowledge.snapshot import default_snapshot_path, read_snapshot
+
+CSVS = {
+    "dharma_base.csv": "topic,question,answer,citation\ndharma,q,a,c\n",
+    "gita.csv": (
+        "topic,question,answer,chapter,verse,citation\n"
+        "karma,q,a,2,47,Bhagavad Gita 2.47\n"
+    ),
+    "upanishads.csv": (
+        "topic,question,answer,text,verse,citation\n"
+        "moksha,q,a,Isha Upanishad,1,Isha Upanishad 1\n"
+    ),
+    "yoga_sutras.csv": (
+        "topic,question,answer,chapter,sutra,citation\n"
+        "yoga,q,a,1,2,Yoga Sutra 1.2\n"
+    ),
+}
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    for name, body in CSVS.items():
+        (tmp_path / name).write_text(body, encoding="utf-8")
+    return tmp_path
+
+
+def _boom(record, i):
+    raise AssertionError("CSV parsed despite valid snapshot")
+
+
+def _fail_loaders(monkeypatch):
+    monkeypatch.setattr(
+        bootstrap,
+        "SCRIPTURE_CORPORA",
+        {
+            k: (f, dataclasses.replace(fmt, parse_row=_boom))
+            for k, (f, fmt) in SCRIPTURE_CORPORA.items()
+        },
+    )
+
+
+def test_first_load_writes_snapshot_second_load_uses_it(data_dir, monkeypatch):
+    corpora = load_corpora(data_dir)
+    for corpus in SCRIPTURE_CORPORA:
+        assert default_snapshot_path(data_dir, corpus).exists()
+
+    _fail_loaders(monkeypatch)
+    assert load_corpora(data_dir) == corpora
+
+
+def test_touched_but_unchanged_csv_still_hits(data_dir, monkeypatch):
+    corpora = load_corpora(data_dir)
+
+    path = data_dir / "gita.csv"
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+    _fail_loaders(monkeypatch)
+    assert load_corpora(data_dir) == corpora
+
+    # Fingerprint refreshed: the next start does not re-hash the CSV
+    monkeypatch.setattr(
+        snapshot,
+        "source_hash",
+        lambda paths: pytest.fail("source re-hashed after refresh"),
+    )
+    assert load_corpora(data_dir) == corpora
+    assert bootstrap.corpus_version("gita", data_dir)
+
+
+def test_changed_csv_invalidates_snapshot(data_dir):
+    load_corpora(data_dir)
+
+    (data_dir / "dharma_base.csv").write_text(
+        "topic,question,answer,citation\ndharma,q2,a2,c2\n", encoding="utf-8"
+    )
+    path = default_snapshot_path(data_dir, "dharma_base")
+    sources = [data_dir / "dharma_base.csv"]
+    assert read_snapshot(path, sources) is None
+
+    corpora = load_corpora(data_dir)
+    assert corpora["dharma_base"][0].question == "q2"
+    assert read_snapshot(path, sources) == corpora["dharma_base"]
+
+
+def test_corrupt_snapshot_falls_back_to_csv(data_dir):
+    path = default_snapshot_path(data_dir, "yoga_sutras")
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"garbage")
+
+    corpora = load_corpora(data_dir)
+    assert corpora["yoga_sutras"][0].citation == "Yoga Sutra 1.2"
+
+
+def test_topics_come_from_header_only(data_dir):
+    assert corpus_topics("gita", data_dir) is None
+    load_corpora(data_dir)
+    assert corpus_topics("gita", data_dir) == ["karma"]
@@ -0,0 +1,128 @@
+import random
+
+from core.knowledge.engine import KnowledgeEngine
+from core.knowledge.explain_surface import KnowledgeExplainSurface
+from core.knowledge.gita_schema import GitaRow
+from core.knowledge.schema import DharmaRow
+from core.knowledge.upanishad_schema import UpanishadRow
+from core.knowledge.verse_index import (
+    VerseIndex,
+    VerseRange,
+    parse_verse_reference,
+)
+
+
+def _gita(chapter, verse, topic="karma"):
+    return GitaRow(
+        topic, f"q {chapter}.{verse}", f"a {chapter}.{verse}",
+        chapter, verse, f"Bhagavad Gita {chapter}.{verse}",
+    )
+
+
+def _engine():
+    rows = [
+        _gita(3, 1), _gita(2, 50), _gita(2, 47), _gita(2, 48),
+        _gita(4, 17), _gita(2, 16),
+        UpanishadRow("moksha", "qi", "ai", "Isha Upanishad", "1",
+                     "Isha Upanishad 1"),
+        DharmaRow("duty", "qd", "ad", "Bhagavad Gita 2.47"),
+    ]
+    return KnowledgeEngine(rows)
+
+
+def _citations(rows):
+    return [r.citation for r in rows]
+
+
+def test_parse_verse_reference_forms():
+    assert parse_verse_reference("Gita 2.47") == VerseRange(
+        "bhagavad gita", 2, 47, 2, 47
+    )
+    assert parse_verse_reference("gita 2.47 – 2.50") == VerseRange(
+        "bhagavad gita", 2, 47, 2, 50
+    )
+    assert parse_verse_reference("Gita 2.47-50") == VerseRange(
+        "bhagavad gita", 2, 47, 2, 50
+    )
+    assert parse_verse_reference("all of chapter 3") == VerseRange(
+        None, 3, None, 3, None
+    )
+    assert parse_verse_reference("Gita chapter 3") == VerseRange(
+        "bhagavad gita", 3, None, 3, None
+    )
+    assert parse_verse_reference("chapter 2 verse 47") == VerseRange(
+        None, 2, 47, 2, 47
+    )
+    assert parse_verse_reference("Gita chapter 2, verses 47 to verse 50") == (
+        VerseRange("bhagavad gita", 2, 47, 2, 50)
+    )
+    assert parse_verse_reference("bg chapter 2 verse 72 to chapter 3 verse 2") == (
+        VerseRange("bhagavad gita", 2, 72, 3, 2)
+    )
+    assert parse_verse_reference("what is karma") is None
+    assert parse_verse_reference("47") is None
+    assert parse_verse_reference("Gita 2.50-2.47") is None
+
+
+def test_point_and_range_lookups():
+    ke = _engine()
+
+    assert _citations(ke.verses("Gita 2.47")) == [
+        "Bhagavad Gita 2.47", "Bhagavad Gita 2.47",
+    ]
+    assert _citations(ke.verses("Bhagavad Gita 2.47 to 2.50")) == [
+        "Bhagavad Gita 2.47", "Bhagavad Gita 2.47",
+        "Bhagavad Gita 2.48", "Bhagavad Gita 2.50",
+    ]
+    assert _citations(ke.verses("Gita 2.48-3.1")) == [
+        "Bhagavad Gita 2.48", "Bhagavad Gita 2.50", "Bhagavad Gita 3.1",
+    ]
+    assert _citations(ke.verses("all of chapter 3")) == ["Bhagavad Gita 3.1"]
+    assert _citations(ke.verses("Isha Upanishad 1")) == ["Isha Upanishad 1"]
+    assert ke.verses("Gita 5.1") == ()
+    assert ke.verses("Mahabharata 2.47") == ()
+
+
+def test_same_verse_keeps_load_order():
+    ke = _engine()
+    rows = ke.verses("Gita 2.47")
+    assert isinstance(rows[0], GitaRow)
+    assert isinstance(rows[1], DharmaRow)
+
+
+def test_range_matches_linear_scan():
+    rng = random.Random(7)
+    rows = [
+        _gita(rng.randint(1, 18), rng.randint(1, 60)) for _ in range(2000)
+    ]
+    index = VerseIndex(rows)
+    ordered = sorted(rows, key=lambda r: (r.chapter, r.verse))
+
+    for _ in range(200):
+        a = (rng.randint(1, 18), rng.randint(1, 60))
+        b = (rng.randint(1, 18), rng.randint(1, 60))
+        lo, hi = min(a, b), max(a, b)
+
+        expected = [r for r in ordered if lo <= (r.chapter, r.verse) <= hi]
+        assert list(index.verse_range("gita", lo, hi)) == expected
+
+        assert list(index.chapter("gita", lo[0])) == [
+            r for r in ordered if r.chapter == lo[0]
+        ]
+
+
+def test_explain_surface_answers_verse_references():
+    es = KnowledgeExplainSurface(_engine())
+
+    res = es.respond("Gita 2.48")
+    assert res["answer"] == "a 2.48"
+    assert res["citation"] == "Bhagavad Gita 2.48"
+
+    res = es.respond("chapter 2 verse 48")
+    assert res["citation"] == "Bhagavad Gita 2.48"
+
+    res = es.respond("Gita 2.47-2.48")
+    assert res["answer"] == "- a 2.47\n- ad\n- a 2.48"
+    assert res["citation"] == "Bhagavad Gita 2.47; Bhagavad Gita 2.48"
+
+    assert es.respond("Gita 9.9")["topic"] == "unknown"
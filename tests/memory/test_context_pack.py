@@ -0,0 +1,120 @@
+import random
+
+from core.memory.context_pack import ContextPackBuilder
+from core.memory.long_term_memory import LongTermMemory
+from core.memory.short_term_memory import ShortTermMemory
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingLTM(LongTermMemory):
+    def __init__(self):
+        super().__init__()
+        self.entries = {}
+        self.reads = 0
+
+    def store(self, *, content, memory_type, confidence):
+        super().store(content=content, memory_type=memory_type, confidence=confidence)
+        self.entries.setdefault(memory_type, []).append({"content": content})
+
+    def fetch_by_type(self, memory_type):
+        self.reads += 1
+        return list(self.entries.get(memory_type, []))
+
+
+def _builder():
+    clock = FakeClock()
+    stm = ShortTermMemory()
+    stm._now = clock
+    ltm = CountingLTM()
+    return ContextPackBuilder(stm=stm, ltm=ltm), stm, ltm, clock
+
+
+def test_unchanged_stores_reuse_pack():
+    builder, stm, ltm, _ = _builder()
+    stm.store(role="user", content="hi", intent="chat", confidence=0.9)
+
+    first = builder.build(intent="chat")
+    reads = ltm.reads
+    assert builder.build(intent="chat") == first
+    assert ltm.reads == reads
+
+
+def test_only_changed_section_is_rebuilt():
+    builder, stm, ltm, _ = _builder()
+    first = builder.build()
+
+    stm.store(role="user", content="hi", intent="chat", confidence=0.9)
+    reads = ltm.reads
+    second = builder.build()
+    assert ltm.reads == reads  # LTM untouched
+    assert [e["content"] for e in second["recent_conversation"]] == ["hi"]
+    assert second["user_facts"] == first["user_facts"]
+    assert second["user_preferences"] == first["user_preferences"]
+
+    ltm.store(content="likes tea", memory_type="user_preference", confidence=0.9)
+    stm.fetch_recent = None  # STM section must come from the memo
+    third = builder.build()
+    assert third["user_preferences"] == [{"content": "likes tea"}]
+    assert third["recent_conversation"] == second["recent_conversation"]
+
+
+def test_mutating_a_pack_does_not_leak_into_the_next():
+    builder, stm, ltm, _ = _builder()
+    stm.store(role="user", content="hi", intent="chat", confidence=0.9)
+    ltm.store(content="likes tea", memory_type="user_preference", confidence=0.9)
+
+    pack = builder.build()
+    pack["recent_conversation"][0]["content"] = "changed"
+    pack["user_preferences"].clear()
+    pack["extra"] = True
+
+    again = builder.build()
+    assert again["recent_conversation"][0]["content"] == "hi"
+    assert again["user_preferences"] == [{"content": "likes tea"}]
+    assert "extra" not in again
+
+
+def test_intent_change_gives_new_pack():
+    builder, _, _, _ = _builder()
+    builder.build(intent="chat")
+    assert builder._pack_intent == "chat"
+    builder.build(intent="weather")
+    assert builder._pack_intent == "weather"
+
+
+def test_matches_fresh_build_under_random_writes_and_time():
+    builder, stm, ltm, clock = _builder()
+    rng = random.Random(92)
+
+    for _ in range(500):
+        op = rng.random()
+        if op < 0.4:
+            stm.store(
+                role=rng.choice(["user", "assistant"]),
+                content=str(rng.random()),
+                intent=rng.choice(["chat", "weather"]),
+                confidence=rng.choice([0.5, 0.8, 0.95]),
+            )
+        elif op < 0.5:
+            ltm.store(
+                content=str(rng.random()),
+                memory_type=rng.choice(["user_fact", "user_preference"]),
+                confidence=0.9,
+            )
+        elif op < 0.55:
+            stm.clear()
+        clock.now += rng.choice([0, 1, 30, 120])
+
+        pack = builder.build(intent=rng.choice(["chat", None]))
+        assert pack == {
+            "recent_conversation": stm.fetch_recent(limit=5),
+            "user_facts": ltm.fetch_by_type("user_fact"),
+            "user_preferences": ltm.fetch_by_type("user_preference"),
+        }
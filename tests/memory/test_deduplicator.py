@@ -0,0 +1,71 @@
+import random
+import re
+from types import SimpleNamespace
+
+from core.memory.deduplicator import MemoryDeduplicator
+from core.memory.ltm.entry import MemoryType
+
+
+def _reference_check(new_entry, existing_entries):
+    # Original per-call regex implementation (behavioral oracle)
+    def normalize(text):
+        text = re.sub(r"[^\w\s]", "", text.lower())
+        return re.sub(r"\s+", " ", text).strip()
+
+    def core(text):
+        for verb in MemoryDeduplicator.PREFERENCE_VERBS:
+            text = re.sub(rf"\b{verb}\b", "", text)
+        return re.sub(r"\s+", " ", text).strip()
+
+    new_norm = normalize(new_entry.content)
+    for entry in existing_entries:
+        if entry.type != new_entry.type:
+            continue
+        existing_norm = normalize(entry.content)
+        if existing_norm == new_norm:
+            return "duplicate"
+        new_core, existing_core = core(new_norm), core(existing_norm)
+        if new_core and new_core == existing_core:
+            return "conflict_candidate"
+    return "unique"
+
+
+WORDS = ["I", "like", "LOVE", "hate", "tea", "coffee!", "dark", "enjoy",
+         "likely", "mode", "prefer"]
+
+
+def _entry(i, rng):
+    return SimpleNamespace(
+        id=f"id-{i}",
+        type=rng.choice(list(MemoryType)),
+        content=" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3))),
+    )
+
+
+def test_classify_matches_list_scan_with_adds_and_removes():
+    rng = random.Random(5)
+    dedup = MemoryDeduplicator()
+    stored = {}
+
+    for i in range(600):
+        candidate = _entry(i, rng)
+        assert dedup.classify(candidate) == _reference_check(
+            candidate, list(stored.values())
+        )
+        assert dedup.check(candidate, list(stored.values())) == _reference_check(
+            candidate, list(stored.values())
+        )
+
+        if stored and rng.random() < 0.3:
+            victim = rng.choice(list(stored))
+            assert dedup.remove(victim)
+            del stored[victim]
+        else:
+            dedup.add(candidate)
+            stored[candidate.id] = candidate
+
+
+def test_canonical_keys():
+    dedup = MemoryDeduplicator()
+    assert dedup.canonical_keys("I  LOVE dark-mode!") == ("i love darkmode", "i darkmode")
+    assert dedup.remove("missing") is False
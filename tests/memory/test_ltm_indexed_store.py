@@ -0,0 +1,100 @@
+import random
+from datetime import datetime
+
+import pytest
+
+from core.memory.ltm.entry import LongTermMemoryEntry, MemoryType
+from core.memory.ltm.indexed_store import IndexedLongTermMemoryStore
+from core.memory.ltm.store import LongTermMemoryStore
+
+
+def _entry(i, memory_type, confidence, source="user_confirmed"):
+    return LongTermMemoryEntry(
+        id=f"id-{i}",
+        type=memory_type,
+        content=f"content {i}",
+        confidence=confidence,
+        source=source,
+        created_at=datetime(2025, 1, 1),
+        last_reinforced_at=None,
+        explain_reason="test",
+    )
+
+
+def test_implements_abc_and_preserves_save_order():
+    store = IndexedLongTermMemoryStore()
+    assert isinstance(store, LongTermMemoryStore)
+
+    a = _entry(1, MemoryType.FACT, 0.5)
+    b = _entry(2, MemoryType.PREFERENCE, 0.9)
+    store.save(a)
+    store.save(b)
+
+    assert store.list_all() == [a, b]
+    assert store.get("id-2") is b
+    assert store.delete("id-1") is True
+    assert store.delete("id-1") is False
+    assert store.list_all() == [b]
+    assert store.list_by_type(MemoryType.FACT) == []
+
+
+def test_query_matches_linear_scan_after_random_writes():
+    rng = random.Random(11)
+    store = IndexedLongTermMemoryStore()
+    live = {}
+
+    for i in range(3000):
+        if live and rng.random() < 0.3:
+            victim = rng.choice(list(live))
+            assert store.delete(victim)
+            del live[victim]
+            continue
+        e = _entry(
+            i,
+            rng.choice(list(MemoryType)),
+            round(rng.random(), 2),
+            rng.choice(["user_confirmed", "import"]),
+        )
+        store.save(e)
+        live[e.id] = e
+
+    ordered = sorted(
+        live.values(), key=lambda e: (-e.confidence, int(e.id.split("-")[1]))
+    )
+
+    for _ in range(100):
+        types = rng.choice(
+            [None, MemoryType.FACT, "habit", [MemoryType.FACT, "preference"]]
+        )
+        floor = rng.choice([None, 0.0, 0.5, 0.95])
+        source = rng.choice([None, "import"])
+        limit = rng.choice([None, 1, 25])
+
+        wanted = types
+        if wanted is not None:
+            wanted = [wanted] if isinstance(wanted, (str, MemoryType)) else wanted
+            wanted = {MemoryType(t) if isinstance(t, str) else t for t in wanted}
+
+        expected = [
+            e for e in ordered
+            if (wanted is None or e.type in wanted)
+            and (floor is None or e.confidence >= floor)
+            and (source is None or e.source == source)
+        ][:limit]
+
+        filters = {"type": types, "min_confidence": floor,
+                   "source": source, "limit": limit}
+        filters = {k: v for k, v in filters.items() if v is not None}
+        assert store.query(filters) == expected
+
+
+def test_resave_replaces_and_unknown_filter_rejected():
+    store = IndexedLongTermMemoryStore()
+    store.save(_entry(1, MemoryType.HABIT, 0.2))
+    store.save(_entry(1, MemoryType.FACT, 0.8))
+
+    assert [e.type for e in store.query()] == [MemoryType.FACT]
+    assert store.list_by_type(MemoryType.HABIT) == []
+
+    with pytest.raises(ValueError):
+        store.query({"category": "fact"})
@@ -0,0 +1,113 @@
+import random
+from datetime import datetime, timedelta
+
+from core.memory.ltm.entry import LongTermMemoryEntry, MemoryType
+from core.memory.ltm.indexed_store import IndexedLongTermMemoryStore
+from core.memory.ltm.sqlite_store import SQLiteLongTermMemoryStore
+
+WORDS = ["Tea", "coffee", "morning", "Run", "yoga", "python", "Rust", "night"]
+
+
+def _entries(n, seed=1):
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 1)
+    for i in range(n):
+        created = base + timedelta(minutes=rng.randint(0, 10_000))
+        yield LongTermMemoryEntry(
+            id=f"id-{i}",
+            type=rng.choice(list(MemoryType)),
+            content="  " + " ".join(rng.sample(WORDS, 3)) + " ",
+            confidence=round(rng.random(), 1),
+            source=rng.choice(["user_confirmed", "import"]),
+            created_at=created,
+            last_reinforced_at=(
+                created + timedelta(hours=1) if rng.random() < 0.3 else None
+            ),
+            explain_reason="test",
+        )
+
+
+def _reference_search(entries, memory_type, text, exact, min_confidence, limit):
+    # Python loop of MemoryRecallManager.recall
+    out = []
+    for e in entries:
+        if memory_type and e.type != memory_type:
+            continue
+        if e.confidence < min_confidence:
+            continue
+        if text:
+            norm, q = e.content.strip().lower(), text.strip().lower()
+            if exact and norm != q:
+                continue
+            if not exact and q not in norm:
+                continue
+        out.append(e)
+    out.sort(
+        key=lambda e: (e.confidence, e.last_reinforced_at or e.created_at),
+        reverse=True,
+    )
+    return out[:limit] if limit else out
+
+
+def test_search_matches_python_recall_loop():
+    entries = list(_entries(500))
+    store = SQLiteLongTermMemoryStore(":memory:")
+    assert store.save_many(entries) == 500
+    assert store.has_fts
+
+    rng = random.Random(2)
+    for _ in range(150):
+        kwargs = {
+            "memory_type": rng.choice([None, *MemoryType]),
+            "text": rng.choice(
+                [None, "tea", "COFFEE", "un", "yoga python", "missing",
+                 entries[rng.randrange(500)].content.upper()]
+            ),
+            "exact": rng.random() < 0.3,
+            "min_confidence": rng.choice([0.0, 0.5, 0.9]),
+            "limit": rng.choice([None, 1, 10]),
+        }
+        got = store.search(**kwargs)
+        assert [e.id for e in got] == [
+            e.id for e in _reference_search(entries, **kwargs)
+        ]
+
+
+def test_query_contract_matches_indexed_store():
+    entries = list(_entries(300, seed=4))
+    sqlite_store = SQLiteLongTermMemoryStore(":memory:")
+    indexed = IndexedLongTermMemoryStore()
+    for e in entries:
+        sqlite_store.save(e)
+        indexed.save(e)
+
+    for filters in [
+        None,
+        {"type": MemoryType.FACT},
+        {"type": ["habit", MemoryType.PREFERENCE], "min_confidence": 0.5},
+        {"source": "import", "limit": 7},
+        {"limit": 0},
+    ]:
+        assert sqlite_store.query(filters) == indexed.query(filters)
+
+    assert sqlite_store.list_by_type(MemoryType.HABIT) == indexed.list_by_type(
+        MemoryType.HABIT
+    )
+
+
+def test_persists_across_reopen_and_deletes_from_fts(tmp_path):
+    path = tmp_path / "ltm.sqlite3"
+    entries = list(_entries(20))
+
+    store = SQLiteLongTermMemoryStore(path)
+    store.save_many(entries)
+    assert store.delete("id-3") is True
+    assert store.delete("id-3") is False
+    store.close()
+
+    reopened = SQLiteLongTermMemoryStore(path)
+    assert reopened.list_all() == [e for e in entries if e.id != "id-3"]
+    assert reopened.get("id-5") == entries[5]
+    assert all(
+        e.id != "id-3" for e in reopened.search(text=entries[3].content)
+    )
@@ -0,0 +1,111 @@
+import random
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("loguru")
+
+from core.memory.recall.recall_engine import RecallEngine
+from core.memory.recall.recall_query import MatchMode, RecallQuery
+from core.memory.types import MemoryCategory
+
+WORDS = ["Tea", "coffee", "morning", "yoga", "python", "night"]
+
+
+def _entries(n, seed=8):
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 1)
+    for i in range(n):
+        created = base + timedelta(hours=rng.randint(0, 50))
+        yield SimpleNamespace(
+            id=f"m{i}",
+            category=rng.choice(list(MemoryCategory)),
+            content=" " + " ".join(rng.sample(WORDS, 2)),
+            confidence=round(rng.random(), 1),
+            created_at=created,
+            last_updated=created + timedelta(hours=rng.randint(0, 3)),
+        )
+
+
+def _reference(entries, query):
+    # MemoryRecallManager's Python filter loop
+    out = []
+    for e in entries:
+        if query.category and e.category != query.category:
+            continue
+        if e.confidence < query.min_confidence:
+            continue
+        if query.text:
+            text, q = e.content.strip().lower(), query.text.strip().lower()
+            if query.match_mode == MatchMode.EXACT and text != q:
+                continue
+            if query.match_mode == MatchMode.CONTAINS and q not in text:
+                continue
+        out.append(e)
+    out.sort(key=lambda e: (e.confidence, e.last_updated), reverse=True)
+    return [e.id for e in (out[: query.limit] if query.limit else out)]
+
+
+def _queries(rng, n):
+    for _ in range(n):
+        category = rng.choice([None, *MemoryCategory])
+        yield RecallQuery(
+            category=category,
+            text=rng.choice(
+                [None, "tea", " COFFEE ", "morning yoga", "zzz"]
+                if category else ["tea", "night python", "o"]
+            ),
+            match_mode=rng.choice(list(MatchMode)),
+            min_confidence=rng.choice([0.0, 0.4, 0.9]),
+            limit=rng.choice([None, 1, 5]),
+        )
+
+
+def test_recall_matches_filter_loop_across_writes():
+    rng = random.Random(1)
+    entries = {e.id: e for e in _entries(400)}
+    engine = RecallEngine(entries.values())
+
+    for round_ in range(5):
+        for query in _queries(rng, 60):
+            expected = _reference(entries.values(), query)
+            assert [r.memory_id for r in engine.recall(query)] == expected
+            assert [r.memory_id for r in engine.iter_recall(query)] == expected
+
+        victim = rng.choice(list(entries))
+        engine.remove(victim)
+        del entries[victim]
+        for e in _entries(20, seed=100 + round_):
+            e.id = f"{e.id}-{round_}"
+            entries[e.id] = e
+            engine.add(e)
+
+
+def test_pages_and_batch():
+    entries = list(_entries(50))
+    engine = RecallEngine(entries)
+    query = RecallQuery(category=MemoryCategory.FACT)
+
+    pages = list(engine.recall_pages(query, 4))
+    assert all(len(p) == 4 for p in pages[:-1])
+    assert [r for p in pages for r in p] == engine.recall(query)
+
+    q2 = RecallQuery(text="tea", limit=3)
+    assert engine.recall_many([query, q2]) == [
+        engine.recall(query), engine.recall(q2),
+    ]
+
+
+def test_writes_update_rank_index_in_place():
+    entries = list(_entries(30))
+    engine = RecallEngine(entries[:20])
+    ranked = engine._rank_index(None)
+
+    for e in entries[20:]:
+        engine.add(e)
+    engine.remove("m3")
+
+    assert engine._rank_index(None) is ranked
+    assert ranked == sorted(ranked, key=lambda r: r.rank)
+    assert len(ranked) == 29
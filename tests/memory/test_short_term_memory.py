@@ -0,0 +1,87 @@
+import random
+
+from core.memory.short_term_memory import ShortTermMemory
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _reference_fetch(items, now, limit=None, role=None, intents=None,
+                     min_confidence=None):
+    # Original list-copy implementation, kept as the behavioral oracle
+    items = [x for x in items if now - x["timestamp"] <= ShortTermMemory.TTL_SECONDS]
+    items = items[-ShortTermMemory.MAX_ITEMS:]
+    limit = ShortTermMemory.DEFAULT_READ_LIMIT if limit is None else limit
+    if limit <= 0 or limit > ShortTermMemory.MAX_READ_LIMIT:
+        return []
+    if min_confidence is None:
+        min_confidence = ShortTermMemory.MIN_READ_CONFIDENCE
+    if role is not None:
+        if role not in {"user", "assistant"}:
+            return []
+        items = [x for x in items if x["role"] == role]
+    if intents is not None:
+        intents = set(intents)
+        items = [x for x in items if x["intent"] in intents]
+    items = [x for x in items if x["confidence"] >= min_confidence]
+    return items[-limit:]
+
+
+def test_fetch_recent_matches_reference():
+    rng = random.Random(3)
+    clock = FakeClock()
+    stm = ShortTermMemory()
+    stm._now = clock
+    written = []
+
+    for step in range(600):
+        clock.now += rng.choice([0.5, 1, 2, 40])
+        entry = {
+            "role": rng.choice(["user", "assistant"]),
+            "content": f"c{step}",
+            "intent": rng.choice(["greet", "open_app", "search", "chat"]),
+            "confidence": rng.random(),
+            "timestamp": clock.now,
+        }
+        stm.store(
+            role=entry["role"], content=entry["content"],
+            intent=entry["intent"], confidence=entry["confidence"],
+        )
+        written.append(entry)
+
+        kwargs = {
+            "limit": rng.choice([None, 0, 1, 3, 10, 11]),
+            "role": rng.choice([None, "user", "assistant", "system"]),
+            "intents": rng.choice(
+                [None, [], ["chat"], ["greet", "search"], ["missing"]]
+            ),
+            "min_confidence": rng.choice([None, 0.0, 0.5]),
+        }
+        assert stm.fetch_recent(**kwargs) == _reference_fetch(
+            written, clock.now, **kwargs
+        )
+
+
+def test_capacity_and_ttl_eviction_keep_indexes_consistent():
+    clock = FakeClock()
+    stm = ShortTermMemory()
+    stm._now = clock
+
+    for i in range(ShortTermMemory.MAX_ITEMS + 5):
+        stm.store(role="user", content=str(i), intent="chat", confidence=1.0)
+
+    assert len(stm._by_role["user"]) == ShortTermMemory.MAX_ITEMS
+    assert stm.fetch_recent(limit=1)[0]["content"] == str(ShortTermMemory.MAX_ITEMS + 4)
+
+    clock.now += ShortTermMemory.TTL_SECONDS + 1
+    assert stm.fetch_recent() == []
+    assert stm._by_role == {} and stm._by_intent == {}
+
+    stm.store(role="assistant", content="x", intent="greet", confidence=0.9)
+    stm.clear()
+    assert stm.fetch_recent() == []
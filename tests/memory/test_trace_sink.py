@@ -0,0 +1,48 @@
+from datetime import datetime
+
+from core.memory.explain import explain_last
+from core.memory.influence.evaluator import MemoryInfluenceEvaluator
+from core.memory.trace import MemoryUsageTrace
+from core.memory.trace_sink import MemoryTraceSink
+from core.memory.usage_mode import MemoryUsageMode
+
+
+def _trace(n):
+    return MemoryUsageTrace(
+        permit_mode=MemoryUsageMode.DISABLED,
+        query_text=str(n),
+        query_category=None,
+        result_ids=(),
+        timestamp=datetime(2024, 1, 1),
+        consumer="test",
+    )
+
+
+def test_sink_keeps_newest_traces_only():
+    sink = MemoryTraceSink(capacity=3)
+    for n in range(5):
+        sink.record(_trace(n))
+
+    assert [t.query_text for t in sink.fetch_all()] == ["2", "3", "4"]
+    assert explain_last(sink).query_text == "4"
+    assert sink.overwritten == 2
+
+    sink.clear()
+    assert sink.fetch_all() == [] and explain_last(sink) is None
+
+
+def test_influence_evaluator_emits_events():
+    sink = MemoryTraceSink()
+    signals = MemoryInfluenceEvaluator().evaluate(
+        usage_mode="DISABLED",
+        permit=None,
+        recalled_memories=[],
+        context={},
+        trace_sink=sink,
+    )
+
+    assert signals == []
+    kinds = [e.kind for e in sink.fetch_events()]
+    assert kinds == ["memory_influence_gate", "memory_influence_evaluated"]
+    assert sink.fetch_events()[1].fields["result"] == "skipped"
+    assert sink.fetch_all() == []  # events don't displace usage traces
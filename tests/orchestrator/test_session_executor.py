@@ -0,0 +1,149 @@
+import threading
+import time
+
+import pytest
+
+from core.control.global_interrupt import GlobalInterruptController
+from core.orchestrator.execution_session import ExecutionSession
+from core.orchestrator.execution_state import SessionState, StepState
+from core.orchestrator.session_executor import SessionExecutor, topological_levels
+
+
+class DummyActionSpec:
+    def __init__(self, action_type):
+        self.action_type = action_type
+
+
+class DummyPlannedAction:
+    def __init__(self, step_id, dependencies=()):
+        self.step_id = step_id
+        self.action_spec = DummyActionSpec(step_id.upper())
+        self.dependencies = list(dependencies)
+
+
+class DummyPlannedActions:
+    def __init__(self, *actions):
+        self.actions = list(actions)
+
+
+def _session(*actions):
+    session = ExecutionSession(session_id="test-session")
+    session.attach_plan(DummyPlannedActions(*actions))
+    return session
+
+
+def test_levels_follow_dependencies():
+    session = _session(
+        DummyPlannedAction("a"),
+        DummyPlannedAction("b"),
+        DummyPlannedAction("c", ["a"]),
+        DummyPlannedAction("d", ["b", "c"]),
+    )
+
+    levels = topological_levels(session.steps)
+
+    assert [[s.step_id for s in level] for level in levels] == [
+        ["a", "b"], ["c"], ["d"],
+    ]
+
+
+def test_levels_reject_cycles_and_unknown_steps():
+    with pytest.raises(ValueError, match="cycle"):
+        topological_levels(_session(
+            DummyPlannedAction("a", ["b"]), DummyPlannedAction("b", ["a"]),
+        ).steps)
+
+    with pytest.raises(ValueError, match="unknown"):
+        topological_levels(_session(DummyPlannedAction("a", ["zz"])).steps)
+
+
+def test_independent_steps_run_in_parallel_after_dependencies():
+    session = _session(
+        DummyPlannedAction("firefox"),
+        DummyPlannedAction("calculator"),
+        DummyPlannedAction("sysinfo"),
+        DummyPlannedAction("report", ["firefox", "sysinfo"]),
+    )
+    finished = {}
+
+    def runner(step):
+        for dep in step.dependencies:
+            assert dep in finished
+        time.sleep(0.2)
+        finished[step.step_id] = time.perf_counter()
+
+    executor = SessionExecutor(
+        session, GlobalInterruptController(), step_runner=runner
+    )
+    start = time.perf_counter()
+    envelope = executor.execute()
+    elapsed = time.perf_counter() - start
+
+    # Two levels of 0.2 s, not four sequential steps
+    assert elapsed < 0.6
+    assert session.state is SessionState.COMPLETED
+    assert all(step.state is StepState.DONE for step in session.steps)
+
+    lines = envelope.explain.lines
+    assert session.get_last_explain_surface() is envelope.explain
+    assert any(line.startswith("report (REPORT) level 1: DONE in") for line in lines)
+    assert all(t.elapsed_ms >= 200 for t in executor.timings)
+
+
+def test_failure_stops_and_skips_remaining_steps():
+    session = _session(
+        DummyPlannedAction("a"),
+        DummyPlannedAction("b", ["a"]),
+    )
+
+    def runner(step):
+        raise RuntimeError("boom")
+
+    envelope = SessionExecutor(
+        session, GlobalInterruptController(), step_runner=runner
+    ).execute()
+
+    a, b = session.steps
+    assert session.state is SessionState.FAILED
+    assert a.state is StepState.FAILED and a.error == "boom"
+    assert b.state is StepState.SKIPPED
+    assert "Stopped: step_failed" in envelope.explain.lines
+
+
+def test_hard_interrupt_cancels_queued_steps():
+    interrupt = GlobalInterruptController()
+    session = _session(*(DummyPlannedAction(f"s{i}") for i in range(4)))
+    release = threading.Event()
+
+    def runner(step):
+        interrupt.trigger()
+        release.wait(1)
+
+    executor = SessionExecutor(
+        session, interrupt, step_runner=runner, max_workers=1
+    )
+    timer = threading.Timer(0.2, release.set)
+    timer.start()
+    try:
+        envelope = executor.execute()
+    finally:
+        timer.cancel()
+
+    states = [step.state for step in session.steps]
+    assert session.state is SessionState.CANCELLED
+    # Only the step that had started ran; the queued ones never did
+    assert states.count(StepState.DONE) == 1
+    assert states.count(StepState.SKIPPED) == 3
+    assert "Stopped: hard_interrupt" in envelope.explain.lines
+
+
+def test_explain_request_replays_last_surface():
+    session = _session(DummyPlannedAction("a"))
+    executor = SessionExecutor(
+        session, GlobalInterruptController(), step_runner=lambda step: None
+    )
+
+    executor.execute()
+    replay = executor.execute({"is_explain_request": True})
+
+    assert replay.explain is session.get_last_explain_surface()
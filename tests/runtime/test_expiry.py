@@ -0,0 +1,168 @@
+import random
+
+import pytest
+
+from core.context.follow_up import FollowUpContext
+from core.dialogue.intent_cache import IntentCache
+from core.dialogue.silence_detector import SilenceDetector
+from core.memory.short_term_memory import ShortTermMemory
+from core.runtime.expiry import ExpiryService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _service(clock, sizes=(8, 4, 4)):
+    return ExpiryService(tick_seconds=1.0, sizes=sizes, clock=clock)
+
+
+def test_timers_fire_on_their_tick_never_early():
+    clock = FakeClock()
+    service = _service(clock)
+    rng = random.Random(91)
+
+    fired = {}
+    expected = {}
+    # Delays span every wheel level plus the overflow (8*4*4 = 128)
+    for n in range(300):
+        delay = rng.randint(1, 400)
+        expected[n] = clock.now + delay
+        service.schedule(delay, lambda n=n: fired.setdefault(n, clock.now))
+
+    while service.pending:
+        clock.now += rng.choice([1, 1, 1, 3, 17])
+        service.tick()
+
+    assert set(fired) == set(expected)
+    for n, when in fired.items():
+        assert when >= expected[n]
+        # Fires on the first tick at or after its deadline
+        assert when - expected[n] < 17
+
+
+def test_cancelled_timer_never_fires():
+    clock = FakeClock()
+    service = _service(clock)
+    calls = []
+
+    keep = service.schedule(5, lambda: calls.append("keep"))
+    drop = service.schedule(5, lambda: calls.append("drop"))
+    assert drop.cancel() is True
+    assert drop.cancel() is False
+    assert not drop.active and keep.active
+
+    clock.now += 10
+    assert service.tick() == 1
+    assert calls == ["keep"]
+    assert service.pending == 0
+
+
+def test_failing_callback_does_not_stop_others():
+    clock = FakeClock()
+    service = _service(clock)
+    calls = []
+
+    def boom():
+        raise RuntimeError("boom")
+
+    service.schedule(1, boom)
+    service.schedule(1, lambda: calls.append("ok"))
+
+    clock.now += 1
+    assert service.tick() == 2
+    assert calls == ["ok"]
+
+
+def test_tick_seconds_must_be_positive():
+    with pytest.raises(ValueError):
+        ExpiryService(tick_seconds=0)
+
+
+def test_stm_entries_evicted_by_timer():
+    clock = FakeClock()
+    service = _service(clock, sizes=(512, 64))
+    stm = ShortTermMemory(expiry=service)
+    stm._now = clock
+
+    stm.store(role="user", content="old", intent="chat", confidence=0.9)
+    clock.now += 200
+    stm.store(role="user", content="new", intent="chat", confidence=0.9)
+
+    clock.now += 101
+    service.tick()
+    assert stm._size == 1
+    assert [e["content"] for e in stm.fetch_recent()] == ["new"]
+
+    clock.now += 200
+    service.tick()
+    assert stm._size == 0
+    assert service.pending == 0
+
+
+def test_stm_capacity_eviction_cancels_timer():
+    clock = FakeClock()
+    service = _service(clock, sizes=(512, 64))
+    stm = ShortTermMemory(expiry=service)
+    stm._now = clock
+
+    for n in range(ShortTermMemory.MAX_ITEMS + 5):
+        stm.store(role="user", content=str(n), intent="chat", confidence=0.9)
+
+    assert service.pending == ShortTermMemory.MAX_ITEMS
+    stm.clear()
+    assert service.pending == 0
+
+
+def test_follow_up_context_expires_by_timer():
+    service = _service(FakeClock())
+    ctx = FollowUpContext(context_timeout=5, expiry=service)
+
+    ctx.add_context("open_app", {"success": True, "app": "notepad"})
+    assert service.pending == 1
+
+    ctx.clear_context()
+    assert service.pending == 0 and ctx.contexts == []
+
+    ctx.add_context("open_app", {"success": True, "app": "notepad"})
+    service.tick(service._clock() + 5)
+    assert ctx.contexts == []
+
+
+def test_intent_cache_and_silence_detector_use_timers():
+    clock = FakeClock()
+    service = _service(clock)
+    silent = []
+
+    cache = IntentCache(ttl_sec=3, expiry=service)
+    detector = SilenceDetector(
+        2, expiry=service, on_silence=lambda: silent.append(clock.now)
+    )
+
+    cache.set("SMALL_TALK")
+    clock.now += 1
+    detector.mark_activity()  # re-arms; only one silence timer pending
+    assert service.pending == 2
+
+    clock.now += 3
+    service.tick()
+    assert cache._intent is None
+    assert silent == [clock.now]
+    assert service.pending == 0
+
+
+def test_action_executor_follow_ups_use_shared_service():
+    from core.actions.action_executor import ActionExecutor
+
+    service = _service(FakeClock())
+    executor = ActionExecutor(expiry=service)
+
+    executor.follow_up_context.add_context("open_app", {"success": True})
+    assert service.pending == 1
+
+    executor.cancel_pending()
+    assert service.pending == 0
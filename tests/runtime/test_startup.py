@@ -0,0 +1,18 @@
+import pytest
+
+from core.runtime.startup import format_startup_report, startup_report, timed_phase
+
+
+def test_phases_are_recorded_including_failures():
+    with timed_phase("test.ok"):
+        pass
+    with pytest.raises(RuntimeError):
+        with timed_phase("test.failed"):
+            raise RuntimeError("boom")
+
+    phases = {p.name: p for p in startup_report()}
+    assert phases["test.ok"].ok and phases["test.ok"].seconds >= 0
+    assert not phases["test.failed"].ok
+
+    report = format_startup_report()
+    assert "test.ok" in report and "(failed)" in report
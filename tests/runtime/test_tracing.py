@@ -0,0 +1,64 @@
+import gzip
+import json
+
+import pytest
+
+from core.memory.trace_sink import MemoryTraceSink
+from core.orchestrator.execution_session import MAX_OBSERVATIONS, ExecutionSession
+from core.runtime.tracing import JsonlTraceExporter, TraceRing, make_event
+
+
+def _read(path):
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh]
+
+
+def test_ring_is_bounded():
+    ring = TraceRing(2)
+    for n in range(4):
+        ring.append(n)
+    assert ring.snapshot() == [2, 3]
+    assert ring.last() == 3 and ring.overwritten == 2
+
+    with pytest.raises(ValueError):
+        TraceRing(0)
+
+
+def test_exporter_writes_gzip_jsonl_batches(tmp_path):
+    path = tmp_path / "traces.jsonl.gz"
+    exporter = JsonlTraceExporter(path, batch_size=4, flush_interval=0.01)
+    sink = MemoryTraceSink(exporter=exporter)
+
+    for n in range(10):
+        sink.emit("turn", n=n)
+    exporter.close()
+
+    records = _read(path)
+    assert [r["n"] for r in records] == list(range(10))
+    assert {r["kind"] for r in records} == {"turn"}
+    assert exporter.exported == 10 and exporter.dropped == 0
+
+
+def test_exporter_counts_drops_when_behind(tmp_path):
+    path = tmp_path / "t.jsonl.gz"
+    exporter = JsonlTraceExporter(path, max_pending=1, flush_interval=60)
+
+    for n in range(200):
+        exporter.offer(make_event("x", n=n))
+    exporter.close()
+    assert exporter.offer(make_event("late")) is False
+
+    assert exporter.dropped > 0
+    assert exporter.exported + exporter.dropped == 201
+    assert len(_read(path)) == exporter.exported
+
+
+def test_session_observations_are_bounded():
+    session = ExecutionSession()
+    for n in range(MAX_OBSERVATIONS + 10):
+        session.attach_observation("note", str(n))
+
+    observed = session.observations()
+    assert len(observed) == MAX_OBSERVATIONS
+    assert observed[-1] == ("note", str(MAX_OBSERVATIONS + 9))
+    assert len(session.summary()["observations"]) == MAX_OBSERVATIONS
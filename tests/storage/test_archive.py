@@ -0,0 +1,165 @@
+import importlib
+from datetime import datetime, timedelta
+
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+pytest.importorskip("dotenv")
+pytest.importorskip("loguru")
+
+
+@pytest.fixture
+def storage(monkeypatch, tmp_path):
+    mysql = importlib.import_module("core.storage.mysql")
+    monkeypatch.setattr(mysql, "_BACKEND", None)
+    monkeypatch.setattr(mysql, "_SessionLocal", None)
+    monkeypatch.setattr(mysql, "_ReadSessionLocal", None)
+    monkeypatch.setattr(mysql, "_SCHEMA_READY", False)
+    monkeypatch.setattr(
+        mysql, "_database_url", lambda: f"sqlite:///{tmp_path / 'db.sqlite3'}"
+    )
+    yield mysql
+    mysql.get_backend().dispose()
+
+
+def _seed(mysql, start, count, step):
+    from core.storage.models import Conversation
+
+    with mysql.get_session() as session:
+        for n in range(count):
+            session.add(Conversation(
+                role="user" if n % 2 == 0 else "assistant",
+                text=f"turn {n}",
+                intent="chat",
+                created_at=start + n * step,
+            ))
+
+
+def _table_texts(mysql):
+    from core.storage.models import Conversation
+
+    with mysql.get_session(readonly=True) as session:
+        return list(session.scalars(
+            sqlalchemy.select(Conversation.text).order_by(Conversation.id)
+        ))
+
+
+def test_compaction_moves_old_rows_into_day_files(storage, tmp_path):
+    from core.storage.archive import compact_conversations, load_index, read_archive
+
+    start = datetime(2025, 3, 1, 12, 0)
+    _seed(storage, start, 40, timedelta(hours=6))  # 10 days
+    cutoff = start + timedelta(days=7)
+
+    archive = tmp_path / "archive"
+    report = compact_conversations(cutoff, archive_dir=archive, batch_size=7)
+
+    assert report.archived == 28 and report.batches == 4
+    assert _table_texts(storage) == [f"turn {n}" for n in range(28, 40)]
+
+    index = load_index(archive)
+    assert sorted(index) == list(report.days)
+    assert index["2025-03-01"]["rows"] == 2  # 12:00 and 18:00
+    assert (archive / index["2025-03-02"]["file"]).exists()
+
+    window = list(read_archive(
+        datetime(2025, 3, 2, 6), datetime(2025, 3, 3), archive_dir=archive,
+    ))
+    assert [r["text"] for r in window] == ["turn 3", "turn 4", "turn 5"]
+    assert window[0]["created_at"] == datetime(2025, 3, 2, 6)
+
+    everything = list(read_archive(start, cutoff, archive_dir=archive))
+    assert [r["text"] for r in everything] == [f"turn {n}" for n in range(28)]
+
+
+def test_rerun_does_not_duplicate_archived_rows(storage, tmp_path, monkeypatch):
+    from core.storage import archive as archive_mod
+
+    start = datetime(2025, 3, 1)
+    _seed(storage, start, 6, timedelta(hours=1))
+    archive = tmp_path / "archive"
+
+    # Crash after the archive write, before the rows are deleted
+    with monkeypatch.context() as m:
+        m.setattr(archive_mod, "delete", None)
+        with pytest.raises(TypeError):
+            archive_mod.compact_conversations(
+                datetime(2025, 3, 2), archive_dir=archive
+            )
+
+    report = archive_mod.compact_conversations(
+        datetime(2025, 3, 2), archive_dir=archive
+    )
+    assert report.archived == 0 and report.already_archived == 6
+    assert _table_texts(storage) == []
+
+    rows = list(archive_mod.read_archive(
+        start, datetime(2025, 3, 2), archive_dir=archive
+    ))
+    assert len(rows) == 6
+
+
+def test_rerun_after_crash_before_index_save(storage, tmp_path, monkeypatch):
+    from core.storage import archive as archive_mod
+
+    start = datetime(2025, 3, 1)
+    _seed(storage, start, 6, timedelta(hours=1))
+    archive = tmp_path / "archive"
+
+    # Crash after the day file is appended, before the index is saved
+    def crash(*args):
+        raise OSError("disk gone")
+
+    with monkeypatch.context() as m:
+        m.setattr(archive_mod, "_save_index", crash)
+        with pytest.raises(OSError):
+            archive_mod.compact_conversations(
+                datetime(2025, 3, 2), archive_dir=archive
+            )
+    assert archive_mod.load_index(archive) == {}
+
+    report = archive_mod.compact_conversations(
+        datetime(2025, 3, 2), archive_dir=archive
+    )
+    assert report.archived == 0 and report.already_archived == 6
+    assert _table_texts(storage) == []
+    assert archive_mod.load_index(archive)["2025-03-01"]["rows"] == 6
+
+    rows = list(archive_mod.read_archive(
+        start, datetime(2025, 3, 2), archive_dir=archive
+    ))
+    assert [r["text"] for r in rows] == [f"turn {n}" for n in range(6)]
+
+
+def test_ids_out_of_created_at_order_survive_two_cutoffs(storage, tmp_path):
+    from core.storage import archive as archive_mod
+    from core.storage.models import Conversation
+
+    day = datetime(2025, 3, 1)
+    with storage.get_session() as session:
+        for hour in (10, 14, 11):  # ids 1, 2, 3
+            session.add(Conversation(
+                role="user", text=f"at {hour}", intent="chat",
+                created_at=day + timedelta(hours=hour),
+            ))
+    archive = tmp_path / "archive"
+
+    first = archive_mod.compact_conversations(
+        day + timedelta(hours=12), archive_dir=archive
+    )
+    assert first.archived == 2
+    assert archive_mod.load_index(archive)["2025-03-01"]["max_id"] == 3
+
+    second = archive_mod.compact_conversations(
+        day + timedelta(days=1), archive_dir=archive
+    )
+    assert second.archived == 1 and second.already_archived == 0
+    assert _table_texts(storage) == []
+
+    entry = archive_mod.load_index(archive)["2025-03-01"]
+    assert (entry["rows"], entry["min_id"], entry["max_id"]) == (3, 1, 3)
+
+    rows = list(archive_mod.read_archive(
+        day, day + timedelta(days=1), archive_dir=archive
+    ))
+    assert sorted(r["text"] for r in rows) == ["at 10", "at 11", "at 14"]
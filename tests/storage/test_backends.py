@@ -0,0 +1,53 @@
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import select, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from core.storage.backends import (  # noqa: E402
+    STORAGE_URL_ENV,
+    create_backend,
+    default_storage_url,
+    sqlite_url,
+)
+from core.storage.models import Base, Conversation  # noqa: E402
+from core.storage.notes_models import Note  # noqa: E402
+
+
+def test_storage_url_env_overrides_mysql(monkeypatch):
+    monkeypatch.delenv(STORAGE_URL_ENV, raising=False)
+    assert default_storage_url().startswith("mysql+pymysql://")
+
+    monkeypatch.setenv(STORAGE_URL_ENV, "sqlite:///x.db")
+    assert default_storage_url() == "sqlite:///x.db"
+
+
+def test_sqlite_backend_is_tuned_and_split(tmp_path):
+    backend = create_backend(sqlite_url(tmp_path / "db" / "rudra.sqlite3"))
+    try:
+        assert backend.name == "sqlite"
+        assert backend.writer is not backend.reader
+        assert backend.writer.pool.size() == 1
+
+        with backend.writer.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            # NORMAL == 1
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+
+        Base.metadata.create_all(bind=backend.writer)
+        with Session(backend.writer) as session, session.begin():
+            session.add(Conversation(role="user", text="hi", intent="chat"))
+            session.add(Note(content="buy milk today"))
+
+        with Session(backend.reader) as session:
+            assert session.scalars(select(Conversation.text)).all() == ["hi"]
+            assert session.scalars(select(Note.content)).all() == ["buy milk today"]
+    finally:
+        backend.dispose()
+
+
+def test_in_memory_sqlite_shares_one_database():
+    backend = create_backend("sqlite://")
+    assert backend.writer is backend.reader
+    backend.dispose()
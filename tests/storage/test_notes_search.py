@@ -0,0 +1,81 @@
+import importlib
+
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+pytest.importorskip("dotenv")
+pytest.importorskip("loguru")
+
+
+@pytest.fixture
+def notes(monkeypatch, tmp_path):
+    mysql = importlib.import_module("core.storage.mysql")
+    monkeypatch.setattr(mysql, "_BACKEND", None)
+    monkeypatch.setattr(mysql, "_SessionLocal", None)
+    monkeypatch.setattr(mysql, "_ReadSessionLocal", None)
+    monkeypatch.setattr(mysql, "_SCHEMA_READY", False)
+    monkeypatch.setattr(
+        mysql, "_database_url", lambda: f"sqlite:///{tmp_path / 'notes.sqlite3'}"
+    )
+
+    module = importlib.import_module("core.skills.notes")
+    monkeypatch.setattr(module, "_read_cursor", None)
+    yield module
+    mysql.get_backend().dispose()
+
+
+def test_keyset_pages_cover_every_note_once(notes):
+    for n in range(12):
+        notes.save_note(f"save note buy milk number {n}")
+
+    seen = []
+    page = notes.list_notes(5)
+    seen.extend(page.notes)
+    while page.next_cursor is not None:
+        page = notes.list_notes(5, after=page.next_cursor)
+        seen.extend(page.notes)
+
+    assert seen == [f"buy milk number {n}" for n in reversed(range(12))]
+
+
+def test_read_more_continues_from_last_page(notes):
+    for n in range(7):
+        notes.save_note(f"save note buy milk number {n}")
+
+    assert "number 6" in notes.read_notes(5)
+    more = notes.read_more_notes(5)
+    assert "number 1" in more and "number 0" in more
+    assert notes.read_more_notes(5) == "There are no more notes."
+
+
+def test_search_is_ranked_and_safe(notes):
+    notes.save_note("save note buy milk today")
+    notes.save_note("save note call mom about dinner")
+    notes.save_note("save note dinner reservation at eight")
+
+    assert notes.find_notes("mom dinner")[0] == "call mom about dinner"
+    assert set(notes.find_notes("dinner")) == {
+        "call mom about dinner", "dinner reservation at eight",
+    }
+    # FTS syntax in user text is treated as plain words
+    assert notes.find_notes('milk" OR NEAR(') == ["buy milk today"]
+    assert notes.search_notes("xyzzy") == "I found no matching notes."
+
+
+def test_sqlite_without_fts5_falls_back_to_substring_search(notes, monkeypatch):
+    notes_models = importlib.import_module("core.storage.notes_models")
+    monkeypatch.setattr(
+        notes_models,
+        "_SQLITE_FTS_DDL",
+        ("CREATE VIRTUAL TABLE notes_fts USING no_such_module(content)",)
+        + notes_models._SQLITE_FTS_DDL[1:],
+    )
+
+    notes.save_note("save note call mom about dinner")
+    notes.save_note("save note buy milk today")
+
+    assert not notes_models.has_fulltext()
+    assert notes.find_notes("dinner") == ["call mom about dinner"]
+    assert notes.find_notes("tea milk") == ["buy milk today"]
+    assert len(notes.find_notes("dinner milk")) == 2
+    assert "buy milk today" in notes.read_notes()
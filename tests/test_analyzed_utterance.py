@@ -0,0 +1,115 @@
+# tests/test_analyzed_utterance.py
+
+import dataclasses
+
+import pytest
+
+from core.nlp.normalizer import normalize_text
+from core.nlp.utterance import AnalyzedUtterance, as_utterance
+from core.input.input_validator import InputValidator
+from core.nlp.argument_extractor import ArgumentExtractor
+from core.context.follow_up import FollowUpContext
+from core.persona.persona_guard import PersonaGuard
+
+
+SAMPLES = [
+    "  Open Chrome, please!  ",
+    "hey can you open it again",
+    "search for Cats and dogs",
+    "um... list files in downloads",
+    "",
+    "   ",
+]
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_clean_tokens_match_normalize_text(text):
+    assert list(AnalyzedUtterance.from_text(text).clean_tokens) == (
+        normalize_text(text)
+    )
+
+
+def test_offsets_point_into_lowered_text():
+    utt = AnalyzedUtterance.from_text("  Open   Chrome now ")
+    assert utt.text == "open   chrome now"
+    assert utt.tokens == ("open", "chrome", "now")
+    assert [utt.text[a:b] for a, b in utt.offsets] == list(utt.tokens)
+    assert utt.token_set == frozenset(utt.tokens)
+
+
+def test_utterance_is_immutable_and_slotted():
+    utt = AnalyzedUtterance.from_text("open chrome")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        utt.text = "x"
+    assert not hasattr(utt, "__dict__")
+
+
+def test_as_utterance_passes_through():
+    utt = AnalyzedUtterance.from_text("open chrome")
+    assert as_utterance(utt) is utt
+
+
+def test_validator_same_result_for_str_and_utterance():
+    for text in ["open chrome", "ab", "explain", "   "]:
+        a = InputValidator().validate(text)
+        b = InputValidator().validate(AnalyzedUtterance.from_text(text))
+        assert a == b
+
+
+def test_extractor_same_result_for_str_and_utterance():
+    extractor = ArgumentExtractor()
+    cases = [
+        ("open firefox now", "open_app"),
+        ("open terminal ls -la", "open_terminal"),
+        ("open notes.txt", "open_file"),
+        ("search for Python docs", "search_web"),
+    ]
+    for text, intent in cases:
+        assert extractor.extract_for_intent(text, intent) == (
+            extractor.extract_for_intent(
+                AnalyzedUtterance.from_text(text), intent
+            )
+        )
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("open it", True),
+        ("go there", True),
+        ("open the file", True),
+        ("the filesystem", False),
+        ("open chrome", False),
+        ("item", False),
+    ],
+)
+def test_follow_up_reference_detection_matches_regexes(text, expected):
+    ctx = FollowUpContext()
+    legacy = any(
+        p.search(text.lower()) for p in ctx.reference_patterns.values()
+    )
+    assert legacy is expected
+    assert ctx._has_reference(AnalyzedUtterance.from_text(text)) is expected
+
+
+def test_persona_guard_normalize_accepts_utterance():
+    text = "Done, Boss!"
+    assert PersonaGuard._normalize(AnalyzedUtterance.from_text(text)) == (
+        PersonaGuard._normalize(text)
+    )
+
+
+def test_cleaned_utterance_extracts_like_clean_text():
+    extractor = ArgumentExtractor()
+    raw = "  Search for Cats AND Dogs "
+    utterance = AnalyzedUtterance.from_text(raw)
+    clean_text = InputValidator().validate(raw)["clean_text"]
+
+    for intent in ("SEARCH_WEB", "OPEN_APP", "UNKNOWN"):
+        assert extractor.extract_for_intent(utterance.cleaned(), intent) == (
+            extractor.extract_for_intent(clean_text, intent)
+        )
+    assert extractor.extract_for_intent(utterance.cleaned(), "SEARCH_WEB") == {
+        "query": "cats and dogs",
+        "target": "web_search",
+    }
@@ -0,0 +1,81 @@
+# tests/test_intent_scorer.py
+
+from core.nlp.intent import Intent
+from core.intelligence.intent_scorer import (
+    CompiledIntentScorer,
+    pick_best_intent,
+    score_intents,
+    score_intents_batch,
+    get_intent_scorer,
+)
+
+
+def test_score_intents_is_dense():
+    scores = score_intents(["open", "terminal"])
+    assert set(scores) == set(Intent)
+    # hard guard (3) for terminal + OPEN_APP keyword evidence
+    assert scores[Intent.OPEN_TERMINAL] == 3
+    assert scores[Intent.OPEN_APP] == 1 + 1 + 1  # open, terminal, verb alias
+
+
+def test_compiled_pick_matches_pick_best_intent():
+    scorer = get_intent_scorer()
+    samples = [
+        [],
+        ["hello"],
+        ["bye"],
+        ["open", "firefox"],
+        ["system", "info"],
+        ["list", "files"],
+        ["search", "query", "find"],
+        ["open", "terminal"],
+        ["what", "is", "this"],
+        ["info", "list"],
+    ]
+    for tokens in samples:
+        assert scorer.pick(tokens) == pick_best_intent(
+            score_intents(tokens), tokens
+        )
+
+
+def test_tie_break_follows_declaration_order():
+    scorer = CompiledIntentScorer(
+        hard_guards={},
+        intent_keywords={
+            Intent.HELP: ["x"],
+            Intent.GREETING: ["x"],
+        },
+        verb_aliases={},
+        intent_priority={},
+    )
+    # GREETING is declared before HELP in Intent
+    assert scorer.pick(["x"])[0] == Intent.GREETING
+
+
+def test_duplicate_keyword_counts_once():
+    scorer = CompiledIntentScorer(
+        hard_guards={},
+        intent_keywords={Intent.HELP: ["help", "help"]},
+        verb_aliases={},
+    )
+    assert scorer.score_sparse(["help"]) == {Intent.HELP: 1}
+
+
+def test_batch_matches_single():
+    batch = [["open", "chrome"], ["hi"], ["nothing"]]
+    assert score_intents_batch(batch) == [score_intents(t) for t in batch]
+    assert get_intent_scorer().pick_batch(batch) == [
+        pick_best_intent(score_intents(t), t) for t in batch
+    ]
+
+
+def test_recompile_picks_up_table_changes():
+    keywords = {Intent.HELP: ["help"]}
+    scorer = CompiledIntentScorer(
+        hard_guards={}, intent_keywords=keywords, verb_aliases={}
+    )
+    assert scorer.score_sparse(["assist"]) == {}
+
+    keywords[Intent.HELP].append("assist")
+    scorer.recompile()
+    assert scorer.score_sparse(["assist"]) == {Intent.HELP: 1}
@@ -0,0 +1,85 @@
+# tests/test_phrase_matcher.py
+
+import random
+
+from core.nlp.phrase_matcher import PhraseMatch, PhraseMatcher
+from core.control.interrupt_words import (
+    contains_interrupt_keyword,
+    find_interrupt_keyword,
+)
+from core.speech.wake_word import contains_wake_word
+from core.terminal.forbidden_tokens import FORBIDDEN_TOKENS
+from core.terminal.forbidden_tokens import contains_forbidden_token
+
+
+def test_finds_overlapping_phrases_with_positions():
+    matcher = PhraseMatcher(["he", "she", "his", "hers"])
+    hits = matcher.find_all("ushers")
+    assert hits == [
+        PhraseMatch(1, 4, "she"),
+        PhraseMatch(2, 4, "he"),
+        PhraseMatch(2, 6, "hers"),
+    ]
+
+
+def test_case_insensitive_by_default():
+    matcher = PhraseMatcher(["You Need Me"])
+    assert matcher.matched_phrases("YOU NEED ME now") == ["you need me"]
+
+
+def test_case_sensitive_mode():
+    matcher = PhraseMatcher(["rm"], case_sensitive=True)
+    assert matcher.contains_any("rm -rf")
+    assert not matcher.contains_any("RM -rf")
+
+
+def test_whole_words():
+    matcher = PhraseMatcher(["stop", "ruk ja"], whole_words=True)
+    assert matcher.contains_any("please stop.")
+    assert not matcher.contains_any("start the stopwatch")
+    assert matcher.first("arre ruk ja").phrase == "ruk ja"
+
+
+def test_empty_vocabulary_and_text():
+    assert PhraseMatcher([]).find_all("anything") == []
+    assert PhraseMatcher(["a", ""]).find_all("") == []
+
+
+def test_matches_naive_substring_search():
+    rng = random.Random(3)
+    alphabet = "ab c"
+    phrases = {
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+        for _ in range(40)
+    }
+    matcher = PhraseMatcher(phrases)
+
+    for _ in range(200):
+        text = "".join(rng.choice(alphabet) for _ in range(30))
+        expected = sorted(
+            (i, i + len(p), p)
+            for p in phrases
+            for i in range(len(text) - len(p) + 1)
+            if text.startswith(p, i)
+        )
+        actual = sorted((m.start, m.end, m.phrase) for m in matcher.find_all(text))
+        assert actual == expected
+
+
+def test_forbidden_tokens_match_substring_semantics():
+    for text in ["ls && whoami", "format disk", "echo hi", "cat a|b", "ls"]:
+        assert contains_forbidden_token(text) == any(
+            t in text for t in FORBIDDEN_TOKENS
+        )
+
+
+def test_interrupt_keywords():
+    assert find_interrupt_keyword("Rudra, band karo") == "band karo"
+    assert contains_interrupt_keyword("cancel that")
+    assert not contains_interrupt_keyword("open the stopwatch")
+
+
+def test_wake_word():
+    assert contains_wake_word("Hey RUDRA open chrome")
+    assert not contains_wake_word("open chrome")
+    assert not contains_wake_word("")
@@ -0,0 +1,28 @@
+import sys
+import time
+from pathlib import Path
+
+# -------------------------------------------------
+# Ensure project root is importable when run as a script
+# -------------------------------------------------
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def best_of(fn, *, repeat: int = 5) -> float:
+    """
+    Best wall time (seconds) of `repeat` runs of fn().
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label: str, seconds: float, n: int) -> None:
+    per_op_us = (seconds / n) * 1e6 if n else 0.0
+    print(f"{label:<40} {seconds * 1e3:10.2f} ms  {per_op_us:10.3f} us/op")
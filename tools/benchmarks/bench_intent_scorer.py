@@ -0,0 +1,98 @@
+"""
+Intent scorer benchmark.
+
+Compares the table-walking scorer (pre-compilation reference) with the
+compiled inverted-index scorer and checks that every pick is identical
+to pick_best_intent.
+
+Usage:
+    python tools/benchmarks/bench_intent_scorer.py [N_UTTERANCES]
+"""
+
+import random
+import sys
+
+try:
+    from tools.benchmarks._common import best_of, report
+except ImportError:  # executed as a plain script
+    from _common import best_of, report
+
+from core.nlp.intent import Intent
+from core.intelligence.intent_scorer import (
+    HARD_GUARDS,
+    INTENT_KEYWORDS,
+    VERB_ALIASES,
+    get_intent_scorer,
+    pick_best_intent,
+)
+
+
+def reference_score_intents(tokens):
+    """
+    Original per-turn scan (kept here only as the baseline).
+    """
+    scores = {i: 0 for i in Intent}
+
+    for t in tokens:
+        if t in HARD_GUARDS:
+            scores[HARD_GUARDS[t]] += 3
+
+    for intent, keywords in INTENT_KEYWORDS.items():
+        for t in tokens:
+            if t in keywords:
+                scores[intent] += 1
+
+    for t in tokens:
+        if t in VERB_ALIASES:
+            scores[VERB_ALIASES[t]] += 1
+
+    return scores
+
+
+def synthetic_log(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    vocab = sorted(
+        set(HARD_GUARDS)
+        | set(VERB_ALIASES)
+        | {k for kws in INTENT_KEYWORDS.values() for k in kws}
+    )
+    noise = ["the", "my", "please", "now", "a", "for", "me", "__REF__"]
+    pool = vocab + noise
+
+    return [
+        [rng.choice(pool) for _ in range(rng.randint(0, 8))]
+        for _ in range(n)
+    ]
+
+
+def main(n: int = 20000) -> int:
+    log = synthetic_log(n)
+    scorer = get_intent_scorer()
+
+    expected = [pick_best_intent(reference_score_intents(t), t) for t in log]
+    actual = scorer.pick_batch(log)
+
+    mismatches = sum(1 for a, b in zip(expected, actual) if a != b)
+    print(f"utterances: {n}  mismatches: {mismatches}")
+
+    report(
+        "reference scan + pick_best_intent",
+        best_of(lambda: [
+            pick_best_intent(reference_score_intents(t), t) for t in log
+        ]),
+        n,
+    )
+    report(
+        "compiled score + pick_best_intent",
+        best_of(lambda: [
+            pick_best_intent(scorer.score(t), t) for t in log
+        ]),
+        n,
+    )
+    report("compiled pick_batch", best_of(lambda: scorer.pick_batch(log)), n)
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000))
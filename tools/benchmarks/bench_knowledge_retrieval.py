@@ -0,0 +1,82 @@
+"""
+BM25 retrieval benchmark over synthetic scripture corpora.
+
+Builds a BM25Index for each corpus size and reports build time and
+mean per-query latency for short 2-4 term queries.
+
+Usage:
+    python tools/benchmarks/bench_knowledge_retrieval.py [SIZE ...]
+    (default sizes: 1000 10000 100000 1000000)
+"""
+
+import random
+import sys
+import time
+
+try:
+    from tools.benchmarks._common import report
+except ImportError:  # executed as a plain script
+    from _common import report
+
+from core.knowledge.retrieval import BM25Index
+from core.knowledge.schema import DharmaRow
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+VOCAB_SIZE = 50_000
+QUERIES = 2_000
+
+
+def _zipf_words(rng: random.Random, vocab, n: int):
+    # Skewed term distribution, like natural text
+    return [vocab[min(int(rng.paretovariate(1.1)) - 1, len(vocab) - 1)]
+            for _ in range(n)]
+
+
+def synthetic_rows(n: int, seed: int = 5):
+    rng = random.Random(seed)
+    vocab = [f"w{i}" for i in range(VOCAB_SIZE)]
+    topics = ["dharma", "karma", "yoga", "moksha", "jnana", "bhakti"]
+
+    for i in range(n):
+        yield DharmaRow(
+            topic=rng.choice(topics),
+            question=" ".join(_zipf_words(rng, vocab, 4)),
+            answer=" ".join(_zipf_words(rng, vocab, 12)),
+            citation=f"Synthetic {i // 100 + 1}.{i % 100 + 1}",
+        )
+
+
+def run(size: int) -> None:
+    index = BM25Index()
+
+    start = time.perf_counter()
+    index.add("synthetic", synthetic_rows(size))
+    index.optimize()
+    build = time.perf_counter() - start
+
+    rng = random.Random(size)
+    vocab = [f"w{i}" for i in range(VOCAB_SIZE)]
+    queries = [
+        " ".join(_zipf_words(rng, vocab, rng.randint(2, 4)))
+        for _ in range(QUERIES)
+    ]
+
+    start = time.perf_counter()
+    for q in queries:
+        index.search(q, k=5)
+    elapsed = time.perf_counter() - start
+
+    print(f"rows={size:>9}  vocab={index.vocabulary_size:>7}  "
+          f"build={build:8.2f} s")
+    report(f"  search top-5 ({QUERIES} queries)", elapsed, QUERIES)
+
+
+def main(argv) -> int:
+    sizes = [int(a) for a in argv] or list(DEFAULT_SIZES)
+    for size in sizes:
+        run(size)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,115 @@
+"""
+LTM recall benchmark: in-memory Python scan vs SQLite push-down.
+
+The scan mirrors MemoryRecallManager's Python filter loop (category,
+confidence, normalized text match, sort, limit). The SQLite side runs
+the same query through SQLiteLongTermMemoryStore.search() on a
+temporary WAL database with the trigram FTS5 index.
+
+Usage:
+    python tools/benchmarks/bench_ltm_recall.py [SIZE ...]
+    (default sizes: 1000 100000 1000000)
+"""
+
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+try:
+    from tools.benchmarks._common import best_of, report
+except ImportError:  # executed as a plain script
+    from _common import best_of, report
+
+from core.memory.ltm.entry import LongTermMemoryEntry, MemoryType
+from core.memory.ltm.sqlite_store import SQLiteLongTermMemoryStore
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+VOCAB_SIZE = 20_000
+BATCH = 10_000
+
+# (label, search kwargs)
+QUERIES = (
+    ("contains rare word + type", {"text": "w19001", "memory_type": MemoryType.FACT}),
+    ("contains common word, top 10", {"text": "w1", "limit": 10}),
+    ("exact match", {"text": "w5 w17 w301 w9", "exact": True}),
+    ("type + confidence, top 10",
+     {"memory_type": MemoryType.HABIT, "min_confidence": 0.8, "limit": 10}),
+)
+
+
+def synthetic_entries(n: int, seed: int = 9):
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 1)
+    types = list(MemoryType)
+
+    for i in range(n):
+        words = [f"w{int(rng.paretovariate(1.2)) % VOCAB_SIZE}" for _ in range(4)]
+        yield LongTermMemoryEntry(
+            id=f"m{i}",
+            type=rng.choice(types),
+            content=" ".join(words),
+            confidence=round(rng.random(), 3),
+            source="user_confirmed",
+            created_at=base + timedelta(seconds=i),
+            last_reinforced_at=None,
+            explain_reason="synthetic",
+        )
+
+
+def scan(entries, memory_type=None, text=None, exact=False,
+         min_confidence=0.0, limit=None):
+    needle = text.strip().lower() if text else ""
+    out = []
+    for e in entries:
+        if memory_type and e.type != memory_type:
+            continue
+        if e.confidence < min_confidence:
+            continue
+        if needle:
+            norm = e.content.strip().lower()
+            if exact and norm != needle:
+                continue
+            if not exact and needle not in norm:
+                continue
+        out.append(e)
+    out.sort(
+        key=lambda e: (e.confidence, e.last_reinforced_at or e.created_at),
+        reverse=True,
+    )
+    return out[:limit] if limit else out
+
+
+def run(size: int, workdir: Path) -> None:
+    entries = list(synthetic_entries(size))
+    store = SQLiteLongTermMemoryStore(workdir / f"ltm_{size}.sqlite3")
+
+    start = time.perf_counter()
+    for i in range(0, size, BATCH):
+        store.save_many(entries[i:i + BATCH])
+    load = time.perf_counter() - start
+
+    print(f"entries={size:>9}  sqlite load={load:8.2f} s  fts={store.has_fts}")
+    repeat = 3 if size <= 100_000 else 1
+
+    for label, kwargs in QUERIES:
+        report(f"  scan   {label}", best_of(lambda: scan(entries, **kwargs),
+                                             repeat=repeat), 1)
+        report(f"  sqlite {label}", best_of(lambda: store.search(**kwargs),
+                                             repeat=repeat), 1)
+
+    store.close()
+
+
+def main(argv) -> int:
+    sizes = [int(a) for a in argv] or list(DEFAULT_SIZES)
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            run(size, Path(tmp))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
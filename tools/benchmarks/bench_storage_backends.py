@@ -0,0 +1,92 @@
+"""
+Storage backend benchmark: the same turn load on each backend.
+
+One turn = the two conversation rows Assistant logs (user, assistant),
+each in its own transaction, plus a recent-messages read every
+READ_EVERY turns. Only backends that accept a connection are run.
+
+Backends:
+- sqlite: tuned embedded mode on a temporary file
+- mysql:  RUDRA_BENCH_MYSQL_URL, else the MYSQL_* settings
+
+Usage:
+    python tools/benchmarks/bench_storage_backends.py [TURNS]
+    (default: 500)
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    from tools.benchmarks._common import report
+except ImportError:  # executed as a plain script
+    from _common import report
+
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from core.storage.backends import create_backend, mysql_url, sqlite_url
+from core.storage.models import Base, Conversation
+
+DEFAULT_TURNS = 500
+READ_EVERY = 10
+
+
+def run_turns(backend, turns: int) -> tuple[float, float]:
+    """
+    Returns (total seconds, worst single write in seconds).
+    """
+    write = sessionmaker(bind=backend.writer)
+    read = sessionmaker(bind=backend.reader)
+    worst = 0.0
+
+    start = time.perf_counter()
+    for turn in range(turns):
+        for role, text in (("user", f"open notes {turn}"), ("assistant", "Done.")):
+            t0 = time.perf_counter()
+            with write() as session, session.begin():
+                session.add(Conversation(role=role, text=text, intent="notes"))
+            worst = max(worst, time.perf_counter() - t0)
+
+        if turn % READ_EVERY == 0:
+            with read() as session:
+                stmt = (
+                    select(Conversation)
+                    .order_by(Conversation.id.desc())
+                    .limit(5)
+                )
+                list(session.scalars(stmt))
+
+    return time.perf_counter() - start, worst
+
+
+def bench(label: str, url: str, turns: int) -> None:
+    try:
+        backend = create_backend(url)
+        Base.metadata.create_all(bind=backend.writer)
+    except Exception as exc:
+        print(f"{label:<40} skipped ({type(exc).__name__})")
+        return
+
+    try:
+        seconds, worst = run_turns(backend, turns)
+        report(f"{label}: {turns} turns", seconds, turns)
+        print(f"{'':<40} worst write {worst * 1e3:.2f} ms")
+    finally:
+        backend.dispose()
+
+
+def main(argv) -> None:
+    turns = int(argv[0]) if argv else DEFAULT_TURNS
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bench("sqlite (WAL, NORMAL)", sqlite_url(Path(tmp) / "bench.sqlite3"), turns)
+
+    bench("mysql", os.getenv("RUDRA_BENCH_MYSQL_URL") or mysql_url(), turns)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,106 @@
+"""
+Turn pipeline micro-benchmark.
+
+Replays the text-processing part of Assistant._cycle (validation,
+static-command checks, intent scoring, confidence refinement and
+argument extraction) with the old per-stage string handling and with
+one shared AnalyzedUtterance. No actions are executed.
+
+Usage:
+    python tools/benchmarks/bench_turn_pipeline.py [N_TURNS]
+"""
+
+import random
+import sys
+
+try:
+    from tools.benchmarks._common import best_of, report
+except ImportError:  # executed as a plain script
+    from _common import best_of, report
+
+from core.input.input_validator import InputValidator
+from core.intelligence.confidence_refiner import refine_confidence
+from core.intelligence.intent_scorer import get_intent_scorer
+from core.nlp.argument_extractor import ArgumentExtractor
+from core.nlp.normalizer import normalize_text
+from core.nlp.utterance import AnalyzedUtterance
+
+STATIC_COMMANDS = {
+    "help", "commands", "what can you do", "capabilities",
+    "who are you", "what are you", "what is dharma",
+}
+
+TEMPLATES = [
+    "Open {app} please",
+    "hey can you launch {app}",
+    "search for {q}",
+    "show system info",
+    "list files in downloads",
+    "open terminal ls -la",
+    "um open notes.txt",
+    "what is dharma",
+]
+APPS = ["chrome", "firefox", "calculator", "youtube", "terminal"]
+QUERIES = ["python docs", "weather today", "gita chapter two"]
+
+
+def synthetic_turns(n: int, seed: int = 11):
+    rng = random.Random(seed)
+    return [
+        rng.choice(TEMPLATES).format(
+            app=rng.choice(APPS), q=rng.choice(QUERIES)
+        )
+        for _ in range(n)
+    ]
+
+
+def legacy_cycle(raw_text, validator, extractor, scorer):
+    validation = validator.validate(raw_text)
+    validator._last_input = None  # disable repeat suppression for replay
+    if not validation["valid"]:
+        return None
+
+    clean_text = validation["clean_text"]
+    lowered = clean_text.lower().strip()
+    if lowered in STATIC_COMMANDS:
+        return lowered
+
+    tokens = normalize_text(clean_text)
+    intent, confidence = scorer.pick(tokens)
+    confidence = refine_confidence(confidence, tokens, intent.value, None)
+    return extractor.extract_for_intent(clean_text, intent.value)
+
+
+def analyzed_cycle(raw_text, validator, extractor, scorer):
+    utterance = AnalyzedUtterance.from_text(raw_text)
+    validation = validator.validate(utterance)
+    validator._last_input = None
+    if not validation["valid"]:
+        return None
+
+    lowered = utterance.text
+    if lowered in STATIC_COMMANDS:
+        return lowered
+
+    tokens = utterance.clean_tokens
+    intent, confidence = scorer.pick(tokens)
+    confidence = refine_confidence(confidence, tokens, intent.value, None)
+    return extractor.extract_for_intent(utterance, intent.value)
+
+
+def main(n: int = 20000) -> int:
+    turns = synthetic_turns(n)
+    validator = InputValidator()
+    extractor = ArgumentExtractor()
+    scorer = get_intent_scorer()
+
+    def run(cycle):
+        return [cycle(t, validator, extractor, scorer) for t in turns]
+
+    report("legacy _cycle text path", best_of(lambda: run(legacy_cycle)), n)
+    report("AnalyzedUtterance _cycle path", best_of(lambda: run(analyzed_cycle)), n)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000))